@@ -0,0 +1,12 @@
+from django.db import models
+
+
+class DataVersion(models.Model):
+    CATALOG = 'catalog'
+
+    key = models.CharField(max_length=50, unique=True)
+    version = models.PositiveBigIntegerField(default=0)
+    token = models.CharField(max_length=32)
+
+    def __str__(self):
+        return f"{self.key} v{self.version}"
@@ -0,0 +1,46 @@
+import uuid
+
+from django.db.models import F
+
+from Core.DataVersion.models import DataVersion
+
+
+class DataVersionRepository:
+    @staticmethod
+    def get_token(key=DataVersion.CATALOG):
+        token = DataVersion.objects.filter(key=key).values_list('token', flat=True).first()
+        if token is None:
+            token = DataVersion.objects.get_or_create(
+                key=key,
+                defaults={'token': uuid.uuid4().hex}
+            )[0].token
+        return token
+
+    @staticmethod
+    async def aget_token(key=DataVersion.CATALOG):
+        token = await DataVersion.objects.filter(key=key).values_list('token', flat=True).afirst()
+        if token is None:
+            token = (await DataVersion.objects.aget_or_create(
+                key=key,
+                defaults={'token': uuid.uuid4().hex}
+            ))[0].token
+        return token
+
+    @staticmethod
+    def bump(key=DataVersion.CATALOG):
+        """
+        Advances the version and replaces its token.
+
+        The token is random rather than derived from the counter, so a
+        rolled back or restored database never reuses a token that may
+        still be cached.
+        """
+        updated = DataVersion.objects.filter(key=key).update(
+            version=F('version') + 1,
+            token=uuid.uuid4().hex
+        )
+        if not updated:
+            DataVersion.objects.get_or_create(
+                key=key,
+                defaults={'version': 1, 'token': uuid.uuid4().hex}
+            )
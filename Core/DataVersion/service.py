@@ -0,0 +1,133 @@
+import functools
+import hashlib
+import logging
+
+from asgiref.sync import iscoroutinefunction
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.http import parse_etags
+from rest_framework import status
+from rest_framework.response import Response
+
+from Core.async_api import AsyncJSONResponse
+from Core.DataVersion.repository import DataVersionRepository
+from Core.Instrumentation import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class DataVersionService:
+    DEFAULT_CACHE_TIMEOUT = 600
+
+    @staticmethod
+    def get_token():
+        return DataVersionRepository.get_token()
+
+    @staticmethod
+    async def aget_token():
+        return await DataVersionRepository.aget_token()
+
+    @staticmethod
+    def bump():
+        DataVersionRepository.bump()
+
+    @staticmethod
+    def build_cache_key(name, token, params):
+        digest = hashlib.sha1(
+            "&".join(f"{key}={value}" for key, value in sorted(params.items())).encode("utf-8")
+        ).hexdigest()
+        return f"analytics:{name}:{token}:{digest}"
+
+    @staticmethod
+    def build_etag(cache_key):
+        return f'"{hashlib.sha1(cache_key.encode("utf-8")).hexdigest()}"'
+
+    @staticmethod
+    def get_cache_timeout():
+        return getattr(settings, "ANALYTICS_CACHE_TIMEOUT", DataVersionService.DEFAULT_CACHE_TIMEOUT)
+
+    @staticmethod
+    def is_cacheable(response):
+        return response.status_code in (status.HTTP_200_OK, status.HTTP_404_NOT_FOUND)
+
+    @staticmethod
+    def etag_matches(request, etag):
+        if_none_match = request.headers.get("If-None-Match")
+        if not if_none_match:
+            return False
+        etags = parse_etags(if_none_match)
+        return "*" in etags or etag in etags
+
+
+def cache_by_data_version(name):
+    """
+    Caches a read-only view's response under the current data version.
+
+    The cached body is reused until any catalog write bumps the version.
+    Responses carry a strong ETag and a matching If-None-Match gets a 304
+    without touching the cache or the analytics queries. Works on DRF
+    views and on the async views, which return AsyncJSONResponse.
+    """
+    def decorator(view_method):
+        if iscoroutinefunction(view_method):
+            @functools.wraps(view_method)
+            async def async_wrapper(self, request, *args, **kwargs):
+                cache_key = DataVersionService.build_cache_key(
+                    name, await DataVersionService.aget_token(), request.GET.dict()
+                )
+                etag = DataVersionService.build_etag(cache_key)
+                if DataVersionService.etag_matches(request, etag):
+                    metrics.CACHE_REQUESTS.inc(cache=name, result="hit")
+                    response = HttpResponse(status=status.HTTP_304_NOT_MODIFIED)
+                    response["ETag"] = etag
+                    return response
+
+                cached = await cache.aget(cache_key)
+                if cached is not None:
+                    metrics.CACHE_REQUESTS.inc(cache=name, result="hit")
+                    response = AsyncJSONResponse(cached["data"], status=cached["status"])
+                else:
+                    metrics.CACHE_REQUESTS.inc(cache=name, result="miss")
+                    response = await view_method(self, request, *args, **kwargs)
+                    if not DataVersionService.is_cacheable(response):
+                        return response
+                    await cache.aset(
+                        cache_key,
+                        {"data": response.data, "status": response.status_code},
+                        DataVersionService.get_cache_timeout()
+                    )
+                response["ETag"] = etag
+                return response
+            return async_wrapper
+
+        @functools.wraps(view_method)
+        def wrapper(self, request, *args, **kwargs):
+            cache_key = DataVersionService.build_cache_key(
+                name, DataVersionService.get_token(), request.query_params.dict()
+            )
+            etag = DataVersionService.build_etag(cache_key)
+            if DataVersionService.etag_matches(request, etag):
+                metrics.CACHE_REQUESTS.inc(cache=name, result="hit")
+                response = Response(status=status.HTTP_304_NOT_MODIFIED)
+                response["ETag"] = etag
+                return response
+
+            cached = cache.get(cache_key)
+            if cached is not None:
+                metrics.CACHE_REQUESTS.inc(cache=name, result="hit")
+                response = Response(cached["data"], status=cached["status"])
+            else:
+                metrics.CACHE_REQUESTS.inc(cache=name, result="miss")
+                response = view_method(self, request, *args, **kwargs)
+                if not DataVersionService.is_cacheable(response):
+                    return response
+                cache.set(
+                    cache_key,
+                    {"data": response.data, "status": response.status_code},
+                    DataVersionService.get_cache_timeout()
+                )
+            response["ETag"] = etag
+            return response
+        return wrapper
+    return decorator
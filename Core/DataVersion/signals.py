@@ -0,0 +1,24 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from Core.DataVersion.repository import DataVersionRepository
+from Core.Movies.models import Movie
+from Core.Producers.models import Producer
+from Core.Studio.models import Studio
+
+
+@receiver(post_save, sender=Movie)
+@receiver(post_save, sender=Producer)
+@receiver(post_save, sender=Studio)
+@receiver(post_delete, sender=Movie)
+@receiver(post_delete, sender=Producer)
+@receiver(post_delete, sender=Studio)
+def bump_version_on_catalog_write(sender, **kwargs):
+    DataVersionRepository.bump()
+
+
+@receiver(m2m_changed, sender=Movie.producer.through)
+@receiver(m2m_changed, sender=Movie.studio.through)
+def bump_version_on_relations_change(sender, action, **kwargs):
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        DataVersionRepository.bump()
@@ -0,0 +1,83 @@
+import pytest
+from django.contrib.auth.models import User
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from Core.DataVersion.repository import DataVersionRepository
+from Core.Movies.service import MovieService
+from Core.Producers.service import ProducerService
+
+ANALYTICS_URLS = [
+    "years-multiple-winners",
+    "studios-with-winners",
+    "producers-with-winner",
+    "year-with-winner",
+]
+
+
+@pytest.fixture
+def api_client():
+    client = APIClient()
+    client.force_authenticate(user=User.objects.create(username="analytics"))
+    return client
+
+
+@pytest.fixture
+def catalog():
+    MovieService.create_movie("A", 1990, ["Alice"], ["S1"], True)
+    MovieService.create_movie("B", 1990, ["Alice"], ["S1"], True)
+    MovieService.create_movie("C", 1995, ["Alice"], ["S2"], True)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("url_name", ANALYTICS_URLS)
+def test_cached_analytics_cost_one_query_and_honour_etags(
+    api_client, catalog, django_assert_num_queries, url_name
+):
+    url = reverse(url_name)
+    first = api_client.get(url)
+    assert first.status_code == 200
+    etag = first["ETag"]
+
+    with django_assert_num_queries(1):
+        cached = api_client.get(url)
+    assert cached.data == first.data
+    assert cached["ETag"] == etag
+
+    with django_assert_num_queries(1):
+        not_modified = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert not_modified.status_code == 304
+    assert not_modified["ETag"] == etag
+
+
+@pytest.mark.django_db
+def test_writes_bump_version_and_invalidate_cache(api_client, catalog):
+    url = reverse("years-multiple-winners")
+    first = api_client.get(url)
+    assert first.data["years"] == [{"year": 1990, "winnerCount": 2}]
+
+    token = DataVersionRepository.get_token()
+    MovieService.create_movie("D", 1995, ["Bob"], ["S2"], True)
+    assert DataVersionRepository.get_token() != token
+
+    second = api_client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+    assert second.status_code == 200
+    assert second["ETag"] != first["ETag"]
+    assert second.data["years"] == [
+        {"year": 1990, "winnerCount": 2},
+        {"year": 1995, "winnerCount": 2},
+    ]
+
+    token = DataVersionRepository.get_token()
+    ProducerService.update_producer(ProducerService.get_all_producers().first().id, "Alicia")
+    assert DataVersionRepository.get_token() != token
+
+
+@pytest.mark.django_db
+def test_filters_are_part_of_the_cache_key(api_client, catalog):
+    url = reverse("year-with-winner")
+    all_winners = api_client.get(url, {"winner": "true"})
+    year_1995 = api_client.get(url, {"winner": "true", "year": "1995"})
+    assert len(all_winners.data["movies"]) == 3
+    assert len(year_1995.data["movies"]) == 1
+    assert all_winners["ETag"] != year_1995["ETag"]
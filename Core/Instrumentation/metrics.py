@@ -0,0 +1,362 @@
+import atexit
+import contextlib
+import json
+import logging
+import math
+import os
+import socket
+import threading
+import time
+import uuid
+
+from django.conf import settings
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 200)
+
+
+class Counter:
+    type_name = "counter"
+
+    def __init__(self, registry, name, documentation, labelnames):
+        self.registry = registry
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def label_values(self, labels):
+        return tuple(str(labels[labelname]) for labelname in self.labelnames)
+
+    def inc(self, amount=1, **labels):
+        self.registry.add(self, self.label_values(labels), amount)
+
+
+class Histogram(Counter):
+    type_name = "histogram"
+
+    def __init__(self, registry, name, documentation, labelnames, buckets):
+        super().__init__(registry, name, documentation, labelnames)
+        self.buckets = tuple(float(bucket) for bucket in buckets)
+
+    def observe(self, value, **labels):
+        self.registry.add(self, self.label_values(labels), value)
+
+
+class MetricsRegistry:
+    """
+    Counters and histograms shared by every process of the deployment.
+
+    Each process keeps its samples in memory and writes them to its own
+    JSON file in METRICS_DIR (at most every METRICS_FLUSH_INTERVAL
+    seconds, and at exit). Rendering sums the files of all processes, so
+    web workers and the import worker are reported together. Rendering
+    also folds the files of finished processes on this host into one
+    aggregate file, so counters never go backwards and the directory
+    holds about one file per live process. Without METRICS_DIR only the
+    current process is reported.
+    """
+    DEFAULT_FLUSH_INTERVAL = 1.0
+    AGGREGATE_FILE = "aggregate.json"
+    LOCK_FILE = ".lock"
+
+    def __init__(self):
+        self.metrics = {}
+        self.reset_process()
+        atexit.register(self.flush)
+
+    def reset_process(self):
+        self.pid = os.getpid()
+        self.hostname = socket.gethostname()
+        self.file_name = f"{self.hostname}-{self.pid}-{uuid.uuid4().hex}.json"
+        self.lock = threading.Lock()
+        self.samples = {}
+        self.dirty = False
+        self.last_flush = 0.0
+        self.flush_timer = None
+
+    def check_process(self):
+        # A forked worker must not keep reporting its parent's samples
+        # under the parent's file.
+        if os.getpid() != self.pid:
+            self.reset_process()
+
+    def counter(self, name, documentation, labelnames=()):
+        return self.register(Counter(self, name, documentation, labelnames))
+
+    def histogram(self, name, documentation, labelnames=(), buckets=LATENCY_BUCKETS):
+        return self.register(Histogram(self, name, documentation, labelnames, buckets))
+
+    def register(self, metric):
+        if metric.name in self.metrics:
+            raise ValueError(f"Metric '{metric.name}' is already registered.")
+        self.metrics[metric.name] = metric
+        return metric
+
+    def add(self, metric, label_values, value):
+        self.check_process()
+        key = (metric.name, label_values)
+        with self.lock:
+            if metric.type_name == "counter":
+                self.samples[key] = self.samples.get(key, 0) + value
+            else:
+                sample = self.samples.setdefault(key, [[0] * len(metric.buckets), 0, 0.0])
+                for index, bound in enumerate(metric.buckets):
+                    if value <= bound:
+                        sample[0][index] += 1
+                sample[1] += 1
+                sample[2] += value
+            self.dirty = True
+        self.schedule_flush()
+
+    @staticmethod
+    def get_directory():
+        return getattr(settings, "METRICS_DIR", None)
+
+    @staticmethod
+    def get_flush_interval():
+        return getattr(settings, "METRICS_FLUSH_INTERVAL", MetricsRegistry.DEFAULT_FLUSH_INTERVAL)
+
+    def schedule_flush(self):
+        if not self.get_directory():
+            return
+        wait = self.last_flush + self.get_flush_interval() - time.monotonic()
+        if wait <= 0:
+            self.flush()
+            return
+        with self.lock:
+            if self.flush_timer is not None:
+                return
+            self.flush_timer = threading.Timer(wait, self.flush)
+            self.flush_timer.daemon = True
+            self.flush_timer.start()
+
+    def snapshot(self):
+        with self.lock:
+            return self.copy_samples()
+
+    def copy_samples(self):
+        return [
+            [name, list(labels), value if not isinstance(value, list) else [list(value[0]), value[1], value[2]]]
+            for (name, labels), value in self.samples.items()
+        ]
+
+    def flush(self):
+        directory = self.get_directory()
+        if not directory or os.getpid() != self.pid:
+            return
+        with self.lock:
+            self.flush_timer = None
+            if not self.dirty:
+                return
+            self.dirty = False
+            self.last_flush = time.monotonic()
+            samples = self.copy_samples()
+        try:
+            os.makedirs(directory, exist_ok=True)
+            path = os.path.join(directory, self.file_name)
+            with open(f"{path}.tmp", "w") as file:
+                json.dump(samples, file)
+            os.replace(f"{path}.tmp", path)
+        except OSError as e:
+            logger.error(f"Error writing metrics to {directory}: {e}")
+
+    def read_process_samples(self):
+        directory = self.get_directory()
+        if not directory:
+            return [self.snapshot()]
+        self.flush()
+        if not os.path.isdir(directory):
+            return [self.snapshot()]
+        with self.directory_lock(directory):
+            self.fold_finished_processes(directory)
+            processes = []
+            for file_name in sorted(os.listdir(directory)):
+                if not file_name.endswith(".json"):
+                    continue
+                data = self.read_file(directory, file_name)
+                if data is not None:
+                    processes.append(data["samples"] if isinstance(data, dict) else data)
+        return processes
+
+    @staticmethod
+    def read_file(directory, file_name):
+        try:
+            with open(os.path.join(directory, file_name)) as file:
+                return json.load(file)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Skipping unreadable metrics file {file_name}: {e}")
+            return None
+
+    @contextlib.contextmanager
+    def directory_lock(self, directory):
+        """Serializes folding and reading between the processes sharing `directory`."""
+        if fcntl is None:
+            yield
+            return
+        with open(os.path.join(directory, self.LOCK_FILE), "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def is_finished(self, file_name):
+        """True for the file of a process of this host that is no longer running."""
+        if not file_name.endswith(".json") or file_name == self.AGGREGATE_FILE:
+            return False
+        parts = file_name[:-len(".json")].rsplit("-", 2)
+        if len(parts) != 3 or parts[0] != self.hostname:
+            return False
+        try:
+            pid = int(parts[1])
+        except ValueError:
+            return False
+        if pid == os.getpid():
+            return False
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return True
+        except PermissionError:
+            return False
+        return False
+
+    def fold_finished_processes(self, directory):
+        """
+        Adds the samples of finished processes to the aggregate file and
+        removes their files. Must run under directory_lock. The aggregate
+        lists the files it already holds, so a file whose removal failed
+        is removed next time instead of being counted twice.
+        """
+        # Liveness is checked with signals, which only POSIX systems (the
+        # ones with fcntl) send safely.
+        if fcntl is None:
+            return
+        finished = [file_name for file_name in sorted(os.listdir(directory)) if self.is_finished(file_name)]
+        if not finished:
+            return
+        aggregate = {"samples": [], "folded": []}
+        if os.path.exists(os.path.join(directory, self.AGGREGATE_FILE)):
+            aggregate = self.read_file(directory, self.AGGREGATE_FILE)
+            if aggregate is None:
+                # Rewriting it would lose the totals it holds.
+                return
+        already_folded = set(aggregate["folded"])
+        processes = [aggregate["samples"]]
+        folded = []
+        for file_name in finished:
+            samples = [] if file_name in already_folded else self.read_file(directory, file_name)
+            if samples is None:
+                continue
+            processes.append(samples)
+            folded.append(file_name)
+        totals = self.sum_samples(processes)
+        try:
+            path = os.path.join(directory, self.AGGREGATE_FILE)
+            with open(f"{path}.tmp", "w") as file:
+                json.dump({
+                    "samples": [
+                        [name, list(labels), value] for (name, labels), value in sorted(totals.items())
+                    ],
+                    "folded": folded,
+                }, file)
+            os.replace(f"{path}.tmp", path)
+            for file_name in folded:
+                os.remove(os.path.join(directory, file_name))
+        except OSError as e:
+            logger.error(f"Error folding finished processes' metrics in {directory}: {e}")
+
+    def sum_samples(self, processes):
+        """Sums lists of samples by metric name and labels."""
+        totals = {}
+        for samples in processes:
+            for name, labels, value in samples:
+                metric = self.metrics.get(name)
+                if metric is None:
+                    continue
+                key = (name, tuple(labels))
+                if metric.type_name == "counter":
+                    totals[key] = totals.get(key, 0) + value
+                    continue
+                total = totals.setdefault(key, [[0] * len(metric.buckets), 0, 0.0])
+                total[0] = [current + added for current, added in zip(total[0], value[0])]
+                total[1] += value[1]
+                total[2] += value[2]
+        return totals
+
+    def collect(self):
+        """Sums the samples of every process by metric name and labels."""
+        self.check_process()
+        return self.sum_samples(self.read_process_samples())
+
+    def render(self):
+        """Renders every registered metric in the Prometheus text format."""
+        totals = self.collect()
+        lines = []
+        for metric in self.metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.type_name}")
+            samples = sorted(
+                (labels, value) for (name, labels), value in totals.items() if name == metric.name
+            )
+            for labels, value in samples:
+                label_pairs = list(zip(metric.labelnames, labels))
+                if metric.type_name == "counter":
+                    lines.append(f"{metric.name}{format_labels(label_pairs)} {format_value(value)}")
+                    continue
+                buckets, count, total = value
+                for bound, bucket_count in zip(metric.buckets, buckets):
+                    bucket_labels = label_pairs + [("le", format_value(bound))]
+                    lines.append(f"{metric.name}_bucket{format_labels(bucket_labels)} {bucket_count}")
+                lines.append(f"{metric.name}_bucket{format_labels(label_pairs + [('le', '+Inf')])} {count}")
+                lines.append(f"{metric.name}_sum{format_labels(label_pairs)} {format_value(total)}")
+                lines.append(f"{metric.name}_count{format_labels(label_pairs)} {count}")
+        return "\n".join(lines) + "\n"
+
+
+def format_labels(pairs):
+    if not pairs:
+        return ""
+    escaped = (
+        (name, value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"'))
+        for name, value in pairs
+    )
+    return "{" + ",".join(f'{name}="{value}"' for name, value in escaped) + "}"
+
+
+def format_value(value):
+    if isinstance(value, float) and math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+registry = MetricsRegistry()
+
+REQUESTS = registry.counter(
+    "http_requests_total", "HTTP requests by URL name, method and status code.",
+    ["view", "method", "status"]
+)
+REQUEST_LATENCY = registry.histogram(
+    "http_request_duration_seconds", "HTTP request latency by URL name, method and status code.",
+    ["view", "method", "status"]
+)
+REQUEST_QUERIES = registry.histogram(
+    "http_request_db_queries", "SQL statements executed per HTTP request by URL name.",
+    ["view"], buckets=QUERY_COUNT_BUCKETS
+)
+IMPORT_ROWS = registry.counter(
+    "import_rows_total", "Rows imported from uploaded CSV files.", ["importer"]
+)
+IMPORT_ERRORS = registry.counter(
+    "import_errors_total", "Rows rejected while importing uploaded CSV files.", ["importer"]
+)
+CACHE_REQUESTS = registry.counter(
+    "cache_requests_total", "Analytics and authentication cache lookups by cache name and result.", ["cache", "result"]
+)
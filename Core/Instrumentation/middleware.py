@@ -0,0 +1,207 @@
+import contextvars
+import functools
+import logging
+import time
+from contextlib import contextmanager
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+from Core.Instrumentation import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class QueryRecorder:
+    """Execute wrapper that counts SQL statements and their total time."""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - started
+            self.count += 1
+
+
+# Recorders of the request running in the current context. Under ASGI the
+# queries run in sync_to_async threads, on connections the middleware never
+# sees; the context follows the request there, so every connection forwards
+# its queries to the recorders found in it.
+ACTIVE_RECORDERS = contextvars.ContextVar("active_query_recorders", default=())
+
+
+def forward_to_active_recorders(execute, sql, params, many, context):
+    for recorder in ACTIVE_RECORDERS.get():
+        execute = functools.partial(recorder, execute)
+    return execute(sql, params, many, context)
+
+
+def install_query_forwarding(connection):
+    # First in the list, so execute_wrapper() blocks still pop their own wrapper.
+    if forward_to_active_recorders not in connection.execute_wrappers:
+        connection.execute_wrappers.insert(0, forward_to_active_recorders)
+
+
+@receiver(connection_created)
+def install_query_forwarding_on_connect(sender, connection, **kwargs):
+    install_query_forwarding(connection)
+
+
+@contextmanager
+def record_queries(recorder):
+    for connection in connections.all():
+        install_query_forwarding(connection)
+    token = ACTIVE_RECORDERS.set(ACTIVE_RECORDERS.get() + (recorder,))
+    try:
+        yield recorder
+    finally:
+        ACTIVE_RECORDERS.reset(token)
+
+
+class RequestTiming:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.queries = QueryRecorder()
+        self.view_started = None
+        self.view_finished = None
+        self.render_started = None
+        self.render_finished = None
+
+    @staticmethod
+    def elapsed_ms(start, end):
+        if start is None or end is None:
+            return 0.0
+        return (end - start) * 1000
+
+    def server_timing(self, finished):
+        db = self.queries.duration * 1000
+        view = self.elapsed_ms(self.view_started, self.view_finished)
+        render = self.elapsed_ms(self.render_started, self.render_finished)
+        total = self.elapsed_ms(self.started, finished)
+        return ", ".join([
+            f'db;dur={db:.2f};desc="{self.queries.count} queries"',
+            f"view;dur={max(view - db, 0.0):.2f}",
+            f"serialize;dur={render:.2f}",
+            f"total;dur={total:.2f}",
+        ])
+
+
+class RequestTimingMiddleware:
+    """
+    Records the SQL statements, the view body time and the response
+    rendering time of every request and reports them in the
+    Server-Timing header (and X-Query-Count when enabled). Only headers
+    are added; response bodies are left untouched.
+
+    Enabled with REQUEST_TIMING_ENABLED; the view time excludes the time
+    spent in SQL, which is reported separately as `db`.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not getattr(settings, "REQUEST_TIMING_ENABLED", False):
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+        self.query_count_header = getattr(settings, "REQUEST_TIMING_QUERY_COUNT_HEADER", True)
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        timing = RequestTiming()
+        request._request_timing = timing
+        with record_queries(timing.queries):
+            response = self.get_response(request)
+        return self.add_headers(request, timing, response)
+
+    async def __acall__(self, request):
+        timing = RequestTiming()
+        request._request_timing = timing
+        with record_queries(timing.queries):
+            response = await self.get_response(request)
+        return self.add_headers(request, timing, response)
+
+    def add_headers(self, request, timing, response):
+        finished = time.perf_counter()
+        if timing.view_finished is None:
+            timing.view_finished = finished
+
+        response["Server-Timing"] = timing.server_timing(finished)
+        if self.query_count_header:
+            response["X-Query-Count"] = str(timing.queries.count)
+        logger.info(
+            f"{request.method} {request.get_full_path()} {response.status_code} "
+            f"queries={timing.queries.count} db={timing.queries.duration * 1000:.2f}ms "
+            f"total={timing.elapsed_ms(timing.started, finished):.2f}ms"
+        )
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        request._request_timing.view_started = time.perf_counter()
+
+    def process_template_response(self, request, response):
+        timing = request._request_timing
+        timing.view_finished = time.perf_counter()
+        render = response.render
+
+        def timed_render():
+            timing.render_started = time.perf_counter()
+            try:
+                return render()
+            finally:
+                timing.render_finished = time.perf_counter()
+
+        response.render = timed_render
+        return response
+
+
+class MetricsMiddleware:
+    """
+    Feeds the request counters, latency and query-count histograms
+    served by /metrics, labelled by URL name. Enabled with METRICS_ENABLED.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not getattr(settings, "METRICS_ENABLED", False):
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        started = time.perf_counter()
+        with record_queries(QueryRecorder()) as queries:
+            response = self.get_response(request)
+        return self.observe(request, response, queries, time.perf_counter() - started)
+
+    async def __acall__(self, request):
+        started = time.perf_counter()
+        with record_queries(QueryRecorder()) as queries:
+            response = await self.get_response(request)
+        return self.observe(request, response, queries, time.perf_counter() - started)
+
+    def observe(self, request, response, queries, duration):
+        match = getattr(request, "resolver_match", None)
+        view = match.url_name if match and match.url_name else "unmatched"
+        labels = {"view": view, "method": request.method, "status": response.status_code}
+        metrics.REQUESTS.inc(**labels)
+        metrics.REQUEST_LATENCY.observe(duration, **labels)
+        metrics.REQUEST_QUERIES.observe(queries.count, view=view)
+        return response
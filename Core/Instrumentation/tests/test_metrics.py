@@ -0,0 +1,153 @@
+import json
+import os
+import re
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from Core.Instrumentation.metrics import MetricsRegistry
+from Core.Movies.service import ImportMovieCSVService, MovieService
+from Core.Winners.service import WinnerCSVService
+
+
+def sample_value(text, name, **labels):
+    for line in text.splitlines():
+        match = re.fullmatch(r"(\w+)(?:\{(.*)\})? (\S+)", line)
+        if not match or match.group(1) != name:
+            continue
+        found = dict(re.findall(r'(\w+)="((?:[^"\\]|\\.)*)"', match.group(2) or ""))
+        if found == {key: str(value) for key, value in labels.items()}:
+            return float(match.group(3))
+    return 0.0
+
+
+def build_registry():
+    registry = MetricsRegistry()
+    registry.counter("jobs_total", "Jobs.", ["kind"])
+    registry.histogram("job_seconds", "Job time.", ["kind"], buckets=(1, 5))
+    return registry
+
+
+@pytest.fixture
+def metrics_dir(settings, tmp_path):
+    settings.METRICS_DIR = str(tmp_path)
+    settings.METRICS_FLUSH_INTERVAL = 0
+    return tmp_path
+
+
+def test_render_uses_prometheus_text_format(settings):
+    settings.METRICS_DIR = None
+    registry = build_registry()
+    registry.metrics["jobs_total"].inc(kind='a"b')
+    registry.metrics["job_seconds"].observe(0.5, kind="a")
+    registry.metrics["job_seconds"].observe(3, kind="a")
+
+    assert registry.render() == "\n".join([
+        "# HELP jobs_total Jobs.",
+        "# TYPE jobs_total counter",
+        'jobs_total{kind="a\\"b"} 1.0',
+        "# HELP job_seconds Job time.",
+        "# TYPE job_seconds histogram",
+        'job_seconds_bucket{kind="a",le="1.0"} 1',
+        'job_seconds_bucket{kind="a",le="5.0"} 2',
+        'job_seconds_bucket{kind="a",le="+Inf"} 2',
+        'job_seconds_sum{kind="a"} 3.5',
+        'job_seconds_count{kind="a"} 2',
+    ]) + "\n"
+
+
+def test_samples_from_several_processes_are_summed(metrics_dir):
+    web, worker = build_registry(), build_registry()
+    web.metrics["jobs_total"].inc(2, kind="a")
+    worker.metrics["jobs_total"].inc(3, kind="a")
+    worker.metrics["job_seconds"].observe(2, kind="a")
+    web.metrics["job_seconds"].observe(7, kind="a")
+
+    assert len(os.listdir(metrics_dir)) == 2
+    text = web.render()
+    assert sample_value(text, "jobs_total", kind="a") == 5
+    assert sample_value(text, "job_seconds_bucket", kind="a", le="5.0") == 1
+    assert sample_value(text, "job_seconds_count", kind="a") == 2
+    assert sample_value(text, "job_seconds_sum", kind="a") == 9
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork")
+def test_forked_worker_does_not_repeat_parent_samples(metrics_dir):
+    registry = build_registry()
+    registry.metrics["jobs_total"].inc(kind="a")
+
+    pid = os.fork()
+    if pid == 0:
+        try:
+            registry.metrics["jobs_total"].inc(2, kind="a")
+        finally:
+            os._exit(0)
+    os.waitpid(pid, 0)
+
+    assert sample_value(registry.render(), "jobs_total", kind="a") == 3
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork")
+def test_finished_processes_are_folded_into_one_file(metrics_dir):
+    registry = build_registry()
+    registry.metrics["jobs_total"].inc(kind="a")
+    for _ in range(3):
+        pid = os.fork()
+        if pid == 0:
+            try:
+                registry.metrics["jobs_total"].inc(2, kind="a")
+                registry.metrics["job_seconds"].observe(2, kind="a")
+            finally:
+                os._exit(0)
+        os.waitpid(pid, 0)
+    (metrics_dir / "other-host-1-abc.json").write_text(json.dumps([["jobs_total", ["a"], 5]]))
+
+    text = registry.render()
+    assert sample_value(text, "jobs_total", kind="a") == 12
+    assert sample_value(text, "job_seconds_count", kind="a") == 3
+    json_files = sorted(name for name in os.listdir(metrics_dir) if name.endswith(".json"))
+    assert json_files == sorted(["aggregate.json", "other-host-1-abc.json", registry.file_name])
+
+    # A folded file left behind by a failed removal is not counted twice.
+    folded = json.loads((metrics_dir / "aggregate.json").read_text())["folded"]
+    assert len(folded) == 3
+    (metrics_dir / folded[0]).write_text(json.dumps([["jobs_total", ["a"], 100]]))
+    assert sample_value(registry.render(), "jobs_total", kind="a") == 12
+    assert not (metrics_dir / folded[0]).exists()
+
+
+@pytest.mark.django_db
+def test_metrics_endpoint_reports_requests_imports_and_cache(metrics_dir):
+    client = APIClient()
+    client.force_authenticate(user=User.objects.create(username="metrics"))
+    before = APIClient().get(reverse("metrics")).content.decode()
+
+    MovieService.create_movie("A", 1990, ["Alice"], ["S1"], True)
+    client.get(reverse("movie-list"))
+    client.get(reverse("years-multiple-winners"))
+    client.get(reverse("years-multiple-winners"))
+    ImportMovieCSVService.process_file(SimpleUploadedFile(
+        "movies.csv", b"year;title;studios;producers;winner\n1991;B;S1;Bob;yes\nx;C;S1;Bob;\n"
+    ))
+    WinnerCSVService(SimpleUploadedFile("winners.csv", b"")).process_and_prepare_data("year;title\nbroken")
+
+    response = APIClient().get(reverse("metrics"))
+    assert response.status_code == 200
+    assert response["Content-Type"].startswith("text/plain; version=0.0.4")
+    after = response.content.decode()
+
+    def delta(name, **labels):
+        return sample_value(after, name, **labels) - sample_value(before, name, **labels)
+
+    assert delta("http_requests_total", view="movie-list", method="GET", status=200) == 1
+    assert delta("http_request_duration_seconds_count", view="movie-list", method="GET", status=200) == 1
+    assert delta("http_request_db_queries_count", view="movie-list") == 1
+    assert delta("http_request_db_queries_sum", view="movie-list") > 0
+    assert delta("cache_requests_total", cache="years-multiple-winners", result="miss") == 1
+    assert delta("cache_requests_total", cache="years-multiple-winners", result="hit") == 1
+    assert delta("import_rows_total", importer="movies") == 1
+    assert delta("import_errors_total", importer="movies") == 1
+    assert delta("import_errors_total", importer="winners") == 1
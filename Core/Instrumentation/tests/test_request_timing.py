@@ -0,0 +1,87 @@
+import asyncio
+
+import pytest
+from django.contrib.auth.models import User
+from django.test.utils import CaptureQueriesContext
+from django.db import connection
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from Core.Instrumentation.tests.test_metrics import sample_value
+from Core.Movies.service import MovieService
+from Core.Movies.tests.test_async_read_path import asgi_request
+
+
+def build_client(settings, enabled):
+    settings.REQUEST_TIMING_ENABLED = enabled
+    client = APIClient()
+    client.force_authenticate(user=User.objects.create(username=f"timing-{enabled}"))
+    return client
+
+
+def parse_server_timing(header):
+    metrics = {}
+    for entry in header.split(","):
+        name, *params = entry.strip().split(";")
+        metrics[name] = dict(param.split("=", 1) for param in params)
+    return metrics
+
+
+@pytest.fixture
+def catalog():
+    MovieService.create_movie("A", 1990, ["Alice"], ["S1"], True)
+    MovieService.create_movie("B", 1991, ["Bob"], ["S2"], False)
+
+
+@pytest.mark.django_db
+def test_headers_report_queries_and_timings(settings, catalog):
+    client = build_client(settings, True)
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(reverse("movie-list"), {"size": 10})
+
+    assert response.status_code == 200
+    assert int(response["X-Query-Count"]) == len(queries) > 0
+    metrics = parse_server_timing(response["Server-Timing"])
+    assert set(metrics) == {"db", "view", "serialize", "total"}
+    assert metrics["db"]["desc"] == f'"{len(queries)} queries"'
+    assert all(float(metric["dur"]) >= 0 for metric in metrics.values())
+    assert float(metrics["total"]["dur"]) >= float(metrics["db"]["dur"])
+
+
+@pytest.mark.django_db
+def test_query_count_header_can_be_turned_off(settings, catalog):
+    settings.REQUEST_TIMING_QUERY_COUNT_HEADER = False
+    response = build_client(settings, True).get(reverse("movie-list"))
+    assert "Server-Timing" in response
+    assert "X-Query-Count" not in response
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("url_name", ["movie-list", "years-multiple-winners", "producer-list"])
+def test_bodies_are_identical_with_and_without_timing(settings, catalog, url_name):
+    disabled = build_client(settings, False).get(reverse(url_name))
+    enabled = build_client(settings, True).get(reverse(url_name))
+
+    assert "Server-Timing" not in disabled
+    assert "X-Query-Count" not in disabled
+    assert enabled.status_code == disabled.status_code
+    assert enabled.content == disabled.content
+
+
+@pytest.mark.django_db(transaction=True)
+def test_asgi_requests_count_the_queries_of_their_worker_threads(catalog):
+    token = RefreshToken.for_user(User.objects.create(username="timing-asgi")).access_token
+    auth = [(b"authorization", f"Bearer {token}".encode())]
+    before = APIClient().get(reverse("metrics")).content.decode()
+
+    # Like an ASGI server: the ORM runs in sync_to_async threads, whose
+    # connections are not the ones of the event loop thread.
+    status, headers, _ = asyncio.run(asgi_request(reverse("movie-list"), "size=10", headers=auth))
+
+    assert status == 200
+    assert int(headers[b"x-query-count"]) > 0
+    after = APIClient().get(reverse("metrics")).content.decode()
+    assert sample_value(after, "http_request_db_queries_sum", view="movie-list") > sample_value(
+        before, "http_request_db_queries_sum", view="movie-list"
+    )
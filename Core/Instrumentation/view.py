@@ -0,0 +1,14 @@
+from django.http import HttpResponse
+from rest_framework.permissions import AllowAny
+from rest_framework.views import APIView
+
+from Core.Instrumentation.metrics import registry
+
+
+class MetricsView(APIView):
+    authentication_classes = []
+    permission_classes = [AllowAny]
+    swagger_schema = None
+
+    def get(self, request):
+        return HttpResponse(registry.render(), content_type="text/plain; version=0.0.4; charset=utf-8")
@@ -0,0 +1,92 @@
+from django.db.models import F, Q
+from django.utils import timezone
+
+from Core.Jobs.models import ImportJob
+
+
+class ImportJobRepository:
+    @staticmethod
+    def create_job(kind, file_name, file_path):
+        return ImportJob.objects.create(
+            kind=kind,
+            file_name=file_name,
+            file_path=file_path
+        )
+
+    @staticmethod
+    def get_job_by_id(job_id):
+        try:
+            return ImportJob.objects.get(id=job_id)
+        except ImportJob.DoesNotExist:
+            return None
+
+    @staticmethod
+    def claim_next_job():
+        """
+        Marks the oldest pending job as running and returns it.
+
+        The conditional UPDATE makes the claim atomic, so concurrent
+        workers never pick up the same job.
+        """
+        while True:
+            job_id = (
+                ImportJob.objects.filter(status=ImportJob.STATUS_PENDING)
+                .order_by('id')
+                .values_list('id', flat=True)
+                .first()
+            )
+            if job_id is None:
+                return None
+            now = timezone.now()
+            claimed = ImportJob.objects.filter(
+                id=job_id,
+                status=ImportJob.STATUS_PENDING
+            ).update(status=ImportJob.STATUS_RUNNING, started_at=now, heartbeat_at=now)
+            if claimed:
+                return ImportJob.objects.get(id=job_id)
+
+    @staticmethod
+    def fail_stale_jobs(heartbeat_before, message):
+        """
+        Marks running jobs whose last heartbeat is older than
+        `heartbeat_before` as failed and returns them. The status
+        condition leaves alone any job that finishes in the meantime.
+        """
+        failed = []
+        stale = ImportJob.objects.filter(status=ImportJob.STATUS_RUNNING).filter(
+            Q(heartbeat_at__lt=heartbeat_before) | Q(heartbeat_at__isnull=True, started_at__lt=heartbeat_before)
+        )
+        for job in list(stale):
+            if ImportJob.objects.filter(id=job.id, status=ImportJob.STATUS_RUNNING).update(
+                status=ImportJob.STATUS_FAILED,
+                message=message,
+                finished_at=timezone.now()
+            ):
+                failed.append(job)
+        return failed
+
+    @staticmethod
+    def record_progress(job_id, accepted_count, errors, max_stored_errors):
+        job = ImportJob.objects.only('errors').get(id=job_id)
+        stored_errors = job.errors
+        if len(stored_errors) < max_stored_errors:
+            stored_errors = stored_errors + list(errors[:max_stored_errors - len(stored_errors)])
+        ImportJob.objects.filter(id=job_id, status=ImportJob.STATUS_RUNNING).update(
+            rows_processed=F('rows_processed') + accepted_count + len(errors),
+            accepted_count=F('accepted_count') + accepted_count,
+            error_count=F('error_count') + len(errors),
+            errors=stored_errors,
+            heartbeat_at=timezone.now()
+        )
+
+    @staticmethod
+    def finish_job(job_id, status, message=''):
+        """
+        Records the outcome of a running job and returns whether it did;
+        a job already failed as stale keeps that status.
+        """
+        return ImportJob.objects.filter(id=job_id, status=ImportJob.STATUS_RUNNING).update(
+            status=status,
+            message=message,
+            finished_at=timezone.now()
+        )
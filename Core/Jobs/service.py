@@ -0,0 +1,183 @@
+import logging
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import close_old_connections
+from django.utils import timezone
+from rest_framework import serializers
+
+from Core.Jobs.models import ImportJob
+from Core.Jobs.repository import ImportJobRepository
+from Core.Movies.service import ImportMovieCSVService
+from Core.Winners.service import WinnerCSVService
+
+logger = logging.getLogger(__name__)
+
+
+class ImportJobService:
+    DEFAULT_MAX_STORED_ERRORS = 1000
+    DEFAULT_JOB_TIMEOUT = 3600
+    _executor = None
+    _executor_lock = threading.Lock()
+
+    @staticmethod
+    def get_jobs_dir():
+        return getattr(settings, "IMPORT_JOBS_DIR", os.path.join(settings.BASE_DIR, "import_jobs"))
+
+    @staticmethod
+    def enqueue(kind, file):
+        """
+        Stores the uploaded file on disk and registers a pending job for it.
+        """
+        jobs_dir = ImportJobService.get_jobs_dir()
+        os.makedirs(jobs_dir, exist_ok=True)
+        file_path = os.path.join(jobs_dir, f"{uuid.uuid4().hex}-{os.path.basename(file.name)}")
+        with open(file_path, "wb") as destination:
+            for chunk in file.chunks():
+                destination.write(chunk)
+        job = ImportJobRepository.create_job(kind, file.name, file_path)
+        logger.info(f"Queued {kind} import job {job.id} for '{file.name}'.")
+        if getattr(settings, "IMPORT_JOBS_RUN_IN_PROCESS", False):
+            ImportJobService.get_executor().submit(ImportJobService.run_pending_jobs)
+        return job
+
+    @staticmethod
+    def get_executor():
+        with ImportJobService._executor_lock:
+            if ImportJobService._executor is None:
+                ImportJobService._executor = ThreadPoolExecutor(
+                    max_workers=getattr(settings, "IMPORT_JOBS_WORKERS", 1),
+                    thread_name_prefix="import-job"
+                )
+            return ImportJobService._executor
+
+    @staticmethod
+    def get_job(job_id):
+        try:
+            job = ImportJobRepository.get_job_by_id(job_id)
+            if not job:
+                logger.warning(f"Import job with ID {job_id} not found.")
+            return job
+        except Exception as e:
+            logger.error(f"Error fetching import job {job_id}: {e}")
+            raise
+
+    @staticmethod
+    def fail_stale_jobs():
+        """
+        Fails running jobs that recorded no progress for IMPORT_JOB_TIMEOUT
+        seconds, which is what a worker killed mid-job leaves behind; movie
+        jobs beat after every batch, so long imports are not affected. They
+        are not queued again: the rows imported before the crash are
+        already saved.
+        """
+        timeout = getattr(settings, "IMPORT_JOB_TIMEOUT", ImportJobService.DEFAULT_JOB_TIMEOUT)
+        jobs = ImportJobRepository.fail_stale_jobs(
+            timezone.now() - timedelta(seconds=timeout),
+            f"The worker stopped before the job finished (no progress for over {timeout} seconds)."
+        )
+        for job in jobs:
+            logger.warning(f"Import job {job.id} made no progress for {timeout} seconds; marked as failed.")
+            if os.path.exists(job.file_path):
+                os.remove(job.file_path)
+        return len(jobs)
+
+    @staticmethod
+    def run_pending_jobs():
+        """
+        Fails stale jobs, then runs pending jobs until the queue is empty.
+        Returns how many ran.
+        """
+        processed = 0
+        try:
+            ImportJobService.fail_stale_jobs()
+            while True:
+                job = ImportJobRepository.claim_next_job()
+                if job is None:
+                    return processed
+                ImportJobService.run_job(job)
+                processed += 1
+        finally:
+            close_old_connections()
+
+    @staticmethod
+    def run_job(job):
+        logger.info(f"Running {job.kind} import job {job.id}.")
+        max_stored_errors = getattr(
+            settings, "IMPORT_JOB_MAX_STORED_ERRORS", ImportJobService.DEFAULT_MAX_STORED_ERRORS
+        )
+        try:
+            if job.kind == ImportJob.KIND_MOVIES:
+                with open(job.file_path, "rb") as file:
+                    for result in ImportMovieCSVService.iter_file_batches(file):
+                        ImportJobRepository.record_progress(
+                            job.id, len(result["accepted"]), result["errors"], max_stored_errors
+                        )
+            elif job.kind == ImportJob.KIND_WINNERS:
+                with open(job.file_path, "rb") as file:
+                    service = WinnerCSVService(file)
+                    processed_data, data_list_errors = service.process_and_prepare_data(
+                        file.read().decode("utf-8"), old_delim=", ", new_delim=";"
+                    )
+                ImportJobRepository.record_progress(
+                    job.id,
+                    len(processed_data),
+                    [{"row": values, "error": "Failed to create winner."} for values in data_list_errors],
+                    max_stored_errors
+                )
+            else:
+                raise ValueError(f"Unknown import job kind '{job.kind}'.")
+            if ImportJobRepository.finish_job(job.id, ImportJob.STATUS_SUCCEEDED):
+                logger.info(f"Import job {job.id} finished.")
+            else:
+                logger.warning(f"Import job {job.id} finished after it was marked as failed; keeping that status.")
+        except serializers.ValidationError as e:
+            logger.warning(f"Import job {job.id} rejected: {e.detail}")
+            ImportJobRepository.finish_job(
+                job.id, ImportJob.STATUS_FAILED, " ".join(str(detail) for detail in e.detail)
+            )
+        except Exception as e:
+            logger.error(f"Import job {job.id} failed: {e}")
+            ImportJobRepository.finish_job(job.id, ImportJob.STATUS_FAILED, str(e))
+        finally:
+            if os.path.exists(job.file_path):
+                os.remove(job.file_path)
+
+    @staticmethod
+    def work(poll_interval=1.0, stop_event=None):
+        """
+        Worker loop used by the run_import_jobs management command.
+        """
+        while stop_event is None or not stop_event.is_set():
+            try:
+                processed = ImportJobService.run_pending_jobs()
+            except Exception as e:
+                logger.error(f"Import worker error: {e}")
+                processed = 0
+            if not processed:
+                time.sleep(poll_interval)
+
+    @staticmethod
+    def to_representation(job):
+        finished_at = job.finished_at or timezone.now()
+        elapsed = (finished_at - job.started_at).total_seconds() if job.started_at else 0
+        return {
+            "id": job.id,
+            "kind": job.kind,
+            "status": job.status,
+            "fileName": job.file_name,
+            "rowsProcessed": job.rows_processed,
+            "acceptedCount": job.accepted_count,
+            "errorCount": job.error_count,
+            "throughput": round(job.rows_processed / elapsed, 2) if elapsed > 0 else None,
+            "errors": job.errors,
+            "message": job.message,
+            "createdAt": job.created_at,
+            "startedAt": job.started_at,
+            "finishedAt": job.finished_at
+        }
@@ -0,0 +1,144 @@
+import os
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient, APIRequestFactory, force_authenticate
+
+from Core.Jobs.models import ImportJob
+from Core.Jobs.repository import ImportJobRepository
+from Core.Jobs.service import ImportJobService
+from Core.Movies.models import Movie
+from Core.Winners.view import WinnerImportCSVView
+
+CSV_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "../../Movies/tests/import_csv_test.csv"
+)
+
+
+@pytest.fixture
+def api_client(settings, tmp_path):
+    settings.IMPORT_JOBS_DIR = tmp_path
+    client = APIClient()
+    client.force_authenticate(user=User.objects.create(username="jobs"))
+    return client
+
+
+def upload(client, name="movies.csv", content=None):
+    if content is None:
+        with open(CSV_PATH, "rb") as file:
+            content = file.read()
+    return client.post(
+        reverse("winner-import-csv"),
+        {"file": SimpleUploadedFile(name, content)},
+        format="multipart"
+    )
+
+
+@pytest.mark.django_db(transaction=True)
+def test_import_endpoint_queues_job_and_worker_runs_it(api_client):
+    response = upload(api_client)
+    assert response.status_code == 202
+    job_id = response.data["jobId"]
+    assert Movie.objects.count() == 0
+
+    status_response = api_client.get(response.data["statusUrl"])
+    assert status_response.data["status"] == ImportJob.STATUS_PENDING
+
+    call_command("run_import_jobs", "--once")
+
+    job = ImportJob.objects.get(id=job_id)
+    assert job.status == ImportJob.STATUS_SUCCEEDED
+    assert job.accepted_count == Movie.objects.count() > 0
+    assert job.rows_processed == job.accepted_count + job.error_count
+    assert not os.path.exists(job.file_path)
+
+    status_response = api_client.get(reverse("import-job-detail", kwargs={"job_id": job_id}))
+    assert status_response.status_code == 200
+    assert status_response.data["rowsProcessed"] == job.rows_processed
+    assert status_response.data["throughput"] is not None
+
+
+@pytest.mark.django_db(transaction=True)
+def test_job_with_invalid_header_fails_with_message(api_client):
+    response = upload(api_client, content=b"year;title\n1990;Movie\n")
+    assert response.status_code == 202
+
+    assert ImportJobService.run_pending_jobs() == 1
+
+    job = ImportJob.objects.get(id=response.data["jobId"])
+    assert job.status == ImportJob.STATUS_FAILED
+    assert "Missing columns" in job.message
+
+
+@pytest.mark.django_db
+def test_import_endpoint_rejects_unsupported_file_type(api_client):
+    response = upload(api_client, name="movies.txt", content=b"year;title\n")
+    assert response.status_code == 400
+    assert not ImportJob.objects.exists()
+
+
+@pytest.mark.django_db
+def test_job_status_not_found(api_client):
+    response = api_client.get(reverse("import-job-detail", kwargs={"job_id": 999}))
+    assert response.status_code == 404
+
+
+@pytest.mark.django_db(transaction=True)
+def test_worker_fails_jobs_left_running_by_a_dead_worker(api_client, settings, tmp_path):
+    settings.IMPORT_JOB_TIMEOUT = 600
+    stale_file = tmp_path / "stale.csv"
+    stale_file.write_bytes(b"year;title\n")
+    long_ago = timezone.now() - timedelta(seconds=3600)
+    stale = ImportJob.objects.create(
+        kind=ImportJob.KIND_MOVIES, file_name="stale.csv", file_path=str(stale_file),
+        status=ImportJob.STATUS_RUNNING, started_at=long_ago, heartbeat_at=timezone.now() - timedelta(seconds=601)
+    )
+    # Started as long ago, but still recording progress.
+    busy = ImportJob.objects.create(
+        kind=ImportJob.KIND_MOVIES, file_name="busy.csv", file_path=str(tmp_path / "busy.csv"),
+        status=ImportJob.STATUS_RUNNING, started_at=long_ago, heartbeat_at=long_ago
+    )
+    ImportJobRepository.record_progress(busy.id, 10, [], 10)
+
+    call_command("run_import_jobs", "--once")
+
+    stale.refresh_from_db()
+    assert stale.status == ImportJob.STATUS_FAILED
+    assert "worker stopped" in stale.message and stale.finished_at is not None
+    assert not stale_file.exists()
+    busy.refresh_from_db()
+    assert busy.status == ImportJob.STATUS_RUNNING and busy.accepted_count == 10
+    status_response = api_client.get(reverse("import-job-detail", kwargs={"job_id": stale.id}))
+    assert status_response.data["status"] == ImportJob.STATUS_FAILED
+
+    # A worker that was only slow cannot overwrite the failure afterwards.
+    assert not ImportJobRepository.finish_job(stale.id, ImportJob.STATUS_SUCCEEDED)
+    ImportJobRepository.record_progress(stale.id, 5, [], 10)
+    stale.refresh_from_db()
+    assert stale.status == ImportJob.STATUS_FAILED and stale.accepted_count == 0
+
+
+def upload_winners(content):
+    request = APIRequestFactory().post(
+        "/winners/import/csv/", {"file": SimpleUploadedFile("winners.csv", content)}, format="multipart"
+    )
+    force_authenticate(request, user=User.objects.get_or_create(username="winners-import")[0])
+    return WinnerImportCSVView.as_view()(request)
+
+
+@pytest.mark.django_db
+def test_winner_upload_without_rows_is_rejected_before_queueing(api_client):
+    for content in (b"", b"year;title;studios;producers;award\n", b"year;title\n1990;Movie\n"):
+        response = upload_winners(content)
+        assert response.status_code == 400
+        assert b"Error processing CSV data." in response.content
+    assert not ImportJob.objects.exists()
+
+    response = upload_winners(b"year;title;studios;producers;award\n1990;Movie;Studio;Producer;Worst Picture\n")
+    assert response.status_code == 202
+    assert ImportJob.objects.get().kind == ImportJob.KIND_WINNERS
@@ -0,0 +1,29 @@
+import logging
+
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from Core.Jobs.service import ImportJobService
+
+logger = logging.getLogger(__name__)
+
+
+class ImportJobView(APIView):
+    @swagger_auto_schema(
+        operation_description="Get the state and progress of a CSV import job.",
+        responses={
+            200: "Job state, rows processed, throughput and errors.",
+            404: "Job not found."
+        }
+    )
+    def get(self, request, job_id):
+        try:
+            job = ImportJobService.get_job(job_id)
+            if job:
+                return Response(ImportJobService.to_representation(job), status=status.HTTP_200_OK)
+            return Response({"error": "Job not found."}, status=status.HTTP_404_NOT_FOUND)
+        except Exception as e:
+            logger.error(f"Error fetching import job {job_id}: {e}")
+            return Response({"error": "An unexpected error occurred."}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -0,0 +1,180 @@
+import csv
+import zipfile
+from io import StringIO
+
+import numpy as np
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+NAME_SEPARATOR = ", "
+
+
+class ExportBuffer:
+    """
+    Write-only byte stream for writers that expect a file: everything
+    written since the last drain() is handed out by drain(), so a
+    streamed export never holds more than one chunk.
+    """
+    closed = False
+
+    def __init__(self):
+        self.parts = []
+        self.position = 0
+
+    def write(self, data):
+        data = bytes(data)
+        self.parts.append(data)
+        self.position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self.position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self):
+        data = b"".join(self.parts)
+        self.parts = []
+        return data
+
+
+class CSVExportWriter:
+    """The importer's year;title;studios;producers;winner format."""
+    content_type = "text/csv"
+    extension = "csv"
+    COLUMNS = ["year", "title", "studios", "producers", "winner"]
+
+    def __init__(self):
+        self.buffer = StringIO()
+        self.writer = csv.writer(self.buffer, delimiter=";", lineterminator="\n")
+
+    def drain(self):
+        data = self.buffer.getvalue()
+        self.buffer.seek(0)
+        self.buffer.truncate()
+        return data.encode("utf-8")
+
+    def begin(self):
+        self.writer.writerow(self.COLUMNS)
+        return self.drain()
+
+    def write(self, chunk):
+        self.writer.writerows(
+            [
+                row["year"],
+                row["title"],
+                NAME_SEPARATOR.join(row["studio_names"]),
+                NAME_SEPARATOR.join(row["producer_names"]),
+                "yes" if row["winner"] else ""
+            ]
+            for row in chunk
+        )
+        return self.drain()
+
+    def end(self):
+        return b""
+
+
+def to_columns(chunk):
+    return {
+        "id": [row["id"] for row in chunk],
+        "year": [row["year"] for row in chunk],
+        "title": [row["title"] for row in chunk],
+        "studios": [NAME_SEPARATOR.join(row["studio_names"]) for row in chunk],
+        "producers": [NAME_SEPARATOR.join(row["producer_names"]) for row in chunk],
+        "winner": [row["winner"] for row in chunk],
+    }
+
+
+class NpzExportWriter:
+    """
+    Compressed NumPy archive with one set of arrays per chunk, named like
+    "title_00000"; concatenate a column's arrays in name order to get
+    the whole column.
+    """
+    content_type = "application/octet-stream"
+    extension = "npz"
+    DTYPES = {"id": np.int64, "year": np.int64, "title": str, "studios": str, "producers": str, "winner": bool}
+
+    def __init__(self):
+        self.buffer = ExportBuffer()
+        self.archive = zipfile.ZipFile(self.buffer, mode="w", compression=zipfile.ZIP_DEFLATED, allowZip64=True)
+        self.chunks = 0
+
+    def begin(self):
+        return b""
+
+    def write(self, chunk):
+        for name, values in to_columns(chunk).items():
+            with self.archive.open(f"{name}_{self.chunks:05d}.npy", mode="w", force_zip64=True) as entry:
+                np.lib.format.write_array(
+                    entry, np.array(values, dtype=self.DTYPES[name]), allow_pickle=False
+                )
+        self.chunks += 1
+        return self.buffer.drain()
+
+    def end(self):
+        # An empty export still gets one (empty) array per column.
+        data = self.write([]) if not self.chunks else b""
+        self.archive.close()
+        return data + self.buffer.drain()
+
+
+class ArrowExportWriter:
+    """Parquet (one row group per chunk) or Feather v2 (one record batch per chunk)."""
+    CONTENT_TYPES = {
+        "parquet": "application/vnd.apache.parquet",
+        "feather": "application/vnd.apache.arrow.file",
+    }
+
+    def __init__(self, export_format):
+        self.content_type = self.CONTENT_TYPES[export_format]
+        self.extension = export_format
+        self.schema = pyarrow.schema([
+            ("id", pyarrow.int64()),
+            ("year", pyarrow.int64()),
+            ("title", pyarrow.string()),
+            ("studios", pyarrow.string()),
+            ("producers", pyarrow.string()),
+            ("winner", pyarrow.bool_()),
+        ])
+        self.buffer = ExportBuffer()
+        if export_format == "parquet":
+            self.writer = pyarrow.parquet.ParquetWriter(self.buffer, self.schema)
+        else:
+            self.writer = pyarrow.ipc.new_file(self.buffer, self.schema)
+
+    def begin(self):
+        return self.buffer.drain()
+
+    def write(self, chunk):
+        self.writer.write_table(pyarrow.Table.from_pydict(to_columns(chunk), schema=self.schema))
+        return self.buffer.drain()
+
+    def end(self):
+        self.writer.close()
+        return self.buffer.drain()
+
+
+def get_available_formats():
+    formats = ["csv", "npz"]
+    if pyarrow is not None:
+        formats += ["parquet", "feather"]
+    return formats
+
+
+def get_writer(export_format):
+    if export_format == "csv":
+        return CSVExportWriter()
+    if export_format == "npz":
+        return NpzExportWriter()
+    return ArrowExportWriter(export_format)
@@ -12,5 +12,19 @@ class Movie(models.Model):
     producer = models.ManyToManyField(Producer, related_name='movies')
     studio = models.ManyToManyField(Studio, related_name='movies')
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['winner', 'year'], name='core_movie_winner_year_idx'),
+            models.Index(fields=['year', 'winner'], name='core_movie_year_winner_idx'),
+        ]
+
     def __str__(self):
         return self.title
+
+
+class YearWinnerCount(models.Model):
+    year = models.PositiveIntegerField(unique=True)
+    winner_count = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.year}: {self.winner_count}"
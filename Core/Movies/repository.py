@@ -1,17 +1,53 @@
-from Core.Movies.models import Movie
-from Core.Producers.repository import ProducerRepository
-from Core.Studio.repository import StudioRepository
+from Core.DataVersion.repository import DataVersionRepository
+from Core.Movies.models import Movie, YearWinnerCount
+from Core.Producers.models import Producer
+from Core.Producers.repository import ProducerRepository, ProducerWinIntervalRepository
+from Core.Search.repository import SearchRepository
+from Core.Studio.models import Studio
+from Core.Studio.repository import StudioRepository, StudioWinCountRepository
+from Core.Winners.models import Winner
+from django.db import transaction
 from django.db.models import Count
 from django.db.models import Count, Min, Max, Q
 import logging
 logger = logging.getLogger(__name__)
 
 
+TITLE_LOOKUP_CHUNK_SIZE = 500
+MOVIE_COLUMNS = ('id', 'title', 'year', 'winner')
+RELATION_FIELDS = {'producer_name': 'producer', 'studio_name': 'studio'}
+
+
 class MovieRepository:
     @staticmethod
-    def get_all_movies(filters=None):
+    def select_fields(movies, fields=None):
+        """
+        Loads only what the serializer `fields` need: their columns, and a
+        relation only when its names are asked for. None loads everything.
+        """
+        return MovieRepository.select_columns(movies, fields).prefetch_related(
+            *MovieRepository.get_relations(fields)
+        )
+
+    @staticmethod
+    def select_columns(movies, fields=None):
+        if fields is None:
+            return movies
+        return movies.only('id', *[field for field in fields if field in MOVIE_COLUMNS])
+
+    @staticmethod
+    def get_relations(fields=None):
+        if fields is None:
+            return list(RELATION_FIELDS.values())
+        return [relation for field, relation in RELATION_FIELDS.items() if field in fields]
+
+    @staticmethod
+    def get_all_movies(filters=None, fields=None):
+        return MovieRepository.filter_movies(MovieRepository.select_fields(Movie.objects.all(), fields), filters)
+
+    @staticmethod
+    def filter_movies(movies, filters=None):
         try:
-            movies = Movie.objects.all()
             if filters:
                 if "winner" in filters:
                     if isinstance(filters["winner"], bool):
@@ -31,6 +67,184 @@ class MovieRepository:
 
 
 
+    @staticmethod
+    def get_movies_after(filters=None, after_id=None, limit=10, fields=None):
+        movies = MovieRepository.get_all_movies(filters, fields)
+        if after_id is not None:
+            movies = movies.filter(id__gt=after_id)
+        return list(movies[:limit])
+
+    @staticmethod
+    def get_export_rows(filters=None):
+        return MovieRepository.filter_movies(Movie.objects.all(), filters).values('id', 'title', 'year', 'winner')
+
+    @staticmethod
+    def get_relation_names(movie_ids):
+        """The producer and studio names of the movies, as {movie_id: [names]} maps."""
+        producer_names = {}
+        producers = (
+            Movie.producer.through.objects.filter(movie_id__in=movie_ids)
+            .order_by('id')
+            .values_list('movie_id', 'producer__name')
+        )
+        for movie_id, name in producers:
+            producer_names.setdefault(movie_id, []).append(name)
+        studio_names = {}
+        studios = (
+            Movie.studio.through.objects.filter(movie_id__in=movie_ids)
+            .order_by('id')
+            .values_list('movie_id', 'studio__name')
+        )
+        for movie_id, name in studios:
+            studio_names.setdefault(movie_id, []).append(name)
+        return producer_names, studio_names
+
+    @staticmethod
+    def iter_movie_chunks(filters=None, chunk_size=2000):
+        """
+        Yields every movie in id order, in lists of up to `chunk_size`
+        dicts with their producer_names and studio_names. Movies are read
+        by id ranges, with one query per relation for each chunk, so
+        memory does not grow with the catalog.
+        """
+        movies = MovieRepository.get_export_rows(filters)
+        after_id = None
+        while True:
+            chunk = movies.filter(id__gt=after_id) if after_id is not None else movies
+            chunk = list(chunk[:chunk_size])
+            if not chunk:
+                return
+            producer_names, studio_names = MovieRepository.get_relation_names([row['id'] for row in chunk])
+            for row in chunk:
+                row['producer_names'] = producer_names.get(row['id'], [])
+                row['studio_names'] = studio_names.get(row['id'], [])
+            yield chunk
+            if len(chunk) < chunk_size:
+                return
+            after_id = chunk[-1]['id']
+
+    @staticmethod
+    def iter_movie_rows(filters=None, chunk_size=2000):
+        for chunk in MovieRepository.iter_movie_chunks(filters, chunk_size):
+            yield from chunk
+
+    @staticmethod
+    async def aget_relation_names(movie_ids):
+        # values() rather than values_list(): Django 4.2.0 runs a
+        # values_list() query eagerly inside aiterator().
+        producer_names = {}
+        producers = (
+            Movie.producer.through.objects.filter(movie_id__in=movie_ids)
+            .order_by('id')
+            .values('movie_id', 'producer__name')
+        )
+        async for row in producers.aiterator():
+            producer_names.setdefault(row['movie_id'], []).append(row['producer__name'])
+        studio_names = {}
+        studios = (
+            Movie.studio.through.objects.filter(movie_id__in=movie_ids)
+            .order_by('id')
+            .values('movie_id', 'studio__name')
+        )
+        async for row in studios.aiterator():
+            studio_names.setdefault(row['movie_id'], []).append(row['studio__name'])
+        return producer_names, studio_names
+
+    @staticmethod
+    async def aiter_movie_chunks(filters=None, chunk_size=2000):
+        """Async counterpart of iter_movie_chunks."""
+        movies = MovieRepository.get_export_rows(filters)
+        after_id = None
+        while True:
+            chunk = movies.filter(id__gt=after_id) if after_id is not None else movies
+            chunk = [row async for row in chunk[:chunk_size].aiterator()]
+            if not chunk:
+                return
+            producer_names, studio_names = await MovieRepository.aget_relation_names([row['id'] for row in chunk])
+            for row in chunk:
+                row['producer_names'] = producer_names.get(row['id'], [])
+                row['studio_names'] = studio_names.get(row['id'], [])
+            yield chunk
+            if len(chunk) < chunk_size:
+                return
+            after_id = chunk[-1]['id']
+
+    @staticmethod
+    async def aiter_movie_rows(filters=None, chunk_size=2000):
+        async for chunk in MovieRepository.aiter_movie_chunks(filters, chunk_size):
+            for row in chunk:
+                yield row
+
+    @staticmethod
+    async def aload_relation_names(movies, relations=('producer', 'studio')):
+        """
+        Async counterpart of prefetch_related('producer', 'studio'), which
+        aiterator() does not support: sets producer_names and studio_names
+        on every movie, in the order the prefetch would return them. Only
+        the given relations are loaded.
+        """
+        by_id = {movie.id: movie for movie in movies}
+        # values() rather than values_list(): Django 4.2.0 runs a
+        # values_list() query eagerly inside aiterator(), outside the
+        # sync_to_async boundary.
+        for relation, model in (('producer', Producer), ('studio', Studio)):
+            if relation not in relations:
+                continue
+            for movie in movies:
+                setattr(movie, f'{relation}_names', [])
+            if not by_id:
+                continue
+            names = model.objects.filter(movies__in=list(by_id)).values('movies__id', 'name')
+            async for row in names.aiterator():
+                getattr(by_id[row['movies__id']], f'{relation}_names').append(row['name'])
+        return movies
+
+    @staticmethod
+    async def acount_movies(filters=None):
+        return await MovieRepository.filter_movies(Movie.objects.all(), filters).acount()
+
+    @staticmethod
+    async def aget_movies(filters=None, offset=0, limit=None, fields=None):
+        movies = MovieRepository.filter_movies(
+            MovieRepository.select_columns(Movie.objects.all(), fields), filters
+        ).order_by('id')
+        movies = movies[offset:offset + limit] if limit is not None else movies[offset:]
+        return await MovieRepository.aload_relation_names(
+            [movie async for movie in movies.aiterator()], MovieRepository.get_relations(fields)
+        )
+
+    @staticmethod
+    async def aget_movies_after(filters=None, after_id=None, limit=10, fields=None):
+        movies = MovieRepository.filter_movies(
+            MovieRepository.select_columns(Movie.objects.all(), fields), filters
+        ).order_by('id')
+        if after_id is not None:
+            movies = movies.filter(id__gt=after_id)
+        return await MovieRepository.aload_relation_names(
+            [movie async for movie in movies[:limit].aiterator()], MovieRepository.get_relations(fields)
+        )
+
+    @staticmethod
+    async def aget_movie_with_relations_by_id(movie_id, fields=None):
+        try:
+            movie = await MovieRepository.select_columns(Movie.objects.all(), fields).aget(id=movie_id)
+        except Movie.DoesNotExist:
+            return None
+        await MovieRepository.aload_relation_names([movie], MovieRepository.get_relations(fields))
+        return movie
+
+    @staticmethod
+    def get_movies_by_ids(ids, fields=None):
+        return MovieRepository.select_fields(Movie.objects.all(), fields).in_bulk(ids)
+
+    @staticmethod
+    async def aget_movies_by_ids(ids, fields=None):
+        movies = MovieRepository.select_columns(Movie.objects.filter(id__in=ids), fields)
+        movies = await MovieRepository.aload_relation_names(
+            [movie async for movie in movies.aiterator()], MovieRepository.get_relations(fields)
+        )
+        return {movie.id: movie for movie in movies}
+
     @staticmethod
     def get_movie_by_id(movie_id):
         try:
@@ -38,6 +252,13 @@ class MovieRepository:
         except Movie.DoesNotExist:
             return None
 
+    @staticmethod
+    def get_movie_with_relations_by_id(movie_id, fields=None):
+        try:
+            return MovieRepository.select_fields(Movie.objects.all(), fields).get(id=movie_id)
+        except Movie.DoesNotExist:
+            return None
+
     @staticmethod
     def get_or_create_movie(title, year, producer_data, studio_data, winner=False):
         producers = ProducerRepository.get_or_create_producer(producer_data)
@@ -62,6 +283,272 @@ class MovieRepository:
             winner=winner
         )
 
+    @staticmethod
+    def get_years_by_title(titles):
+        titles = list(titles)
+        years_by_title = {}
+        for start in range(0, len(titles), TITLE_LOOKUP_CHUNK_SIZE):
+            chunk = titles[start:start + TITLE_LOOKUP_CHUNK_SIZE]
+            years_by_title.update(
+                Movie.objects.filter(title__in=chunk).values_list('title', 'year')
+            )
+        return years_by_title
+
+    @staticmethod
+    def bulk_create_movies(movies):
+        Movie.objects.bulk_create(movies)
+        if any(movie.pk is None for movie in movies):
+            ids_by_title = dict(
+                Movie.objects.filter(
+                    title__in=[movie.title for movie in movies]
+                ).values_list('title', 'id')
+            )
+            for movie in movies:
+                movie.pk = ids_by_title[movie.title]
+        return movies
+
+    @staticmethod
+    def get_relation_ids(through, field, movie_ids):
+        """The related ids of the movies through a m2m table, as a {movie_id: [ids]} map."""
+        related = {}
+        for movie_id, related_id in (
+            through.objects.filter(movie_id__in=movie_ids).order_by('id').values_list('movie_id', field)
+        ):
+            related.setdefault(movie_id, []).append(related_id)
+        return related
+
+    @staticmethod
+    def check_bulk_operations(operations):
+        """
+        Loads the movies the operations target and returns them with an
+        {index: error message} map of the operations that cannot apply:
+        unknown ids, a movie targeted twice, or a title already taken by
+        another movie or by an earlier operation. Titles of movies deleted
+        in the same batch are free to reuse.
+        """
+        movies = Movie.objects.in_bulk([op['id'] for op in operations if op['op'] != 'create'])
+        errors = {}
+        targeted = {}
+        for op in operations:
+            if op['op'] == 'create':
+                continue
+            if op['id'] not in movies:
+                errors[op['index']] = f"Movie with ID {op['id']} not found."
+            elif op['id'] in targeted:
+                errors[op['index']] = (
+                    f"Movie with ID {op['id']} is already changed by operation {targeted[op['id']]}."
+                )
+            else:
+                targeted[op['id']] = op['index']
+        deleted = {op['id'] for op in operations if op['op'] == 'delete' and op['index'] not in errors}
+
+        owners = dict(
+            Movie.objects.filter(
+                title__in={op['title'] for op in operations if op.get('title') is not None}
+            ).values_list('title', 'id')
+        )
+        claimed = set()
+        for op in operations:
+            title = op.get('title')
+            if title is None or op['index'] in errors:
+                continue
+            owner = owners.get(title)
+            if title in claimed or (owner is not None and owner != op.get('id') and owner not in deleted):
+                errors[op['index']] = f"Movie '{title}' already exists."
+                continue
+            claimed.add(title)
+        return movies, errors
+
+    @staticmethod
+    def bulk_write_movies(operations, all_or_nothing=False):
+        """
+        Applies parsed create/update/delete operations in a single transaction.
+
+        Each operation is a dict with "index" and "op", plus "id" for updates
+        and deletes and "title", "year", "winner", "producers" and "studios"
+        for writes; fields an update leaves out keep their value. Names are
+        resolved in one pass and every kind of write is batched, so the
+        statement count does not grow with the number of operations.
+        Operations that cannot apply fail on their own, unless
+        all_or_nothing is set, in which case nothing is written. Returns
+        ({index: movie id}, {index: error message}).
+        """
+        with transaction.atomic():
+            movies, errors = MovieRepository.check_bulk_operations(operations)
+            if errors and all_or_nothing:
+                return {}, errors
+            operations = [op for op in operations if op['index'] not in errors]
+            if not operations:
+                return {}, errors
+            deletes = [op for op in operations if op['op'] == 'delete']
+            updates = [op for op in operations if op['op'] == 'update']
+            creates = [op for op in operations if op['op'] == 'create']
+
+            producers = ProducerRepository.get_or_create_producers_by_name(
+                name for op in updates + creates for name in op.get('producers') or ()
+            )
+            studios = StudioRepository.get_or_create_studios_by_name(
+                name for op in updates + creates for name in op.get('studios') or ()
+            )
+            MovieProducer = Movie.producer.through
+            MovieStudio = Movie.studio.through
+            changed_ids = [op['id'] for op in deletes + updates]
+            previous = {movie_id: (movies[movie_id].year, movies[movie_id].winner) for movie_id in changed_ids}
+            previous_producers = MovieRepository.get_relation_ids(MovieProducer, 'producer_id', changed_ids)
+            previous_studios = MovieRepository.get_relation_ids(MovieStudio, 'studio_id', changed_ids)
+
+            deleted_ids = [op['id'] for op in deletes]
+            if deleted_ids:
+                MovieProducer.objects.filter(movie_id__in=deleted_ids).delete()
+                MovieStudio.objects.filter(movie_id__in=deleted_ids).delete()
+                # The raw delete skips the collector, so the rows that
+                # cascade from a movie go first.
+                Winner.objects.filter(movie_id__in=deleted_ids).delete()
+                # A raw delete skips the per-movie delete signals; the
+                # aggregates are refreshed once for the whole batch below.
+                Movie.objects.filter(id__in=deleted_ids)._raw_delete(Movie.objects.db)
+
+            for op in updates:
+                movie = movies[op['id']]
+                for field in ('title', 'year', 'winner'):
+                    if op.get(field) is not None:
+                        setattr(movie, field, op[field])
+            if updates:
+                Movie.objects.bulk_update([movies[op['id']] for op in updates], ['title', 'year', 'winner'])
+            created = MovieRepository.bulk_create_movies([
+                Movie(title=op['title'], year=op['year'], winner=op['winner']) for op in creates
+            ])
+
+            written = [(movies[op['id']], op) for op in updates] + list(zip(created, creates))
+            new_producers = {
+                movie.pk: list(dict.fromkeys(producers[name].pk for name in op['producers']))
+                for movie, op in written if op.get('producers') is not None
+            }
+            new_studios = {
+                movie.pk: list(dict.fromkeys(studios[name].pk for name in op['studios']))
+                for movie, op in written if op.get('studios') is not None
+            }
+            MovieProducer.objects.filter(movie_id__in=[op['id'] for op in updates if op['id'] in new_producers]).delete()
+            MovieStudio.objects.filter(movie_id__in=[op['id'] for op in updates if op['id'] in new_studios]).delete()
+            MovieProducer.objects.bulk_create([
+                MovieProducer(movie_id=movie_id, producer_id=producer_id)
+                for movie_id, producer_ids in new_producers.items()
+                for producer_id in producer_ids
+            ])
+            MovieStudio.objects.bulk_create([
+                MovieStudio(movie_id=movie_id, studio_id=studio_id)
+                for movie_id, studio_ids in new_studios.items()
+                for studio_id in studio_ids
+            ])
+
+            # Winners before the batch lose their stored aggregates, winners
+            # after it gain them; refreshing both sides covers every change.
+            years, producer_ids, studio_ids = set(), set(), set()
+            for movie_id, (year, winner) in previous.items():
+                if winner:
+                    years.add(year)
+                    producer_ids.update(previous_producers.get(movie_id, []))
+                    studio_ids.update(previous_studios.get(movie_id, []))
+            for movie, _ in written:
+                if movie.winner:
+                    years.add(movie.year)
+                    producer_ids.update(new_producers.get(movie.pk, previous_producers.get(movie.pk, [])))
+                    studio_ids.update(new_studios.get(movie.pk, previous_studios.get(movie.pk, [])))
+            ProducerWinIntervalRepository.refresh_producers(producer_ids)
+            StudioWinCountRepository.refresh_studios(studio_ids)
+            YearWinnerCountRepository.refresh_years(years)
+            SearchRepository.refresh_movies(deleted_ids + [movie.pk for movie, _ in written])
+            SearchRepository.refresh_producers(producer.pk for producer in producers.values())
+            SearchRepository.refresh_studios(studio.pk for studio in studios.values())
+            DataVersionRepository.bump()
+        applied = {op['index']: op['id'] for op in deletes}
+        applied.update((op['index'], movie.pk) for movie, op in written)
+        return applied, errors
+
+    @staticmethod
+    def bulk_import_movies(rows):
+        """
+        Persists a batch of parsed rows in a single transaction.
+
+        Each row is a dict with title, year, producers, studios and winner.
+        Rows whose title already exists with the same year are accepted
+        without changes, mirroring get_or_create. Returns the accepted rows
+        and a list of (row, error message) pairs.
+        """
+        accepted = []
+        errors = []
+        with transaction.atomic():
+            known_years = MovieRepository.get_years_by_title(
+                {row['title'] for row in rows}
+            )
+            new_rows = []
+            for row in rows:
+                known_year = known_years.get(row['title'])
+                if known_year is None:
+                    known_years[row['title']] = row['year']
+                    new_rows.append(row)
+                elif known_year != row['year']:
+                    errors.append((
+                        row,
+                        f"Movie '{row['title']}' already exists with year {known_year}."
+                    ))
+                    continue
+                accepted.append(row)
+
+            if new_rows:
+                producers = ProducerRepository.get_or_create_producers_by_name(
+                    name for row in new_rows for name in row['producers']
+                )
+                studios = StudioRepository.get_or_create_studios_by_name(
+                    name for row in new_rows for name in row['studios']
+                )
+                movies = [
+                    Movie(title=row['title'], year=row['year'], winner=row['winner'])
+                    for row in new_rows
+                ]
+                MovieRepository.bulk_create_movies(movies)
+
+                MovieProducer = Movie.producer.through
+                MovieStudio = Movie.studio.through
+                MovieProducer.objects.bulk_create(
+                    [
+                        MovieProducer(movie_id=movie.pk, producer_id=producer_id)
+                        for movie, row in zip(movies, new_rows)
+                        for producer_id in dict.fromkeys(
+                            producers[name].pk for name in row['producers']
+                        )
+                    ],
+                    ignore_conflicts=True
+                )
+                MovieStudio.objects.bulk_create(
+                    [
+                        MovieStudio(movie_id=movie.pk, studio_id=studio_id)
+                        for movie, row in zip(movies, new_rows)
+                        for studio_id in dict.fromkeys(
+                            studios[name].pk for name in row['studios']
+                        )
+                    ],
+                    ignore_conflicts=True
+                )
+                ProducerWinIntervalRepository.refresh_producers(
+                    producers[name].pk
+                    for row in new_rows if row['winner']
+                    for name in row['producers']
+                )
+                YearWinnerCountRepository.refresh_years(
+                    row['year'] for row in new_rows if row['winner']
+                )
+                StudioWinCountRepository.refresh_studios(
+                    studios[name].pk
+                    for row in new_rows if row['winner']
+                    for name in row['studios']
+                )
+                SearchRepository.refresh_movies(movie.pk for movie in movies)
+                SearchRepository.refresh_producers(producer.pk for producer in producers.values())
+                SearchRepository.refresh_studios(studio.pk for studio in studios.values())
+                DataVersionRepository.bump()
+        return accepted, errors
+
     @staticmethod
     def update_movie(movie_id, title, year, producer_data, studio_data, winner=None):
         movie = MovieRepository.get_movie_by_id(movie_id)
@@ -90,30 +577,35 @@ class MovieRepository:
     def get_years_with_multiple_winners():
         try:
             year_counts = (
-                Movie.objects.filter(winner=True)
-                .values('year')
-                .annotate(count=Count('year'))
-                .filter(count__gt=1)
+                YearWinnerCount.objects.filter(winner_count__gt=1)
+                .order_by('year')
+                .values_list('year', 'winner_count')
             )
             years_with_multiple_winners = [
-                {'year': entry['year'], 'winnerCount': entry['count']}
-                for entry in year_counts
+                {'year': year, 'winnerCount': count}
+                for year, count in year_counts
             ]
             return years_with_multiple_winners
         except Exception as e:
             logger.error(f"Error fetching years with multiple winners from the repository: {e}")
             raise
 
+    @staticmethod
+    async def aget_years_with_multiple_winners():
+        year_counts = (
+            YearWinnerCount.objects.filter(winner_count__gt=1)
+            .order_by('year')
+            .values('year', 'winner_count')
+        )
+        return [
+            {'year': row['year'], 'winnerCount': row['winner_count']}
+            async for row in year_counts.aiterator()
+        ]
+
     @staticmethod
     def get_studios_with_winners():
         try:
-            studios_with_wins = (
-                Movie.objects.filter(winner=True)
-                .values('studio__name')
-                .annotate(wins=Count('studio'))
-                .order_by('-wins')
-            )
-            return studios_with_wins
+            return StudioWinCountRepository.get_studios_with_wins()
         except Exception as e:
             logger.error(f"Error fetching studios with most wins from the repository: {e}")
             raise
@@ -121,40 +613,69 @@ class MovieRepository:
     @staticmethod
     def get_producers_with_winner_intervals():
         try:
-            producers_with_intervals = (
-                Movie.objects.filter(winner=True)
-                .values('producer__name')
-                .annotate(
-                    min_year=Min('year'),
-                    max_year=Max('year'),
-                    count=Count('id')
-                )
-                .filter(count__gte=2)
-                .order_by('-max_year', 'min_year')
-            )
-            producers_with_intervals_list = []
-            for entry in producers_with_intervals:
-                entry['interval'] = entry['max_year'] - entry['min_year']
-                producers_with_intervals_list.append(entry)
-            if producers_with_intervals_list:
-                min_entry = min(producers_with_intervals_list, key=lambda x: x['interval'])
-                max_entry = max(producers_with_intervals_list, key=lambda x: x['interval'])
-                response = {
-                    "min": [{
-                        "producer": min_entry['producer__name'],
-                        "interval": min_entry['interval'],
-                        "previousWin": min_entry['min_year'],
-                        "followingWin": min_entry['max_year']
-                    }],
-                    "max": [{
-                        "producer": max_entry['producer__name'],
-                        "interval": max_entry['interval'],
-                        "previousWin": max_entry['min_year'],
-                        "followingWin": max_entry['max_year']
-                    }]
-                }
-                return response
-            return {}
+            min_entries, max_entries = ProducerWinIntervalRepository.get_extreme_intervals()
+            if not min_entries:
+                return {}
+            return {
+                "min": [MovieRepository.format_interval(entry) for entry in min_entries],
+                "max": [MovieRepository.format_interval(entry) for entry in max_entries]
+            }
         except Exception as e:
             logger.error(f"Error fetching producers with winner intervals: {e}")
             raise
+
+    @staticmethod
+    async def aget_studios_with_winners():
+        return [studio async for studio in StudioWinCountRepository.get_studios_with_wins().aiterator()]
+
+    @staticmethod
+    async def aget_producers_with_winner_intervals():
+        min_entries, max_entries = await ProducerWinIntervalRepository.aget_extreme_intervals()
+        if not min_entries:
+            return {}
+        return {
+            "min": [MovieRepository.format_interval(entry) for entry in min_entries],
+            "max": [MovieRepository.format_interval(entry) for entry in max_entries]
+        }
+
+    @staticmethod
+    def format_interval(entry):
+        return {
+            "producer": entry.producer.name,
+            "interval": entry.interval,
+            "previousWin": entry.previous_win,
+            "followingWin": entry.following_win
+        }
+
+
+class YearWinnerCountRepository:
+    @staticmethod
+    def count_winners(years=None):
+        winners = Movie.objects.filter(winner=True)
+        if years is not None:
+            winners = winners.filter(year__in=years)
+        return winners.values('year').annotate(count=Count('id')).values_list('year', 'count')
+
+    @staticmethod
+    def refresh_years(years):
+        """Recounts the stored winners of the given years only."""
+        years = sorted(set(years))
+        if not years:
+            return
+        with transaction.atomic():
+            YearWinnerCount.objects.filter(year__in=years).delete()
+            YearWinnerCount.objects.bulk_create([
+                YearWinnerCount(year=year, winner_count=count)
+                for year, count in YearWinnerCountRepository.count_winners(years)
+            ])
+
+    @staticmethod
+    def rebuild_all():
+        with transaction.atomic():
+            YearWinnerCount.objects.all().delete()
+            counts = [
+                YearWinnerCount(year=year, winner_count=count)
+                for year, count in YearWinnerCountRepository.count_winners()
+            ]
+            YearWinnerCount.objects.bulk_create(counts)
+        return len(counts)
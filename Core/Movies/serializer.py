@@ -9,8 +9,19 @@ class MovieSerializer(serializers.ModelSerializer):
         model = Movie
         fields = ['id', 'title', 'year', 'winner', 'producer_name', 'studio_name']
 
+    def __init__(self, *args, fields=None, **kwargs):
+        # `fields` keeps only the named fields, for ?fields= requests.
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
     def get_producer_name(self, obj):
+        if hasattr(obj, 'producer_names'):
+            return obj.producer_names
         return [producer.name for producer in obj.producer.all()]
 
     def get_studio_name(self, obj):
+        if hasattr(obj, 'studio_names'):
+            return obj.studio_names
         return [studio.name for studio in obj.studio.all()]
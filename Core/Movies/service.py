@@ -1,8 +1,14 @@
+import codecs
 from io import StringIO
+from django.conf import settings
 from django.core.paginator import Paginator
 from xml.dom import ValidationErr
+import numpy as np
 import pandas as pd
 from django.db.models import QuerySet
+from Core import pagination
+from Core.Movies import export
+from Core.Instrumentation import metrics
 from Core.Movies.models import Movie
 from Core.Movies.repository import MovieRepository
 from Core.Movies.serializer import MovieSerializer
@@ -15,64 +21,72 @@ logger = logging.getLogger(__name__)
 
 
 class MovieService:
+    DEFAULT_MAX_PAGE_SIZE = 100
+    DEFAULT_EXPORT_CHUNK_SIZE = 2000
+
+    @staticmethod
+    def get_max_page_size():
+        return getattr(settings, "MOVIES_MAX_PAGE_SIZE", MovieService.DEFAULT_MAX_PAGE_SIZE)
+
+    @staticmethod
+    def parse_page_size(size):
+        return pagination.parse_page_size(size, MovieService.get_max_page_size())
+
+    @staticmethod
+    def parse_filters(filters):
+        if "winner" in filters:
+            winner = filters["winner"].lower()
+            if winner in ["true", "1"]:
+                filters["winner"] = True
+            elif winner in ["false", "0"]:
+                filters["winner"] = False
+            else:
+                raise ValueError("Invalid value for 'winner'. Expected 'true', 'false'")
+
+        if "year" in filters:
+            try:
+                filters["year"] = int(filters["year"])
+            except ValueError:
+                raise ValueError("Invalid value for 'year'. Expected an integer.")
+        return filters
+
+    @staticmethod
+    def parse_fields(fields):
+        """
+        Parses ?fields=id,title into serializer field names, in the
+        serializer's order; None (every field) when the parameter is absent.
+        """
+        if fields is None:
+            return None
+        requested = {field.strip() for field in fields.split(",") if field.strip()}
+        available = MovieSerializer.Meta.fields
+        if not requested or requested - set(available):
+            raise ValueError(f"Invalid value for 'fields'. Expected some of: {', '.join(available)}.")
+        return [field for field in available if field in requested]
+
+    @staticmethod
+    def parse_page_filters(filters, page, size):
+        page = int(filters.get("page", page))
+        size = MovieService.parse_page_size(filters.get("size", size))
+        MovieService.parse_filters(filters)
+        return page, size
+
     @staticmethod
     def get_all_movies(filters=None, page=1, size=10):
         try:
-            page = int(filters.get("page", 1))
-            size = int(filters.get("size", 10))
             if filters is None:
                 filters = {}
+            page, size = MovieService.parse_page_filters(filters, page, size)
+            fields = MovieService.parse_fields(filters.pop("fields", None))
 
-            if "winner" in filters:
-                winner = filters["winner"].lower()
-                if winner in ["true", "1"]:
-                    filters["winner"] = True
-                elif winner in ["false", "0"]:
-                    filters["winner"] = False
-                else:
-                    raise ValueError("Invalid value for 'winner'. Expected 'true', 'false'")
-
-            if "year" in filters:
-                try:
-                    filters["year"] = int(filters["year"])
-                except ValueError:
-                    raise ValueError("Invalid value for 'year'. Expected an integer.")
+            if "cursor" in filters:
+                return MovieService.get_movies_by_cursor(filters, filters["cursor"], size, fields)
 
-            movies = MovieRepository.get_all_movies(filters)
+            movies = MovieRepository.get_all_movies(filters, fields)
             paginator = Paginator(movies, size)
             paginated_movies = paginator.get_page(page)
-            serialized_movies = MovieSerializer(
-                paginated_movies.object_list,
-                many=True,
-                context={'request': None}
-            ).data
-
-            my_return = {
-                "content": serialized_movies,
-                "pageable": {
-                    "sort": {
-                        "sorted": False,
-                        "unsorted": True
-                    },
-                    "pageSize": size,
-                    "pageNumber": page - 1,
-                    "offset": (page - 1) * size,
-                    "paged": True,
-                    "unpaged": False
-                },
-                "totalElements": paginator.count,
-                "last": not paginated_movies.has_next(),
-                "totalPages": paginator.num_pages,
-                "first": paginated_movies.number == 0,
-                "sort": {
-                    "sorted": False,
-                    "unsorted": True
-                },
-                "number": paginated_movies.number,
-                "numberOfElements": len(paginated_movies),
-                "size": size
-            }
-            return my_return
+            serialized_movies = MovieService.serialize(paginated_movies.object_list, fields)
+            return MovieService.format_page(serialized_movies, paginator, paginated_movies, page, size)
         except ValueError as ve:
             logger.warning(f"Invalid filter value: {ve}")
             raise
@@ -83,11 +97,147 @@ class MovieService:
             logger.error(f"Error getting all movies: {e}")
             raise
 
+    @staticmethod
+    async def aget_all_movies(filters=None, page=1, size=10):
+        """Async counterpart of get_all_movies with the same response body."""
+        try:
+            if filters is None:
+                filters = {}
+            page, size = MovieService.parse_page_filters(filters, page, size)
+            fields = MovieService.parse_fields(filters.pop("fields", None))
+
+            if "cursor" in filters:
+                return await MovieService.aget_movies_by_cursor(filters, filters["cursor"], size, fields)
+
+            # Only the selected page is fetched.
+            paginator = pagination.count_paginator(await MovieRepository.acount_movies(filters), size)
+            paginated_movies = paginator.get_page(page)
+            movies = await MovieRepository.aget_movies(
+                filters, (paginated_movies.number - 1) * size, size, fields
+            )
+            serialized_movies = MovieService.serialize(movies, fields)
+            return MovieService.format_page(serialized_movies, paginator, paginated_movies, page, size)
+        except ValueError as ve:
+            logger.warning(f"Invalid filter value: {ve}")
+            raise
+        except Exception as e:
+            logger.error(f"Error getting all movies: {e}")
+            raise
+
+    @staticmethod
+    def format_page(serialized_movies, paginator, paginated_movies, page, size):
+        return pagination.format_page(serialized_movies, paginator, paginated_movies, page, size)
+
+    @staticmethod
+    def get_movies_by_cursor(filters, cursor, size, fields=None):
+        after_id = pagination.decode_cursor(cursor)
+        movies = MovieRepository.get_movies_after(filters, after_id, size + 1, fields)
+        return MovieService.format_cursor_page(movies, cursor, size, fields)
+
+    @staticmethod
+    async def aget_movies_by_cursor(filters, cursor, size, fields=None):
+        after_id = pagination.decode_cursor(cursor)
+        movies = await MovieRepository.aget_movies_after(filters, after_id, size + 1, fields)
+        return MovieService.format_cursor_page(movies, cursor, size, fields)
+
+    @staticmethod
+    def format_cursor_page(movies, cursor, size, fields=None):
+        movies, next_cursor = pagination.split_cursor_page(movies, size)
+        serialized_movies = MovieService.serialize(movies, fields)
+        return pagination.format_cursor_page(serialized_movies, cursor, next_cursor, size)
+
+    @staticmethod
+    def get_export_chunk_size():
+        return getattr(settings, "MOVIES_EXPORT_CHUNK_SIZE", MovieService.DEFAULT_EXPORT_CHUNK_SIZE)
+
+    @staticmethod
+    def export_row(row):
+        """A row of MovieRepository.iter_movie_rows in the MovieSerializer representation."""
+        return {
+            "id": row["id"],
+            "title": row["title"],
+            "year": row["year"],
+            "winner": row["winner"],
+            "producer_name": row["producer_names"],
+            "studio_name": row["studio_names"]
+        }
+
+    @staticmethod
+    def export_movies_ndjson(filters=None):
+        """
+        Every movie matching `filters` as NDJSON text chunks, one movie per
+        line, read in MOVIES_EXPORT_CHUNK_SIZE batches. Filters are
+        validated before the first chunk, so errors surface as a 400.
+        """
+        filters = MovieService.parse_filters(filters or {})
+        chunk_size = MovieService.get_export_chunk_size()
+        rows = MovieRepository.iter_movie_rows(filters, chunk_size)
+        return pagination.stream_ndjson(map(MovieService.export_row, rows), chunk_size)
+
+    @staticmethod
+    def aexport_movies_ndjson(filters=None):
+        filters = MovieService.parse_filters(filters or {})
+        chunk_size = MovieService.get_export_chunk_size()
+        rows = MovieRepository.aiter_movie_rows(filters, chunk_size)
+        return pagination.astream_ndjson(
+            (MovieService.export_row(row) async for row in rows), chunk_size
+        )
+
+    @staticmethod
+    def serialize(movies, fields=None):
+        return MovieSerializer(movies, many=True, fields=fields, context={'request': None}).data
+
+    @staticmethod
+    def get_movies_by_ids(ids, fields=None):
+        """The movies of an ?ids= lookup, in the caller's order, with the missing ids."""
+        try:
+            ids = pagination.parse_ids(ids)
+            fields = MovieService.parse_fields(fields)
+            return pagination.format_batch(
+                ids,
+                MovieRepository.get_movies_by_ids(ids, fields),
+                lambda movies: MovieService.serialize(movies, fields)
+            )
+        except ValueError as ve:
+            logger.warning(f"Invalid ids value: {ve}")
+            raise
+        except Exception as e:
+            logger.error(f"Error getting movies by ids: {e}")
+            raise
+
+    @staticmethod
+    async def aget_movies_by_ids(ids, fields=None):
+        try:
+            ids = pagination.parse_ids(ids)
+            fields = MovieService.parse_fields(fields)
+            return pagination.format_batch(
+                ids,
+                await MovieRepository.aget_movies_by_ids(ids, fields),
+                lambda movies: MovieService.serialize(movies, fields)
+            )
+        except ValueError as ve:
+            logger.warning(f"Invalid ids value: {ve}")
+            raise
+        except Exception as e:
+            logger.error(f"Error getting movies by ids: {e}")
+            raise
+
+    @staticmethod
+    def get_movie_by_id(movie_id, fields=None):
+        try:
+            movie = MovieRepository.get_movie_with_relations_by_id(movie_id, fields)
+            if not movie:
+                logger.warning(f"Movie with ID {movie_id} not found.")
+                return None
+            return movie
+        except Exception as e:
+            logger.error(f"Error getting movie by ID {movie_id}: {e}")
+            raise
 
     @staticmethod
-    def get_movie_by_id(movie_id):
+    async def aget_movie_by_id(movie_id, fields=None):
         try:
-            movie = MovieRepository.get_movie_by_id(movie_id)
+            movie = await MovieRepository.aget_movie_with_relations_by_id(movie_id, fields)
             if not movie:
                 logger.warning(f"Movie with ID {movie_id} not found.")
                 return None
@@ -157,22 +307,43 @@ class MovieService:
             logger.error(f"Error fetching years with multiple winners: {e}")
             raise
 
+    @staticmethod
+    async def aget_years_with_multiple_winners():
+        try:
+            return await MovieRepository.aget_years_with_multiple_winners()
+        except Exception as e:
+            logger.error(f"Error fetching years with multiple winners: {e}")
+            raise
+
     @staticmethod
     def get_studios_with_winners():
         try:
             studios_with_wins = MovieRepository.get_studios_with_winners()
-            formatted_studios = [
-                {
-                    "name": studio["studio__name"],
-                    "winCount": studio["wins"]
-                }
-                for studio in studios_with_wins
-            ]
-            return {"studios": formatted_studios}
+            return MovieService.format_studios_with_winners(studios_with_wins)
         except Exception as e:
             logger.error(f"Error fetching studios with most wins: {e}")
             raise
 
+    @staticmethod
+    async def aget_studios_with_winners():
+        try:
+            studios_with_wins = await MovieRepository.aget_studios_with_winners()
+            return MovieService.format_studios_with_winners(studios_with_wins)
+        except Exception as e:
+            logger.error(f"Error fetching studios with most wins: {e}")
+            raise
+
+    @staticmethod
+    def format_studios_with_winners(studios_with_wins):
+        formatted_studios = [
+            {
+                "name": studio["studio__name"],
+                "winCount": studio["wins"]
+            }
+            for studio in studios_with_wins
+        ]
+        return {"studios": formatted_studios}
+
     @staticmethod
     def get_producers_with_winner_intervals():
         try:
@@ -182,31 +353,23 @@ class MovieService:
             logger.error(f"Error fetching producers with winner intervals: {e}")
             raise
 
+    @staticmethod
+    async def aget_producers_with_winner_intervals():
+        try:
+            return await MovieRepository.aget_producers_with_winner_intervals()
+        except Exception as e:
+            logger.error(f"Error fetching producers with winner intervals: {e}")
+            raise
+
     @staticmethod
     def get_movies_with_winner(filters=None):
         try:
             if filters is None:
                 filters = {}
-            if "winner" in filters:
-                winner = filters["winner"].lower()
-                if winner in ["true", "1"]:
-                    filters["winner"] = True
-                elif winner in ["false", "0"]:
-                    filters["winner"] = False
-                else:
-                    raise ValueError("Invalid value for 'winner'. Expected 'true', 'false'")
-            if "year" in filters:
-                try:
-                    filters["year"] = int(filters["year"])
-                except ValueError:
-                    raise ValueError("Invalid value for 'year'. Expected an integer.")
-            movies = MovieRepository.get_all_movies(filters)
-            serialized_movies = MovieSerializer(
-                movies,
-                many=True,
-                context={'request': None}
-            ).data
-            return serialized_movies
+            MovieService.parse_filters(filters)
+            fields = MovieService.parse_fields(filters.pop("fields", None))
+            movies = MovieRepository.get_all_movies(filters, fields)
+            return MovieService.serialize(movies, fields)
         except ValueError as ve:
             logger.warning(f"Invalid filter value: {ve}")
             raise
@@ -214,15 +377,292 @@ class MovieService:
             logger.error(f"Error getting movies with filters {filters}: {e}")
             raise
 
+    @staticmethod
+    async def aget_movies_with_winner(filters=None):
+        try:
+            if filters is None:
+                filters = {}
+            MovieService.parse_filters(filters)
+            fields = MovieService.parse_fields(filters.pop("fields", None))
+            movies = await MovieRepository.aget_movies(filters, fields=fields)
+            return MovieService.serialize(movies, fields)
+        except ValueError as ve:
+            logger.warning(f"Invalid filter value: {ve}")
+            raise
+        except Exception as e:
+            logger.error(f"Error getting movies with filters {filters}: {e}")
+            raise
+
+
+
+
+class MovieExportService:
+    """
+    Bulk export of the catalog for backups and warehouse loads.
+
+    "csv" writes the importer's format, so an export can be imported
+    again unchanged. The columnar formats add the movie id: "parquet"
+    and "feather" need pyarrow, "npz" only NumPy, and "columnar" picks
+    the best one installed. Every format is written one chunk of
+    MOVIES_EXPORT_CHUNK_SIZE movies at a time.
+    """
+    FORMATS = ["csv", "columnar", "parquet", "feather", "npz"]
+
+    @staticmethod
+    def resolve_format(export_format):
+        export_format = (export_format or "csv").lower()
+        available = export.get_available_formats()
+        if export_format == "columnar":
+            return "parquet" if "parquet" in available else "npz"
+        if export_format not in MovieExportService.FORMATS:
+            raise ValueError(
+                f"Invalid export format '{export_format}'. Expected one of: {', '.join(MovieExportService.FORMATS)}."
+            )
+        if export_format not in available:
+            raise ValueError(f"The '{export_format}' format requires pyarrow, which is not installed.")
+        return export_format
+
+    @staticmethod
+    def export_movies(export_format="csv", filters=None):
+        """
+        Returns (writer, chunks): the writer's content_type and extension
+        describe the output, and chunks yields its bytes.
+        """
+        filters = MovieService.parse_filters(filters or {})
+        writer = export.get_writer(MovieExportService.resolve_format(export_format))
+        movie_chunks = MovieRepository.iter_movie_chunks(filters, MovieService.get_export_chunk_size())
+        return writer, MovieExportService.write_chunks(writer, movie_chunks)
+
+    @staticmethod
+    def write_chunks(writer, movie_chunks):
+        yield writer.begin()
+        for chunk in movie_chunks:
+            yield writer.write(chunk)
+        yield writer.end()
+
+    @staticmethod
+    def aexport_movies(export_format="csv", filters=None):
+        filters = MovieService.parse_filters(filters or {})
+        writer = export.get_writer(MovieExportService.resolve_format(export_format))
+        movie_chunks = MovieRepository.aiter_movie_chunks(filters, MovieService.get_export_chunk_size())
+        return writer, MovieExportService.awrite_chunks(writer, movie_chunks)
+
+    @staticmethod
+    async def awrite_chunks(writer, movie_chunks):
+        yield writer.begin()
+        async for chunk in movie_chunks:
+            yield writer.write(chunk)
+        yield writer.end()
+
+
+class MovieBulkService:
+    """
+    Create, update and delete many movies in one request.
+
+    Operations are validated one by one; the valid ones are written
+    together by MovieRepository.bulk_write_movies. Failures are reported
+    per operation without stopping the rest, unless all_or_nothing is
+    set, in which case a single failure leaves the catalog untouched.
+    """
+    DEFAULT_MAX_OPERATIONS = 1000
+    OPERATIONS = ["create", "update", "delete"]
+
+    @staticmethod
+    def get_max_operations():
+        return getattr(settings, "MOVIES_BULK_MAX_OPERATIONS", MovieBulkService.DEFAULT_MAX_OPERATIONS)
+
+    @staticmethod
+    def parse_names(names, field):
+        """Accepts names as strings or as {"name": ...} objects, like POST and PUT do."""
+        if not isinstance(names, list) or not names:
+            raise ValueError(f"'{field}' must be a non-empty list of names.")
+        parsed = []
+        for name in names:
+            if isinstance(name, dict):
+                name = name.get("name")
+            if not isinstance(name, str) or not name.strip():
+                raise ValueError(f"Invalid name in '{field}': {name!r}.")
+            parsed.append(name.strip())
+        return parsed
+
+    @staticmethod
+    def parse_operation(index, operation):
+        if not isinstance(operation, dict):
+            raise ValueError("Each operation must be an object.")
+        op = operation.get("op")
+        if op not in MovieBulkService.OPERATIONS:
+            raise ValueError(f"Invalid op {op!r}. Expected one of: {', '.join(MovieBulkService.OPERATIONS)}.")
+        parsed = {"index": index, "op": op}
+        if op != "create":
+            movie_id = operation.get("id")
+            if not isinstance(movie_id, int) or isinstance(movie_id, bool):
+                raise ValueError(f"'{op}' requires the integer 'id' of the movie.")
+            parsed["id"] = movie_id
+        if op == "delete":
+            return parsed
+
+        title = operation.get("title")
+        if title is not None:
+            if not isinstance(title, str) or not title.strip():
+                raise ValueError("'title' must be a non-empty string.")
+            if len(title.strip()) > Movie._meta.get_field("title").max_length:
+                raise ValueError("'title' is too long.")
+            parsed["title"] = title.strip()
+        year = operation.get("year")
+        if year is not None:
+            if not isinstance(year, int) or isinstance(year, bool) or year < 0:
+                raise ValueError("'year' must be a positive integer.")
+            parsed["year"] = year
+        winner = operation.get("winner")
+        if winner is not None:
+            if not isinstance(winner, bool):
+                raise ValueError("'winner' must be true or false.")
+            parsed["winner"] = winner
+        for field, key in (("producer", "producers"), ("studio", "studios")):
+            if operation.get(field) is not None:
+                parsed[key] = MovieBulkService.parse_names(operation[field], field)
+
+        if op == "create":
+            missing = [
+                field for field, key in (("title", "title"), ("year", "year"), ("producer", "producers"), ("studio", "studios"))
+                if key not in parsed
+            ]
+            if missing:
+                raise ValueError(f"'create' requires {', '.join(missing)}.")
+            parsed.setdefault("winner", False)
+        elif not parsed.keys() & {"title", "year", "winner", "producers", "studios"}:
+            raise ValueError("'update' requires at least one of title, year, winner, producer or studio.")
+        return parsed
+
+    @staticmethod
+    def parse_request(data):
+        """Accepts a list of operations or {"operations": [...], "allOrNothing": bool}."""
+        all_or_nothing = False
+        if isinstance(data, dict):
+            all_or_nothing = data.get("allOrNothing", False)
+            if not isinstance(all_or_nothing, bool):
+                raise ValueError("'allOrNothing' must be true or false.")
+            data = data.get("operations")
+        if not isinstance(data, list) or not data:
+            raise ValueError("A non-empty list of operations is required.")
+        max_operations = MovieBulkService.get_max_operations()
+        if len(data) > max_operations:
+            raise ValueError(f"At most {max_operations} operations are accepted per request.")
+        return data, all_or_nothing
+
+    @staticmethod
+    def apply(data):
+        operations, all_or_nothing = MovieBulkService.parse_request(data)
+        parsed = []
+        errors = {}
+        for index, operation in enumerate(operations):
+            try:
+                parsed.append(MovieBulkService.parse_operation(index, operation))
+            except ValueError as e:
+                errors[index] = str(e)
+
+        applied = {}
+        if not (errors and all_or_nothing):
+            applied, write_errors = MovieBulkService.write(parsed, all_or_nothing)
+            errors.update(write_errors)
+        return MovieBulkService.format_result(operations, all_or_nothing, applied, errors)
+
+    @staticmethod
+    def write(operations, all_or_nothing):
+        try:
+            return MovieRepository.bulk_write_movies(operations, all_or_nothing)
+        except Exception as e:
+            if all_or_nothing:
+                logger.error(f"Bulk write of {len(operations)} movie operations failed: {e}")
+                raise
+            logger.warning(f"Bulk write of {len(operations)} movie operations failed, retrying one by one: {e}")
+
+        applied = {}
+        errors = {}
+        for operation in operations:
+            try:
+                operation_applied, operation_errors = MovieRepository.bulk_write_movies([operation])
+                applied.update(operation_applied)
+                errors.update(operation_errors)
+            except Exception as e:
+                errors[operation["index"]] = str(e)
+        return applied, errors
+
+    @staticmethod
+    def format_result(operations, all_or_nothing, applied, errors):
+        statuses = {"create": "created", "update": "updated", "delete": "deleted"}
+        results = []
+        for index, operation in enumerate(operations):
+            op = operation.get("op") if isinstance(operation, dict) else None
+            result = {"index": index, "op": op}
+            if index in errors:
+                result.update(status="failed", error=errors[index])
+            elif index in applied:
+                result.update(status=statuses[op], id=applied[index])
+            else:
+                result["status"] = "skipped"
+            results.append(result)
+        return {
+            "allOrNothing": all_or_nothing,
+            "applied": len(applied),
+            "failed": len(errors),
+            "results": results
+        }
+
+
+class UploadedFileTextReader:
+    """
+    Read-only text stream over an uploaded file.
 
+    Pulls the upload chunk by chunk and decodes it incrementally, so only
+    the bytes the CSV parser asked for are held in memory.
+    """
+
+    def __init__(self, file, encoding="utf-8", chunk_size=64 * 1024):
+        if hasattr(file, "chunks"):
+            self.chunks = iter(file.chunks(chunk_size))
+        else:
+            self.chunks = iter(lambda: file.read(chunk_size), b"")
+        self.decoder = codecs.getincrementaldecoder(encoding)()
+        self.buffer = ""
+        self.exhausted = False
+
+    def read(self, size=-1):
+        while not self.exhausted and (size is None or size < 0 or len(self.buffer) < size):
+            chunk = next(self.chunks, None)
+            if chunk is None:
+                self.buffer += self.decoder.decode(b"", final=True)
+                self.exhausted = True
+            else:
+                self.buffer += self.decoder.decode(chunk)
+        if size is None or size < 0:
+            data, self.buffer = self.buffer, ""
+        else:
+            data, self.buffer = self.buffer[:size], self.buffer[size:]
+        return data
+
+    def __iter__(self):
+        return self
 
 
 class ImportMovieCSVService:
     REQUIRED_COLUMNS = {"year", "title", "studios", "producers", "winner"}
+    TEXT_COLUMNS = {"title": str, "studios": str, "producers": str}
+    WINNER_VALUES = ["yes", "y", "1", "sim"]
+    DEFAULT_BATCH_SIZE = 1000
 
     @staticmethod
-    def process_file(file):
+    def process_file(file, stream=None):
         ImportMovieCSVService.validate_file_type(file)
+        if stream is None:
+            stream = getattr(file, "size", 0) > settings.FILE_UPLOAD_MAX_MEMORY_SIZE
+        if stream:
+            accepted = []
+            errors = []
+            for result in ImportMovieCSVService.iter_file_batches(file):
+                accepted.extend(result["accepted"])
+                errors.extend(result["errors"])
+            return {"accepted": accepted, "errors": errors}
         try:
             file_content = file.read().decode("utf-8")
             data = pd.read_csv(StringIO(file_content), delimiter=";", engine="python")
@@ -231,6 +671,35 @@ class ImportMovieCSVService:
         ImportMovieCSVService.validate_file_header(data)
         return ImportMovieCSVService.process_data(data)
 
+    @staticmethod
+    def iter_file_batches(file, batch_size=None):
+        """
+        Streams the file through the importer one batch at a time.
+
+        Yields an {"accepted", "errors"} result per batch; memory use is
+        bounded by the batch size rather than the file size.
+        """
+        batch_size = batch_size or ImportMovieCSVService.get_batch_size()
+        try:
+            reader = pd.read_csv(
+                UploadedFileTextReader(file),
+                delimiter=";",
+                dtype=ImportMovieCSVService.TEXT_COLUMNS,
+                chunksize=batch_size
+            )
+        except Exception as e:
+            raise serializers.ValidationError(f"Error reading the file: {e}")
+        with reader:
+            while True:
+                try:
+                    data = next(reader)
+                except StopIteration:
+                    return
+                except Exception as e:
+                    raise serializers.ValidationError(f"Error reading the file: {e}")
+                ImportMovieCSVService.validate_file_header(data)
+                yield ImportMovieCSVService.process_data(data, batch_size)
+
     @staticmethod
     def validate_file_type(file):
         valid_extensions = [".csv", ".xls", ".xlsx"]
@@ -244,48 +713,179 @@ class ImportMovieCSVService:
             raise serializers.ValidationError(f"Invalid file header. Missing columns: {', '.join(missing_columns)}")
 
     @staticmethod
-    def normalize_winner(value):
-        """Normalize winner column to a boolean value."""
-        if pd.isna(value):
-            return False
-        if isinstance(value, str):
-            value = value.strip().lower()
-            if value in {"yes", "y", "1", "sim"}:
-                return True
-        elif isinstance(value, (int, float)) and value == 1:
-            return True
+    def get_batch_size():
+        return getattr(settings, "MOVIES_IMPORT_BATCH_SIZE", ImportMovieCSVService.DEFAULT_BATCH_SIZE)
+
+    @staticmethod
+    def normalize_winners(series):
+        """
+        Normalizes the winner column to booleans: WINNER_VALUES (any case,
+        surrounding spaces ignored) and the number 1 are winners; anything
+        else, including empty cells, is not.
+        """
+        if pd.api.types.is_bool_dtype(series):
+            return series.fillna(False).astype(bool)
+        if pd.api.types.is_numeric_dtype(series):
+            return (series == 1).to_numpy()
+        text = series.str.strip().str.lower()
+        numeric = pd.to_numeric(series.where(text.isna()), errors="coerce")
+        return (text.isin(ImportMovieCSVService.WINNER_VALUES) | (numeric == 1)).to_numpy()
 
-        return False
+    @staticmethod
+    def text_mask(series):
+        try:
+            return series.str.len().notna().to_numpy()
+        except AttributeError:
+            return np.zeros(len(series), dtype=bool)
 
     @staticmethod
-    def process_data(dataframe):
-        accepted = []
-        errors = []
+    def coerce_years(series):
+        """Returns (years, valid mask) following int() semantics."""
+        if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+            values = series.to_numpy(dtype="float64", na_value=np.nan)
+            valid = np.isfinite(values)
+        else:
+            is_text = ImportMovieCSVService.text_mask(series)
+            text = series.where(is_text)
+            text_valid = text.str.fullmatch(r"\s*[+-]?\d+\s*").fillna(False).to_numpy(dtype=bool)
+            text_values = pd.to_numeric(text.where(text_valid).str.strip(), errors="coerce")
+            other_values = pd.to_numeric(series.where(~is_text), errors="coerce")
+            values = text_values.fillna(other_values).to_numpy(dtype="float64", na_value=np.nan)
+            valid = text_valid | (~is_text & np.isfinite(other_values.to_numpy(dtype="float64", na_value=np.nan)))
+        return np.trunc(np.where(valid, values, 0)).astype("int64"), valid
+
+    @staticmethod
+    def split_names(series):
+        return (
+            series.str.replace(r"\s*,\s*", ",", regex=True)
+            .str.strip()
+            .str.split(",")
+        )
+
+    @staticmethod
+    def normalize_rows(dataframe):
+        """
+        Parses a dataframe into import rows with column-wise operations.
+
+        Returns the valid rows and the errors for the rest; a row is
+        rejected on its first invalid column, checked in the order title,
+        year, studios, producers.
+        """
         try:
-            dataframe["winner"] = dataframe["winner"].apply(ImportMovieCSVService.normalize_winner)
+            winners = ImportMovieCSVService.normalize_winners(dataframe["winner"])
         except Exception as e:
             raise serializers.ValidationError(f"Error processing 'winner' column: {e}")
 
-        for _, row in dataframe.iterrows():
-            try:
-                title = row["title"].strip()
-                year = int(row["year"])
-                studios = [name.strip() for name in row["studios"].split(",")]
-                producers = [name.strip() for name in row["producers"].split(",")]
-                winner = row["winner"]
-                movie = MovieService.create_movie(title, year, producers, studios, winner)
-                accepted.append({
-                    "title": title,
-                    "year": year,
-                    "producers": producers,
-                    "studios": studios,
-                    "winner": winner
-                })
-            except Exception as e:
-                errors.append({
-                    "title": row.get("title", "Unknown"),
-                    "error": str(e)
+        title_valid = ImportMovieCSVService.text_mask(dataframe["title"])
+        years, year_valid = ImportMovieCSVService.coerce_years(dataframe["year"])
+        studios_valid = ImportMovieCSVService.text_mask(dataframe["studios"])
+        producers_valid = ImportMovieCSVService.text_mask(dataframe["producers"])
+        checks = [
+            (title_valid, "Invalid value for 'title'. Expected a text value."),
+            (year_valid, "Invalid value for 'year'. Expected an integer."),
+            (studios_valid, "Invalid value for 'studios'. Expected a comma-separated list."),
+            (producers_valid, "Invalid value for 'producers'. Expected a comma-separated list."),
+        ]
+        valid = title_valid & year_valid & studios_valid & producers_valid
+
+        lines = dataframe.index.to_numpy()
+        parse_errors = []
+        if not valid.all():
+            messages = np.select(
+                [~mask for mask, _ in checks], [message for _, message in checks], default=""
+            )
+            raw_titles = dataframe["title"].where(dataframe["title"].notna(), "Unknown").tolist()
+            for position in np.flatnonzero(~valid):
+                parse_errors.append({
+                    "line": lines[position],
+                    "title": raw_titles[position],
+                    "error": messages[position]
                 })
 
-        return {"accepted": accepted, "errors": errors}
+        valid_frame = dataframe[valid]
+        rows = [
+            {
+                "line": line,
+                "title": title,
+                "year": year,
+                "studios": studios,
+                "producers": producers,
+                "winner": winner
+            }
+            for line, title, year, studios, producers, winner in zip(
+                lines[valid].tolist(),
+                valid_frame["title"].str.strip().tolist(),
+                years[valid].tolist(),
+                ImportMovieCSVService.split_names(valid_frame["studios"]).tolist(),
+                ImportMovieCSVService.split_names(valid_frame["producers"]).tolist(),
+                winners[valid].tolist()
+            )
+        ]
+        return rows, parse_errors
 
+    @staticmethod
+    def process_data(dataframe, batch_size=None):
+        rows, parse_errors = ImportMovieCSVService.normalize_rows(dataframe)
+        return ImportMovieCSVService.import_rows(rows, parse_errors, batch_size)
+
+    @staticmethod
+    def import_rows(rows, parse_errors=(), batch_size=None):
+        """
+        Persists parsed rows in batches, each inside its own transaction.
+
+        Rows carry a "line" key so errors can be reported in file order.
+        """
+        batch_size = batch_size or ImportMovieCSVService.get_batch_size()
+        accepted = []
+        errors = list(parse_errors)
+        for start in range(0, len(rows), batch_size):
+            batch_accepted, batch_errors = ImportMovieCSVService.persist_batch(
+                rows[start:start + batch_size]
+            )
+            accepted.extend(batch_accepted)
+            errors.extend(batch_errors)
+        metrics.IMPORT_ROWS.inc(len(accepted), importer="movies")
+        metrics.IMPORT_ERRORS.inc(len(errors), importer="movies")
+        return ImportMovieCSVService.format_result(accepted, errors)
+
+    @staticmethod
+    def persist_batch(rows):
+        try:
+            accepted, failed = MovieRepository.bulk_import_movies(rows)
+            return accepted, [
+                {"line": row["line"], "title": row["title"], "error": message}
+                for row, message in failed
+            ]
+        except Exception as e:
+            logger.warning(f"Bulk import of {len(rows)} rows failed, retrying row by row: {e}")
+
+        accepted = []
+        errors = []
+        for row in rows:
+            try:
+                MovieService.create_movie(
+                    row["title"], row["year"], row["producers"], row["studios"], row["winner"]
+                )
+                accepted.append(row)
+            except Exception as e:
+                errors.append({"line": row["line"], "title": row["title"], "error": str(e)})
+        return accepted, errors
+
+    @staticmethod
+    def format_result(accepted, errors):
+        return {
+            "accepted": [
+                {
+                    "title": row["title"],
+                    "year": row["year"],
+                    "producers": row["producers"],
+                    "studios": row["studios"],
+                    "winner": row["winner"]
+                }
+                for row in accepted
+            ],
+            "errors": [
+                {"title": error["title"], "error": error["error"]}
+                for error in sorted(errors, key=lambda error: error["line"])
+            ]
+        }
@@ -0,0 +1,91 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from Core.Movies.models import Movie
+from Core.Movies.repository import YearWinnerCountRepository
+from Core.Producers.repository import ProducerWinIntervalRepository
+from Core.Studio.repository import StudioWinCountRepository
+
+
+def get_producer_ids(movie):
+    return list(Movie.producer.through.objects.filter(movie_id=movie.pk).values_list('producer_id', flat=True))
+
+
+def get_studio_ids(movie):
+    return list(Movie.studio.through.objects.filter(movie_id=movie.pk).values_list('studio_id', flat=True))
+
+
+def counts_as_winner(movie):
+    # The aggregates follow the stored row, which a PUT only updates after
+    # setting the relations, so an unsaved winner=False still counts here.
+    return movie.winner or Movie.objects.filter(pk=movie.pk, winner=True).exists()
+
+
+@receiver(pre_save, sender=Movie)
+def remember_previous_state_on_movie_save(sender, instance, **kwargs):
+    instance._previous_state = None
+    if instance.pk is not None:
+        instance._previous_state = (
+            Movie.objects.filter(pk=instance.pk).values_list('year', 'winner').first()
+        )
+
+
+@receiver(post_save, sender=Movie)
+def refresh_aggregates_on_movie_save(sender, instance, created, **kwargs):
+    previous_year, previous_winner = getattr(instance, '_previous_state', None) or (None, False)
+    if not (previous_winner or instance.winner):
+        return
+    YearWinnerCountRepository.refresh_years(
+        year for year in (previous_year, instance.year) if year is not None
+    )
+    if created:
+        return
+    if previous_winner != instance.winner:
+        StudioWinCountRepository.refresh_studios(get_studio_ids(instance))
+    ProducerWinIntervalRepository.refresh_producers(get_producer_ids(instance))
+
+
+@receiver(pre_delete, sender=Movie)
+def remember_relations_on_movie_delete(sender, instance, **kwargs):
+    if instance.winner:
+        instance._interval_producer_ids = get_producer_ids(instance)
+        instance._win_count_studio_ids = get_studio_ids(instance)
+
+
+@receiver(post_delete, sender=Movie)
+def refresh_aggregates_on_movie_delete(sender, instance, **kwargs):
+    if not instance.winner:
+        return
+    ProducerWinIntervalRepository.refresh_producers(getattr(instance, '_interval_producer_ids', []))
+    StudioWinCountRepository.refresh_studios(getattr(instance, '_win_count_studio_ids', []))
+    YearWinnerCountRepository.refresh_years([instance.year])
+
+
+@receiver(m2m_changed, sender=Movie.producer.through)
+def refresh_intervals_on_producers_change(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ('pre_clear', 'post_clear', 'post_add', 'post_remove'):
+        return
+    if not reverse and not counts_as_winner(instance):
+        return
+    if action == 'pre_clear':
+        instance._interval_producer_ids = [instance.pk] if reverse else get_producer_ids(instance)
+        return
+    if action == 'post_clear':
+        ProducerWinIntervalRepository.refresh_producers(instance._interval_producer_ids)
+    elif action in ('post_add', 'post_remove'):
+        ProducerWinIntervalRepository.refresh_producers([instance.pk] if reverse else pk_set)
+
+
+@receiver(m2m_changed, sender=Movie.studio.through)
+def refresh_win_counts_on_studios_change(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ('pre_clear', 'post_clear', 'post_add', 'post_remove'):
+        return
+    if not reverse and not counts_as_winner(instance):
+        return
+    if action == 'pre_clear':
+        instance._win_count_studio_ids = [instance.pk] if reverse else get_studio_ids(instance)
+        return
+    if action == 'post_clear':
+        StudioWinCountRepository.refresh_studios(instance._win_count_studio_ids)
+    elif action in ('post_add', 'post_remove'):
+        StudioWinCountRepository.refresh_studios([instance.pk] if reverse else pk_set)
@@ -0,0 +1,176 @@
+import asyncio
+import json
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.signals import request_finished, request_started
+from django.db import close_old_connections
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from Core.Movies.service import MovieService
+from Core.Producers.models import Producer
+from django_GoldenRaspberryAwards.asgi import application
+
+
+async def asgi_request(path, query="", method="GET", headers=(), body=b""):
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query.encode(),
+        "root_path": "",
+        "headers": [(b"host", b"testserver"), (b"content-length", str(len(body)).encode()), *headers],
+        "client": ("127.0.0.1", 50000),
+        "server": ("testserver", 80),
+    }
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    await application(scope, receive, send)
+    start = messages[0]
+    headers = {name.lower(): value for name, value in start["headers"]}
+    return start["status"], headers, b"".join(message.get("body", b"") for message in messages[1:])
+
+
+@pytest.fixture
+def asgi_test_connections():
+    # Like Django's test client: keep the test transaction's connection open.
+    request_started.disconnect(close_old_connections)
+    request_finished.disconnect(close_old_connections)
+    yield
+    request_started.connect(close_old_connections)
+    request_finished.connect(close_old_connections)
+
+
+@pytest.fixture
+def token():
+    return str(RefreshToken.for_user(User.objects.create(username="async")).access_token)
+
+
+@pytest.fixture
+def catalog():
+    MovieService.create_movie("A", 1990, ["Alice", "Bob"], ["S1", "S2"], True)
+    MovieService.create_movie("B", 1990, ["Bob"], ["S1"], True)
+    MovieService.create_movie("C", 1995, ["Alice"], ["S2"], True)
+    MovieService.create_movie("D", 2001, ["Alice", "Carol"], ["S3"], True)
+    MovieService.create_movie("E", 2001, ["Carol"], ["S1"], False)
+    return MovieService.get_all_movies({})["content"]
+
+
+def sync_get(token, url, params):
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+    return client.get(url, params)
+
+
+def read_requests(catalog):
+    movie_id = catalog[0]["id"]
+    producer_id = Producer.objects.get(name="Alice").id
+    cursor = MovieService.get_all_movies({"cursor": "", "size": "2"})["next"]
+    return [
+        (reverse("movie-list"), {}),
+        (reverse("movie-list"), {"size": "2", "page": "2"}),
+        (reverse("movie-list"), {"size": "2", "page": "99"}),
+        (reverse("movie-list"), {"winner": "true", "year": "1990"}),
+        (reverse("movie-list"), {"winner": "maybe"}),
+        (reverse("movie-list"), {"year": "1800"}),
+        (reverse("movie-list"), {"cursor": cursor, "size": "2"}),
+        (reverse("movie-detail", kwargs={"movie_id": movie_id}), {}),
+        (reverse("movie-detail", kwargs={"movie_id": 999999}), {}),
+        (reverse("years-multiple-winners"), {}),
+        (reverse("studios-with-winners"), {}),
+        (reverse("producers-with-winner"), {}),
+        (reverse("year-with-winner"), {"winner": "true", "year": "2001"}),
+        (reverse("year-with-winner"), {"year": "x"}),
+        (reverse("producer-list"), {}),
+        (reverse("producer-detail", kwargs={"producer_id": producer_id}), {}),
+        (reverse("producer-detail", kwargs={"producer_id": 999999}), {}),
+        (reverse("studio-list"), {}),
+        (reverse("studio-detail", kwargs={"studio_id": 999999}), {}),
+    ]
+
+
+@pytest.mark.django_db
+def test_asgi_read_endpoints_return_the_sync_json(asgi_test_connections, token, catalog):
+    auth = [(b"authorization", f"Bearer {token}".encode())]
+    for url, params in read_requests(catalog):
+        cache.clear()
+        query = "&".join(f"{key}={value}" for key, value in params.items())
+        status, headers, body = async_to_sync(asgi_request)(url, query, headers=auth)
+        cache.clear()
+        expected = sync_get(token, url, params)
+
+        assert (url, params, status) == (url, params, expected.status_code)
+        assert body == expected.content, (url, params)
+        assert headers[b"content-type"] == b"application/json"
+
+
+@pytest.mark.django_db
+def test_asgi_cached_analytics_keep_etags(asgi_test_connections, token, catalog):
+    auth = [(b"authorization", f"Bearer {token}".encode())]
+    url = reverse("producers-with-winner")
+    first_status, first_headers, first_body = async_to_sync(asgi_request)(url, headers=auth)
+    etag = first_headers[b"etag"]
+
+    status, headers, body = async_to_sync(asgi_request)(url, headers=auth)
+    assert (status, body, headers[b"etag"]) == (first_status, first_body, etag)
+
+    status, _, body = async_to_sync(asgi_request)(url, headers=auth + [(b"if-none-match", etag)])
+    assert (status, body) == (304, b"")
+
+
+@pytest.mark.django_db
+def test_asgi_rejects_requests_like_the_sync_views(asgi_test_connections, catalog):
+    url = reverse("movie-list")
+    for headers in ([], [(b"authorization", b"Bearer not-a-token")]):
+        status, response_headers, body = async_to_sync(asgi_request)(url, headers=headers)
+        client = APIClient()
+        if headers:
+            client.credentials(HTTP_AUTHORIZATION="Bearer not-a-token")
+        expected = client.get(url)
+        assert status == expected.status_code == 401
+        assert json.loads(body) == json.loads(expected.content)
+        assert response_headers[b"www-authenticate"].decode() == expected["WWW-Authenticate"]
+
+
+@pytest.mark.django_db
+def test_asgi_writes_still_go_through_the_drf_views(asgi_test_connections, token):
+    status, _, body = async_to_sync(asgi_request)(
+        reverse("producer-list"),
+        method="POST",
+        headers=[
+            (b"authorization", f"Bearer {token}".encode()),
+            (b"content-type", b"application/json"),
+        ],
+        body=json.dumps({"name": "Dana"}).encode(),
+    )
+    assert status == 201
+    assert json.loads(body)["name"] == "Dana"
+    assert Producer.objects.filter(name="Dana").exists()
+
+
+@pytest.mark.django_db
+def test_asgi_serves_concurrent_requests(asgi_test_connections, token, catalog):
+    auth = [(b"authorization", f"Bearer {token}".encode())]
+
+    async def fetch_all():
+        return await asyncio.gather(*(
+            asgi_request(reverse("movie-list"), f"size=1&page={page}", headers=auth) for page in range(1, 6)
+        ))
+
+    responses = async_to_sync(fetch_all)()
+    assert [status for status, _, _ in responses] == [200] * 5
+    assert sorted(json.loads(body)["content"][0]["title"] for _, _, body in responses) == ["A", "B", "C", "D", "E"]
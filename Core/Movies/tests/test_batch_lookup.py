@@ -0,0 +1,92 @@
+import json
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.contrib.auth.models import User
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from Core.Movies.service import MovieService
+from Core.Movies.tests.test_async_read_path import asgi_request, asgi_test_connections  # noqa: F401
+from Core.Producers.models import Producer
+from Core.Studio.models import Studio
+
+
+@pytest.fixture
+def api_client():
+    client = APIClient()
+    client.force_authenticate(user=User.objects.create(username="batch"))
+    return client
+
+
+@pytest.fixture
+def catalog():
+    movies = [
+        MovieService.create_movie("A", 1990, ["Alice", "Bob"], ["S1"], True),
+        MovieService.create_movie("B", 1995, ["Bob"], ["S2", "S1"], False),
+        MovieService.create_movie("C", 2000, ["Carol"], ["S3"], True),
+    ]
+    return {
+        "movie-list": [movie.id for movie in movies],
+        "producer-list": list(Producer.objects.order_by("id").values_list("id", flat=True)),
+        "studio-list": list(Studio.objects.order_by("id").values_list("id", flat=True)),
+    }
+
+
+def detail(api_client, url_name, object_id):
+    name = url_name.replace("-list", "-detail")
+    body = api_client.get(reverse(name, kwargs={f"{name.split('-')[0]}_id": object_id})).json()
+    return body.get("movie", body)
+
+
+def as_ids(ids):
+    return ",".join(str(object_id) for object_id in ids)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("url_name", ["movie-list", "producer-list", "studio-list"])
+def test_batch_lookup_keeps_the_callers_order_and_reports_missing_ids(api_client, catalog, url_name):
+    ids = catalog[url_name]
+    requested = [ids[2], 999999, ids[0], ids[2], ids[1]]
+    response = api_client.get(reverse(url_name), {"ids": as_ids(requested)})
+    assert response.status_code == 200
+    assert response.json() == {
+        "content": [detail(api_client, url_name, object_id) for object_id in (ids[2], ids[0], ids[1])],
+        "missing": [999999],
+    }
+    assert api_client.get(reverse(url_name), {"ids": "1,x"}).status_code == 400
+    assert api_client.get(reverse(url_name), {"ids": ""}).status_code == 400
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("url_name,budget", [("movie-list", 3), ("producer-list", 1), ("studio-list", 1)])
+def test_batch_lookup_query_count_does_not_grow_with_the_ids(
+    api_client, catalog, django_assert_num_queries, url_name, budget
+):
+    with django_assert_num_queries(budget):
+        api_client.get(reverse(url_name), {"ids": as_ids(catalog[url_name])})
+
+
+@pytest.mark.django_db
+def test_batch_lookup_is_capped(api_client, settings):
+    settings.BATCH_MAX_IDS = 3
+    assert api_client.get(reverse("producer-list"), {"ids": "1,2,3"}).status_code == 200
+    assert api_client.get(reverse("producer-list"), {"ids": "1,2,3,4"}).status_code == 400
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("url_name", ["movie-list", "producer-list", "studio-list"])
+def test_async_batch_lookup_matches_the_sync_view(asgi_test_connections, catalog, url_name):  # noqa: F811
+    user = User.objects.create(username="async-batch")
+    client = APIClient()
+    client.force_authenticate(user=user)
+    headers = [(b"authorization", f"Bearer {RefreshToken.for_user(user).access_token}".encode())]
+    ids = as_ids(list(reversed(catalog[url_name])) + [999999])
+
+    status, _, body = async_to_sync(asgi_request)(reverse(url_name), f"ids={ids}", headers=headers)
+    assert status == 200
+    assert json.loads(body) == client.get(reverse(url_name), {"ids": ids}).json()
+
+    status, _, _ = async_to_sync(asgi_request)(reverse(url_name), "ids=a", headers=headers)
+    assert status == 400
@@ -0,0 +1,142 @@
+import io
+import os
+
+import numpy as np
+import pytest
+from asgiref.sync import async_to_sync
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from Core.Movies import export
+from Core.Movies.models import Movie
+from Core.Movies.service import ImportMovieCSVService, MovieExportService, MovieService
+from Core.Movies.tests.test_async_read_path import asgi_request, asgi_test_connections  # noqa: F401
+from Core.Producers.models import Producer
+from Core.Studio.models import Studio
+
+CSV_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "import_csv_test.csv")
+
+
+@pytest.fixture
+def api_client():
+    client = APIClient()
+    client.force_authenticate(user=User.objects.create(username="bulk-export"))
+    return client
+
+
+@pytest.fixture
+def catalog(settings):
+    settings.MOVIES_EXPORT_CHUNK_SIZE = 7
+    with open(CSV_PATH, "rb") as file:
+        ImportMovieCSVService.process_file(SimpleUploadedFile("movies.csv", file.read()))
+    MovieService.create_movie('Quotes "and; separators"', 2001, ["Carol"], ["S; 1"], True)
+
+
+def export_bytes(export_format):
+    _, chunks = MovieExportService.export_movies(export_format)
+    return b"".join(chunks)
+
+
+def joined_names(through, movie, field):
+    return ", ".join(through.objects.filter(movie=movie).order_by("id").values_list(field, flat=True))
+
+
+def expected_columns():
+    # Names keep the order they were linked in, which is the order of the imported file.
+    movies = list(Movie.objects.order_by("id"))
+    return {
+        "id": [movie.id for movie in movies],
+        "year": [movie.year for movie in movies],
+        "title": [movie.title for movie in movies],
+        "studios": [joined_names(Movie.studio.through, movie, "studio__name") for movie in movies],
+        "producers": [joined_names(Movie.producer.through, movie, "producer__name") for movie in movies],
+        "winner": [movie.winner for movie in movies],
+    }
+
+
+@pytest.mark.django_db
+def test_csv_export_imports_back_unchanged(catalog):
+    exported = export_bytes("csv")
+    assert exported.startswith(b"year;title;studios;producers;winner\n")
+    assert b'2001;"Quotes ""and; separators""";"S; 1";Carol;yes\n' in exported
+
+    Movie.objects.all().delete()
+    Producer.objects.all().delete()
+    Studio.objects.all().delete()
+    result = ImportMovieCSVService.process_file(SimpleUploadedFile("export.csv", exported), stream=True)
+    assert not result["errors"]
+    assert export_bytes("csv") == exported
+
+
+@pytest.mark.django_db
+def test_npz_export_holds_every_column(catalog):
+    archive = np.load(io.BytesIO(export_bytes("npz")))
+    assert "title_00001" in archive.files
+    for column, values in expected_columns().items():
+        parts = sorted(name for name in archive.files if name.startswith(f"{column}_"))
+        assert np.concatenate([archive[name] for name in parts]).tolist() == values
+
+
+@pytest.mark.django_db
+def test_empty_npz_export():
+    archive = np.load(io.BytesIO(export_bytes("npz")))
+    assert archive["title_00000"].tolist() == []
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("export_format", ["parquet", "feather"])
+def test_arrow_exports(catalog, export_format):
+    pyarrow = pytest.importorskip("pyarrow")
+    data = io.BytesIO(export_bytes(export_format))
+    if export_format == "parquet":
+        import pyarrow.parquet
+        table = pyarrow.parquet.read_table(data)
+    else:
+        import pyarrow.feather
+        table = pyarrow.feather.read_table(data)
+    assert table.to_pydict() == expected_columns()
+
+
+@pytest.mark.django_db
+def test_export_formats():
+    assert MovieExportService.resolve_format("CSV") == "csv"
+    assert MovieExportService.resolve_format("columnar") == ("parquet" if export.pyarrow else "npz")
+    with pytest.raises(ValueError):
+        MovieExportService.resolve_format("xml")
+    if export.pyarrow is None:
+        with pytest.raises(ValueError):
+            MovieExportService.resolve_format("feather")
+
+
+@pytest.mark.django_db
+def test_export_endpoint_and_command(api_client, catalog, tmp_path):
+    response = api_client.get(reverse("movie-bulk-export", kwargs={"export_format": "csv"}))
+    assert response.status_code == 200
+    assert response["Content-Type"] == "text/csv"
+    assert response["Content-Disposition"] == 'attachment; filename="movies.csv"'
+    assert b"".join(response.streaming_content) == export_bytes("csv")
+
+    response = api_client.get(reverse("movie-bulk-export", kwargs={"export_format": "npz"}), {"winner": "true"})
+    assert np.load(io.BytesIO(b"".join(response.streaming_content)))["winner_00000"].all()
+
+    assert api_client.get(reverse("movie-bulk-export", kwargs={"export_format": "xml"})).status_code == 400
+
+    output = tmp_path / "movies.csv"
+    call_command("export_movies", str(output), "--format", "csv", stdout=io.StringIO())
+    assert output.read_bytes() == export_bytes("csv")
+
+
+@pytest.mark.django_db
+def test_async_export_matches_the_sync_view(asgi_test_connections, api_client, catalog):  # noqa: F811
+    token = str(RefreshToken.for_user(User.objects.create(username="async-bulk-export")).access_token)
+    headers = [(b"authorization", f"Bearer {token}".encode())]
+    path = reverse("movie-bulk-export", kwargs={"export_format": "csv"})
+
+    status, response_headers, body = async_to_sync(asgi_request)(path, headers=headers)
+    assert status == 200
+    assert response_headers[b"content-type"] == b"text/csv"
+    assert body == export_bytes("csv")
@@ -0,0 +1,201 @@
+import pytest
+from django.contrib.auth.models import User
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from Core.Movies.models import Movie, YearWinnerCount
+from Core.Movies.repository import YearWinnerCountRepository
+from Core.Movies.service import MovieService
+from Core.Producers.models import Producer, ProducerWinInterval
+from Core.Producers.repository import ProducerWinIntervalRepository
+from Core.Search.service import SearchService
+from Core.Studio.models import StudioWinCount
+from Core.Studio.repository import StudioWinCountRepository
+from Core.Winners.models import Winner
+
+
+@pytest.fixture
+def api_client():
+    client = APIClient()
+    client.force_authenticate(user=User.objects.create(username="bulk"))
+    return client
+
+
+@pytest.fixture
+def catalog():
+    return {
+        movie.title: movie.id
+        for movie in [
+            MovieService.create_movie("A", 1990, ["Alice"], ["S1"], True),
+            MovieService.create_movie("B", 1995, ["Alice", "Bob"], ["S2"], True),
+            MovieService.create_movie("C", 2000, ["Bob"], ["S1"], False),
+        ]
+    }
+
+
+def stored_aggregates():
+    return (
+        sorted(YearWinnerCount.objects.values_list("year", "winner_count")),
+        sorted(StudioWinCount.objects.values_list("studio_id", "win_count")),
+        sorted(ProducerWinInterval.objects.values_list("producer_id", "previous_win", "following_win")),
+    )
+
+
+def assert_aggregates_are_fresh():
+    stored = stored_aggregates()
+    YearWinnerCountRepository.rebuild_all()
+    StudioWinCountRepository.rebuild_all()
+    ProducerWinIntervalRepository.rebuild_all()
+    assert stored == stored_aggregates()
+
+
+def names(movie, relation):
+    return sorted(getattr(movie, relation).values_list("name", flat=True))
+
+
+@pytest.mark.django_db
+def test_bulk_applies_every_kind_of_operation(api_client, catalog):
+    response = api_client.post(reverse("movie-bulk"), [
+        {"op": "create", "title": "D", "year": 2005, "producer": ["Alice", " Carol "], "studio": ["S3"], "winner": True},
+        {"op": "update", "id": catalog["C"], "winner": True, "producer": [{"name": "Carol"}]},
+        {"op": "update", "id": catalog["B"], "title": "B2", "year": 1996},
+        {"op": "delete", "id": catalog["A"]},
+    ], format="json")
+    assert response.status_code == 200
+    body = response.json()
+    created = Movie.objects.get(title="D")
+    assert body["applied"] == 4 and body["failed"] == 0
+    assert [(result["op"], result["status"], result["id"]) for result in body["results"]] == [
+        ("create", "created", created.id),
+        ("update", "updated", catalog["C"]),
+        ("update", "updated", catalog["B"]),
+        ("delete", "deleted", catalog["A"]),
+    ]
+
+    assert names(created, "producer") == ["Alice", "Carol"] and names(created, "studio") == ["S3"]
+    updated = Movie.objects.get(id=catalog["C"])
+    assert updated.winner and names(updated, "producer") == ["Carol"] and names(updated, "studio") == ["S1"]
+    renamed = Movie.objects.get(id=catalog["B"])
+    assert (renamed.title, renamed.year, renamed.winner) == ("B2", 1996, True)
+    assert names(renamed, "producer") == ["Alice", "Bob"]
+    assert not Movie.objects.filter(id=catalog["A"]).exists()
+    assert Producer.objects.filter(name="Carol").count() == 1
+    assert_aggregates_are_fresh()
+    assert [row["title"] for row in SearchService.search("carol", kind="movie")["results"]] == ["C", "D"]
+    assert [row["title"] for row in SearchService.search("b2", kind="movie")["results"]] == ["B2"]
+
+
+@pytest.mark.django_db
+def test_bulk_writes_are_batched(api_client, catalog, django_assert_max_num_queries):
+    def operations(offset, count):
+        return [
+            {"op": "create", "title": f"New {offset + i}", "year": 2010 + i, "producer": [f"P{i}", "Alice"],
+             "studio": ["S1"], "winner": i % 2 == 0}
+            for i in range(count)
+        ]
+
+    with django_assert_max_num_queries(60) as small:
+        api_client.post(reverse("movie-bulk"), operations(0, 2), format="json")
+    with django_assert_max_num_queries(60) as large:
+        api_client.post(reverse("movie-bulk"), operations(100, 40), format="json")
+    assert len(large.captured_queries) == len(small.captured_queries)
+    assert Movie.objects.filter(title__startswith="New ").count() == 42
+    assert_aggregates_are_fresh()
+
+
+@pytest.mark.django_db
+def test_bulk_reports_failures_and_applies_the_rest(api_client, catalog):
+    response = api_client.post(reverse("movie-bulk"), {"operations": [
+        {"op": "create", "title": "E", "year": 2001, "producer": ["Dave"], "studio": ["S4"]},
+        {"op": "create", "title": "A", "year": 2002, "producer": ["Dave"], "studio": ["S4"]},
+        {"op": "create", "title": "E", "year": 2003, "producer": ["Dave"], "studio": ["S4"]},
+        {"op": "update", "id": 999999, "year": 2004},
+        {"op": "update", "id": catalog["B"]},
+        {"op": "delete", "id": catalog["C"]},
+        {"op": "update", "id": catalog["C"], "year": 2005},
+        {"op": "create", "title": "F", "producer": ["Dave"], "studio": ["S4"]},
+        {"op": "rename"},
+    ]}, format="json")
+    assert response.status_code == 200
+    body = response.json()
+    assert [result["status"] for result in body["results"]] == [
+        "created", "failed", "failed", "failed", "failed", "deleted", "failed", "failed", "failed"
+    ]
+    assert body["applied"] == 2 and body["failed"] == 7
+    errors = [result.get("error") for result in body["results"]]
+    assert errors[1] == "Movie 'A' already exists."
+    assert errors[3] == "Movie with ID 999999 not found."
+    assert errors[7] == "'create' requires year."
+    assert sorted(Movie.objects.values_list("title", flat=True)) == ["A", "B", "E"]
+    assert Movie.objects.get(title="E").year == 2001
+    assert_aggregates_are_fresh()
+
+
+@pytest.mark.django_db
+def test_bulk_title_of_a_deleted_movie_can_be_reused(api_client, catalog):
+    body = api_client.post(reverse("movie-bulk"), [
+        {"op": "create", "title": "A", "year": 1990, "producer": ["Alice"], "studio": ["S9"], "winner": True},
+        {"op": "delete", "id": catalog["A"]},
+    ], format="json").json()
+    assert body["failed"] == 0
+    assert names(Movie.objects.get(title="A"), "studio") == ["S9"]
+    assert_aggregates_are_fresh()
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("all_or_nothing", [False, True])
+def test_bulk_delete_cascades_to_winner_rows(api_client, catalog, all_or_nothing):
+    Winner.objects.create(award="Worst Picture", year=1990, movie_id=catalog["A"])
+    Winner.objects.create(award="Worst Picture", year=2000, movie_id=catalog["C"])
+    response = api_client.post(reverse("movie-bulk"), {"allOrNothing": all_or_nothing, "operations": [
+        {"op": "delete", "id": catalog["A"]},
+        {"op": "delete", "id": catalog["C"]},
+    ]}, format="json")
+    assert response.status_code == 200
+    assert [result["status"] for result in response.json()["results"]] == ["deleted", "deleted"]
+    assert sorted(Movie.objects.values_list("title", flat=True)) == ["B"]
+    assert not Winner.objects.exists()
+    assert_aggregates_are_fresh()
+
+
+@pytest.mark.django_db
+def test_bulk_all_or_nothing_writes_nothing_on_failure(api_client, catalog):
+    before = sorted(Movie.objects.values_list("id", "title", "year", "winner"))
+    aggregates = stored_aggregates()
+    response = api_client.post(reverse("movie-bulk"), {"allOrNothing": True, "operations": [
+        {"op": "create", "title": "E", "year": 2001, "producer": ["Dave"], "studio": ["S4"]},
+        {"op": "delete", "id": catalog["A"]},
+        {"op": "update", "id": catalog["B"], "title": "C"},
+    ]}, format="json")
+    assert response.status_code == 400
+    assert [result["status"] for result in response.json()["results"]] == ["skipped", "skipped", "failed"]
+    assert response.json()["applied"] == 0
+    assert sorted(Movie.objects.values_list("id", "title", "year", "winner")) == before
+    assert stored_aggregates() == aggregates
+    assert not Producer.objects.filter(name="Dave").exists()
+
+    response = api_client.post(reverse("movie-bulk"), {"allOrNothing": True, "operations": [
+        {"op": "create", "title": "E", "year": 2001, "producer": ["Dave"], "studio": ["S4"]},
+        {"op": "update", "id": catalog["B"], "year": "soon"},
+    ]}, format="json")
+    assert response.status_code == 400
+    assert not Movie.objects.filter(title="E").exists()
+
+    response = api_client.post(reverse("movie-bulk"), {"allOrNothing": True, "operations": [
+        {"op": "create", "title": "E", "year": 2001, "producer": ["Dave"], "studio": ["S4"]},
+        {"op": "delete", "id": catalog["A"]},
+    ]}, format="json")
+    assert response.status_code == 200
+    assert sorted(Movie.objects.values_list("title", flat=True)) == ["B", "C", "E"]
+
+
+@pytest.mark.django_db
+def test_bulk_rejects_malformed_requests(api_client, settings):
+    settings.MOVIES_BULK_MAX_OPERATIONS = 2
+    url = reverse("movie-bulk")
+    assert api_client.post(url, [], format="json").status_code == 400
+    assert api_client.post(url, {"operations": "x"}, format="json").status_code == 400
+    assert api_client.post(url, {"operations": [{"op": "delete", "id": 1}], "allOrNothing": "yes"},
+                           format="json").status_code == 400
+    assert api_client.post(url, [{"op": "delete", "id": 1}] * 3, format="json").status_code == 400
+    assert APIClient().post(url, [{"op": "delete", "id": 1}], format="json").status_code == 401
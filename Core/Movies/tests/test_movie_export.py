@@ -0,0 +1,75 @@
+import json
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.contrib.auth.models import User
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from Core.Movies.models import Movie
+from Core.Movies.serializer import MovieSerializer
+from Core.Movies.service import MovieService
+from Core.Movies.tests.test_async_read_path import asgi_request, asgi_test_connections  # noqa: F401
+
+
+@pytest.fixture
+def api_client():
+    client = APIClient()
+    client.force_authenticate(user=User.objects.create(username="export"))
+    return client
+
+
+@pytest.fixture
+def catalog():
+    MovieService.create_movie("A", 1990, ["Alice", "Bob"], ["S1", "S2"], True)
+    MovieService.create_movie("B", 1990, ["Bob"], ["S1"], False)
+    MovieService.create_movie("C", 1995, ["Alice"], ["S2"], True)
+    MovieService.create_movie("D", 2001, ["Alice", "Carol"], ["S3"], True)
+    MovieService.create_movie("E", 2001, ["Carol"], ["S1"], False)
+
+
+def read_ndjson(response):
+    body = b"".join(response.streaming_content)
+    return [json.loads(line) for line in body.decode().splitlines()]
+
+
+@pytest.mark.django_db
+def test_export_streams_every_movie_like_the_serializer(api_client, catalog, settings, django_assert_num_queries):
+    settings.MOVIES_EXPORT_CHUNK_SIZE = 2
+    expected = MovieSerializer(
+        Movie.objects.prefetch_related("producer", "studio").order_by("id"), many=True
+    ).data
+
+    response = api_client.get(reverse("movie-export"))
+    assert response.status_code == 200
+    assert response["Content-Type"] == "application/x-ndjson"
+    # Three chunks of up to two movies: the movies, their producers and their studios.
+    with django_assert_num_queries(3 * 3):
+        parts = list(response.streaming_content)
+    assert len(parts) == 3
+    assert [json.loads(line) for line in b"".join(parts).decode().splitlines()] == expected
+
+
+@pytest.mark.django_db
+def test_export_filters(api_client, catalog):
+    rows = read_ndjson(api_client.get(reverse("movie-export"), {"winner": "true", "year": 1990}))
+    assert [row["title"] for row in rows] == ["A"]
+    assert read_ndjson(api_client.get(reverse("movie-export"), {"year": 1800})) == []
+    assert api_client.get(reverse("movie-export"), {"winner": "maybe"}).status_code == 400
+    assert APIClient().get(reverse("movie-export")).status_code == 401
+
+
+@pytest.mark.django_db
+def test_async_export_matches_the_sync_view(asgi_test_connections, api_client, catalog, settings):  # noqa: F811
+    settings.MOVIES_EXPORT_CHUNK_SIZE = 2
+    token = str(RefreshToken.for_user(User.objects.create(username="async-export")).access_token)
+    headers = [(b"authorization", f"Bearer {token}".encode())]
+
+    status, response_headers, body = async_to_sync(asgi_request)(reverse("movie-export"), headers=headers)
+    assert status == 200
+    assert response_headers[b"content-type"] == b"application/x-ndjson"
+    assert body == b"".join(api_client.get(reverse("movie-export")).streaming_content)
+
+    status, _, _ = async_to_sync(asgi_request)(reverse("movie-export"), "year=x", headers=headers)
+    assert status == 400
@@ -1,8 +1,10 @@
+import io
 import logging
 import sys
 import os
+import pandas as pd
 import pytest
-from Core.Movies.service import ImportMovieCSVService, MovieService
+from Core.Movies.service import ImportMovieCSVService, MovieService, UploadedFileTextReader
 from Core.Movies.models import Movie, Producer, Studio
 
 logging.basicConfig(level=logging.INFO)
@@ -78,3 +80,160 @@ def test_get_movies_with_winner():
         assert all(isinstance(producer, str) for producer in movie["producer_name"])
         assert "studio_name" in movie and isinstance(movie["studio_name"], list)
         assert all(isinstance(studio, str) for studio in movie["studio_name"])
+
+@pytest.mark.django_db(transaction=True)
+def test_get_all_movies_cursor_walks_every_movie_once():
+    setup_data()
+    seen = []
+    cursor = ""
+    while True:
+        result = MovieService.get_all_movies(filters={"cursor": cursor, "size": "50"})
+        seen.extend(movie["id"] for movie in result["content"])
+        if result["last"]:
+            assert result["next"] is None
+            break
+        cursor = result["next"]
+    assert seen == list(Movie.objects.order_by("id").values_list("id", flat=True))
+
+@pytest.mark.django_db(transaction=True)
+def test_get_all_movies_caps_page_size(settings):
+    setup_data()
+    settings.MOVIES_MAX_PAGE_SIZE = 20
+    result = MovieService.get_all_movies(filters={"size": "1000"})
+    assert result["size"] == 20
+    assert len(result["content"]) == 20
+    result = MovieService.get_all_movies(filters={"size": "1000", "cursor": ""})
+    assert len(result["content"]) == 20
+
+@pytest.mark.django_db(transaction=True)
+def test_get_all_movies_rejects_invalid_cursor():
+    with pytest.raises(ValueError):
+        MovieService.get_all_movies(filters={"cursor": "not-a-cursor"})
+
+def snapshot_catalog():
+    return sorted(
+        (
+            movie.title,
+            movie.year,
+            movie.winner,
+            sorted(producer.name for producer in movie.producer.all()),
+            sorted(studio.name for studio in movie.studio.all()),
+        )
+        for movie in Movie.objects.prefetch_related("producer", "studio")
+    )
+
+@pytest.mark.django_db(transaction=True)
+def test_bulk_import_matches_row_by_row_import():
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    with open(os.path.join(current_dir, "import_csv_test.csv"), "rb") as file:
+        data = pd.read_csv(file, delimiter=";")
+    result = ImportMovieCSVService.process_data(data.copy(), batch_size=7)
+    bulk_snapshot = snapshot_catalog()
+
+    Movie.objects.all().delete()
+    Producer.objects.all().delete()
+    Studio.objects.all().delete()
+    data["winner"] = ImportMovieCSVService.normalize_winners(data["winner"])
+    for _, row in data.iterrows():
+        MovieService.create_movie(
+            row["title"].strip(),
+            int(row["year"]),
+            [name.strip() for name in row["producers"].split(",")],
+            [name.strip() for name in row["studios"].split(",")],
+            row["winner"],
+        )
+
+    assert len(result["accepted"]) == len(data)
+    assert result["errors"] == []
+    assert bulk_snapshot == snapshot_catalog()
+
+@pytest.mark.django_db(transaction=True)
+def test_bulk_import_reports_conflicting_rows_in_order():
+    data = pd.DataFrame([
+        {"year": 1990, "title": "A", "studios": "S1", "producers": "P1, P2", "winner": "yes"},
+        {"year": 1991, "title": "A", "studios": "S1", "producers": "P1", "winner": ""},
+        {"year": 1992, "title": None, "studios": "S2", "producers": "P3", "winner": ""},
+        {"year": 1990, "title": "A", "studios": "S1", "producers": "P1", "winner": ""},
+        {"year": 1993, "title": "B", "studios": "S1, S2", "producers": "P2", "winner": "yes"},
+    ])
+    result = ImportMovieCSVService.process_data(data, batch_size=2)
+    assert [row["title"] for row in result["accepted"]] == ["A", "A", "B"]
+    assert [error["title"] for error in result["errors"]][0] == "A"
+    assert len(result["errors"]) == 2
+    assert Movie.objects.count() == 2
+    assert Studio.objects.count() == 2
+    assert sorted(Movie.objects.get(title="A").producer.values_list("name", flat=True)) == ["P1", "P2"]
+
+@pytest.mark.django_db(transaction=True)
+def test_streaming_import_matches_whole_file_import():
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    file_path = os.path.join(current_dir, "import_csv_test.csv")
+    with open(file_path, "rb") as file:
+        whole = ImportMovieCSVService.process_file(file, stream=False)
+    whole_snapshot = snapshot_catalog()
+
+    Movie.objects.all().delete()
+    with open(file_path, "rb") as file:
+        batches = list(ImportMovieCSVService.iter_file_batches(file, batch_size=16))
+
+    assert len(batches) > 1
+    assert [row for batch in batches for row in batch["accepted"]] == whole["accepted"]
+    assert [error for batch in batches for error in batch["errors"]] == whole["errors"]
+    assert snapshot_catalog() == whole_snapshot
+
+def test_uploaded_file_text_reader_decodes_across_chunk_boundaries():
+    content = "year;title\n1990;Amélie – 東京\n".encode("utf-8")
+    reader = UploadedFileTextReader(io.BytesIO(content), chunk_size=3)
+    assert reader.read(5) == "year;"
+    assert reader.read() == "title\n1990;Amélie – 東京\n"
+    assert reader.read() == ""
+
+def row_by_row_split(dataframe):
+    accepted, errors = [], []
+    winners = ImportMovieCSVService.normalize_winners(dataframe["winner"])
+    for (_, row), winner in zip(dataframe.iterrows(), winners):
+        try:
+            accepted.append({
+                "title": row["title"].strip(),
+                "year": int(row["year"]),
+                "studios": [name.strip() for name in row["studios"].split(",")],
+                "producers": [name.strip() for name in row["producers"].split(",")],
+                "winner": winner,
+            })
+        except Exception:
+            errors.append(row["title"])
+    return accepted, errors
+
+@pytest.mark.parametrize("data", [
+    {
+        "year": [1990, "1991", " 1992 ", "19x3", None, 1995.0, "-1", "1996"],
+        "title": [" A ", "B", 3, "D", "E", None, "G", "H"],
+        "studios": ["S1,S2", " S1 ,  S3 ", "S", "S", "S", "S", "S", None],
+        "producers": ["P1 and P2, P3", "P", "P", "P", "P", "P", "P", "P"],
+        "winner": ["yes", " Y ", "sim", "no", None, "1", 1, "Yes"],
+    },
+    {
+        "year": [1990.0, 1991.7, float("nan")],
+        "title": ["A", "B", "C"],
+        "studios": ["S, ", "S", "S"],
+        "producers": ["P", "P", "P"],
+        "winner": [1.0, float("nan"), 0.0],
+    },
+])
+def test_normalize_rows_matches_row_by_row_parsing(data):
+    dataframe = pd.DataFrame(data)
+    expected_accepted, expected_error_titles = row_by_row_split(dataframe.copy())
+    rows, errors = ImportMovieCSVService.normalize_rows(dataframe)
+    assert [{k: v for k, v in row.items() if k != "line"} for row in rows] == expected_accepted
+    assert [error["title"] for error in errors] == [
+        "Unknown" if pd.isna(title) else title for title in expected_error_titles
+    ]
+
+
+def test_normalize_winners():
+    text = pd.Series([" Yes", "y", "SIM", "1", 1, 1.0, "no", "", None, float("nan"), 2], dtype=object)
+    assert ImportMovieCSVService.normalize_winners(text).tolist() == [
+        True, True, True, True, True, True, False, False, False, False, False
+    ]
+    assert ImportMovieCSVService.normalize_winners(pd.Series([1.0, 0.0, float("nan")])).tolist() == [True, False, False]
+    assert ImportMovieCSVService.normalize_winners(pd.Series([True, False])).tolist() == [True, False]
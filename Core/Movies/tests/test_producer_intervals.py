@@ -0,0 +1,104 @@
+import pandas as pd
+import pytest
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from Core.Movies.models import Movie
+from Core.Movies.service import ImportMovieCSVService, MovieService
+from Core.Producers.models import Producer, ProducerWinInterval
+
+
+def create_winner(title, year, *producers, winner=True):
+    return MovieService.create_movie(title, year, list(producers), ["Studio"], winner)
+
+
+def intervals_of(name):
+    return sorted(
+        ProducerWinInterval.objects.filter(producer__name=name)
+        .values_list("previous_win", "following_win", "interval")
+    )
+
+
+@pytest.mark.django_db
+def test_intervals_use_consecutive_wins_and_keep_ties():
+    create_winner("A", 1990, "Alice")
+    create_winner("B", 1991, "Alice")
+    create_winner("C", 2010, "Alice")
+    create_winner("D", 2000, "Bob")
+    create_winner("E", 2001, "Bob")
+    create_winner("F", 1980, "Carol")
+    create_winner("G", 1999, "Carol")
+
+    result = MovieService.get_producers_with_winner_intervals()
+
+    assert result["min"] == [
+        {"producer": "Alice", "interval": 1, "previousWin": 1990, "followingWin": 1991},
+        {"producer": "Bob", "interval": 1, "previousWin": 2000, "followingWin": 2001},
+    ]
+    assert result["max"] == [
+        {"producer": "Alice", "interval": 19, "previousWin": 1991, "followingWin": 2010},
+        {"producer": "Carol", "interval": 19, "previousWin": 1980, "followingWin": 1999},
+    ]
+
+
+@pytest.mark.django_db
+def test_intervals_follow_movie_and_producer_changes():
+    first = create_winner("A", 1990, "Alice")
+    second = create_winner("B", 1995, "Alice", "Bob")
+    create_winner("C", 2000, "Bob")
+    assert intervals_of("Alice") == [(1990, 1995, 5)]
+    assert intervals_of("Bob") == [(1995, 2000, 5)]
+
+    second.year = 1992
+    second.save()
+    assert intervals_of("Alice") == [(1990, 1992, 2)]
+
+    second.producer.remove(Producer.objects.get(name="Bob"))
+    assert intervals_of("Bob") == []
+
+    Producer.objects.get(name="Bob").movies.add(first)
+    assert intervals_of("Bob") == [(1990, 2000, 10)]
+
+    first.winner = False
+    first.save()
+    assert intervals_of("Alice") == []
+
+    Movie.objects.get(title="C").delete()
+    assert intervals_of("Bob") == []
+
+
+@pytest.mark.django_db
+def test_bulk_import_refreshes_intervals_and_rebuild_matches():
+    data = pd.DataFrame([
+        {"year": 1990, "title": "A", "studios": "S", "producers": "Alice, Bob", "winner": "yes"},
+        {"year": 1993, "title": "B", "studios": "S", "producers": "Alice", "winner": "yes"},
+        {"year": 1994, "title": "C", "studios": "S", "producers": "Bob", "winner": ""},
+    ])
+    ImportMovieCSVService.process_data(data)
+    assert intervals_of("Alice") == [(1990, 1993, 3)]
+    assert intervals_of("Bob") == []
+
+    incremental = sorted(ProducerWinInterval.objects.values_list("producer_id", "previous_win", "following_win"))
+    call_command("rebuild_producer_intervals")
+    assert sorted(ProducerWinInterval.objects.values_list("producer_id", "previous_win", "following_win")) == incremental
+
+
+@pytest.mark.django_db
+def test_put_that_drops_winner_and_producers_refreshes_old_producers():
+    client = APIClient()
+    client.force_authenticate(user=User.objects.create(username="intervals"))
+    create_winner("A", 1990, "Alice")
+    second = create_winner("B", 1995, "Alice")
+    assert intervals_of("Alice") == [(1990, 1995, 5)]
+
+    response = client.put(
+        reverse("movie-detail", args=[second.id]),
+        {"title": "B", "year": 1995, "winner": False, "producer": [{"name": "Bob"}], "studio": [{"name": "Studio"}]},
+        format="json",
+    )
+
+    assert response.status_code == 200
+    assert intervals_of("Alice") == []
+    assert intervals_of("Bob") == []
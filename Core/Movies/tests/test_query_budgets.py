@@ -0,0 +1,72 @@
+import pytest
+from django.contrib.auth.models import User
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from Core.Movies.models import Movie
+from Core.Producers.models import Producer
+from Core.Studio.models import Studio
+
+
+def create_catalog(size):
+    producers = [Producer.objects.create(name=f"Producer {i}") for i in range(3)]
+    studios = [Studio.objects.create(name=f"Studio {i}") for i in range(3)]
+    for i in range(size):
+        movie = Movie.objects.create(title=f"Movie {i}", year=1980 + i % 5, winner=i % 2 == 0)
+        movie.producer.add(*producers[:1 + i % 3])
+        movie.studio.add(*studios[:1 + i % 2])
+    return Movie.objects.order_by('id').first()
+
+
+@pytest.fixture
+def api_client():
+    client = APIClient()
+    client.force_authenticate(user=User.objects.create(username="budget"))
+    return client
+
+
+QUERY_BUDGETS = [
+    ("movie-list", {}, {"size": 10}, 4),
+    ("movie-list", {}, {"size": 10, "winner": "true"}, 4),
+    ("movie-list", {}, {"size": 10, "cursor": ""}, 3),
+    ("movie-list", {}, {"size": 10, "fields": "id,title,year"}, 2),
+    ("movie-list", {}, {"size": 10, "cursor": "", "fields": "id,title,year"}, 1),
+    ("movie-list", {}, {"size": 10, "fields": "title,studio_name"}, 3),
+    ("year-with-winner", {}, {"winner": "true"}, 4),
+    ("year-with-winner", {}, {"winner": "true", "fields": "id,title,year"}, 2),
+    ("years-multiple-winners", {}, {}, 2),
+    ("studios-with-winners", {}, {}, 2),
+    ("producers-with-winner", {}, {}, 3),
+    ("producer-list", {}, {}, 1),
+    ("studio-list", {}, {}, 1),
+]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("catalog_size", [5, 30])
+@pytest.mark.parametrize("url_name,kwargs,params,budget", QUERY_BUDGETS)
+def test_list_endpoints_query_budget(
+    api_client, django_assert_num_queries, catalog_size, url_name, kwargs, params, budget
+):
+    create_catalog(catalog_size)
+    with django_assert_num_queries(budget):
+        response = api_client.get(reverse(url_name, kwargs=kwargs), params)
+    assert response.status_code == 200
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("url_name,kwarg,budget", [
+    ("movie-detail", "movie_id", 3),
+    ("producer-detail", "producer_id", 1),
+    ("studio-detail", "studio_id", 1),
+])
+def test_detail_endpoints_query_budget(api_client, django_assert_num_queries, url_name, kwarg, budget):
+    movie = create_catalog(5)
+    object_id = {
+        "movie_id": movie.id,
+        "producer_id": movie.producer.first().id,
+        "studio_id": movie.studio.first().id,
+    }[kwarg]
+    with django_assert_num_queries(budget):
+        response = api_client.get(reverse(url_name, kwargs={kwarg: object_id}))
+    assert response.status_code == 200
@@ -0,0 +1,50 @@
+import pytest
+from django.db import connection
+from django.db.models import Count
+
+from Core.Movies.models import Movie
+from Core.Studio.models import Studio
+
+pytestmark = pytest.mark.skipif(
+    connection.vendor != "sqlite", reason="EXPLAIN QUERY PLAN is SQLite specific"
+)
+
+
+def query_plan(queryset):
+    sql, params = queryset.query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+        return " | ".join(row[-1] for row in cursor.fetchall())
+
+
+@pytest.mark.django_db
+def test_winner_year_grouping_is_answered_from_an_index():
+    plan = query_plan(
+        Movie.objects.filter(winner=True).values("year").annotate(count=Count("id"))
+    )
+    assert "COVERING INDEX core_movie_" in plan
+
+
+@pytest.mark.django_db
+def test_year_filter_uses_index():
+    plan = query_plan(Movie.objects.filter(year=1990, winner=True).order_by("id"))
+    assert "USING INDEX core_movie_" in plan or "USING COVERING INDEX core_movie_" in plan
+
+
+@pytest.mark.django_db
+def test_studio_name_key_lookup_uses_index():
+    plan = query_plan(Studio.objects.filter(name_key="warner bros."))
+    assert "INDEX" in plan and "name_key=?" in plan
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("through,column,index", [
+    (Movie.producer.through, "producer_id", "core_movie_producer_producer_movie_idx"),
+    (Movie.studio.through, "studio_id", "core_movie_studio_studio_movie_idx"),
+])
+def test_analytics_joins_use_through_indexes(through, column, index):
+    plan = query_plan(
+        through.objects.filter(movie__winner=True, **{f"{column}__in": [1, 2, 3]})
+        .values_list(column, "movie__year")
+    )
+    assert index in plan
@@ -0,0 +1,97 @@
+import json
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.contrib.auth.models import User
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from Core.Movies.service import MovieService
+from Core.Movies.tests.test_async_read_path import asgi_request, asgi_test_connections  # noqa: F401
+
+
+@pytest.fixture
+def api_client():
+    client = APIClient()
+    client.force_authenticate(user=User.objects.create(username="fields"))
+    return client
+
+
+@pytest.fixture
+def catalog():
+    return [
+        MovieService.create_movie("A", 1990, ["Alice", "Bob"], ["S1"], True),
+        MovieService.create_movie("B", 1995, ["Bob"], ["S2"], False),
+        MovieService.create_movie("C", 1990, ["Carol"], ["S1", "S3"], True),
+    ]
+
+
+def pick(row, fields):
+    return {field: row[field] for field in fields}
+
+
+@pytest.mark.django_db
+def test_fields_trim_every_movie_response(api_client, catalog):
+    full = api_client.get(reverse("movie-list")).json()["content"]
+    fields = ["id", "title", "year"]
+
+    sparse = api_client.get(reverse("movie-list"), {"fields": "year, title,id"}).json()
+    assert sparse["content"] == [pick(row, fields) for row in full]
+    assert sparse["totalElements"] == 3
+    cursor_page = api_client.get(reverse("movie-list"), {"fields": "title", "cursor": "", "size": 2}).json()
+    assert cursor_page["content"] == [{"title": "A"}, {"title": "B"}]
+
+    detail = api_client.get(reverse("movie-detail", kwargs={"movie_id": catalog[2].id}), {"fields": "title,studio_name"})
+    assert detail.json() == {"movie": {"title": "C", "studio_name": ["S1", "S3"]}}
+
+    winners = api_client.get(reverse("year-with-winner"), {"winner": "true", "year": 1990, "fields": "id,producer_name"})
+    assert winners.json() == {"movies": [pick(row, ["id", "producer_name"]) for row in full if row["winner"]]}
+
+    batch = api_client.get(reverse("movie-list"), {"ids": f"{catalog[1].id},{catalog[0].id}", "fields": "title"})
+    assert batch.json() == {"content": [{"title": "B"}, {"title": "A"}], "missing": []}
+
+
+@pytest.mark.django_db
+def test_sparse_list_is_a_single_table_scan(api_client, catalog, django_assert_num_queries):
+    with django_assert_num_queries(2) as queries:
+        api_client.get(reverse("movie-list"), {"fields": "id,title,year"})
+    page_query = queries.captured_queries[-1]["sql"]
+    assert "JOIN" not in page_query and "winner" not in page_query
+
+    with django_assert_num_queries(1):
+        api_client.get(reverse("movie-detail", kwargs={"movie_id": catalog[0].id}), {"fields": "id,title"})
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("url_name,kwargs", [
+    ("movie-list", {}), ("movie-detail", {"movie_id": 1}), ("year-with-winner", {})
+])
+def test_unknown_fields_are_rejected(api_client, catalog, url_name, kwargs):
+    for fields in ("title,budget", "", ","):
+        response = api_client.get(reverse(url_name, kwargs=kwargs), {"fields": fields})
+        assert response.status_code == 400
+    assert api_client.get(reverse("movie-list"), {"ids": "1", "fields": "x"}).status_code == 400
+
+
+@pytest.mark.django_db
+def test_async_fields_match_the_sync_views(asgi_test_connections, catalog):  # noqa: F811
+    user = User.objects.create(username="async-fields")
+    client = APIClient()
+    client.force_authenticate(user=user)
+    headers = [(b"authorization", f"Bearer {RefreshToken.for_user(user).access_token}".encode())]
+
+    for path, params in [
+        (reverse("movie-list"), {"fields": "id,title,year"}),
+        (reverse("movie-list"), {"fields": "title,producer_name", "cursor": "", "size": "2"}),
+        (reverse("movie-list"), {"fields": "studio_name", "ids": f"{catalog[2].id},999"}),
+        (reverse("movie-detail", kwargs={"movie_id": catalog[0].id}), {"fields": "winner,studio_name"}),
+        (reverse("year-with-winner"), {"winner": "true", "fields": "title"}),
+    ]:
+        query = "&".join(f"{key}={value}" for key, value in params.items())
+        status, _, body = async_to_sync(asgi_request)(path, query, headers=headers)
+        assert status == 200
+        assert json.loads(body) == client.get(path, params).json()
+
+    status, _, _ = async_to_sync(asgi_request)(reverse("movie-list"), "fields=nope", headers=headers)
+    assert status == 400
@@ -0,0 +1,92 @@
+import pytest
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db.models import Count
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from Core.Movies.models import Movie, YearWinnerCount
+from Core.Movies.service import MovieService
+from Core.Studio.models import Studio, StudioWinCount
+
+
+def grouped_year_counts():
+    return sorted(
+        Movie.objects.filter(winner=True).values("year").annotate(count=Count("id")).values_list("year", "count")
+    )
+
+
+def grouped_studio_counts():
+    return sorted(
+        Movie.studio.through.objects.filter(movie__winner=True)
+        .values("studio_id").annotate(wins=Count("id")).values_list("studio_id", "wins")
+    )
+
+
+def stored_counts():
+    return (
+        sorted(YearWinnerCount.objects.values_list("year", "winner_count")),
+        sorted(StudioWinCount.objects.values_list("studio_id", "win_count")),
+    )
+
+
+@pytest.mark.django_db
+def test_win_counts_follow_every_write_path():
+    first = MovieService.create_movie("A", 1990, ["P"], ["S1", "S2"], True)
+    second = MovieService.create_movie("B", 1990, ["P"], ["S1"], True)
+    MovieService.create_movie("C", 1991, ["P"], ["S2"], False)
+    assert stored_counts() == (grouped_year_counts(), grouped_studio_counts())
+    assert MovieService.get_years_with_multiple_winners() == [{"year": 1990, "winnerCount": 2}]
+    assert MovieService.get_studios_with_winners() == {
+        "studios": [{"name": "S1", "winCount": 2}, {"name": "S2", "winCount": 1}]
+    }
+
+    second.year = 1992
+    second.save()
+    assert stored_counts() == (grouped_year_counts(), grouped_studio_counts())
+    assert MovieService.get_years_with_multiple_winners() == []
+
+    first.winner = False
+    first.save()
+    assert stored_counts() == (grouped_year_counts(), grouped_studio_counts())
+
+    second.studio.set([Studio.objects.get(name="S2")])
+    Studio.objects.get(name="S1").movies.add(second)
+    assert stored_counts() == (grouped_year_counts(), grouped_studio_counts())
+
+    second.studio.clear()
+    assert stored_counts() == (grouped_year_counts(), grouped_studio_counts())
+
+    Movie.objects.get(title="B").delete()
+    assert stored_counts() == (grouped_year_counts(), grouped_studio_counts())
+
+
+@pytest.mark.django_db
+def test_rebuild_win_counts_command_restores_tables():
+    MovieService.create_movie("A", 1990, ["P"], ["S1", "S2"], True)
+    MovieService.create_movie("B", 1990, ["P"], ["S1"], True)
+    expected = stored_counts()
+    YearWinnerCount.objects.all().delete()
+    StudioWinCount.objects.all().delete()
+
+    call_command("rebuild_win_counts")
+
+    assert stored_counts() == expected
+
+
+@pytest.mark.django_db
+def test_put_that_drops_winner_and_studios_refreshes_old_studios():
+    client = APIClient()
+    client.force_authenticate(user=User.objects.create(username="win-counts"))
+    MovieService.create_movie("A", 1990, ["Alice"], ["S1"], True)
+    second = MovieService.create_movie("B", 1995, ["Alice"], ["S1"], True)
+
+    response = client.put(
+        reverse("movie-detail", args=[second.id]),
+        {"title": "B", "year": 1995, "winner": False, "producer": [{"name": "Bob"}], "studio": [{"name": "S2"}]},
+        format="json",
+    )
+
+    assert response.status_code == 200
+    assert StudioWinCount.objects.get(studio__name="S1").win_count == 1
+    assert stored_counts() == (grouped_year_counts(), grouped_studio_counts())
@@ -1,12 +1,20 @@
 from xml.dom import ValidationErr
+from django.http import StreamingHttpResponse
+from django.urls import reverse
+from Core import pagination
+from Core.async_api import AsyncAPIView, AsyncJSONResponse
+from Core.DataVersion.service import cache_by_data_version
+from Core.Jobs.models import ImportJob
+from Core.Jobs.service import ImportJobService
 from Core.Movies.models import Movie
 from Core.Producers.repository import ProducerRepository
 from Core.Studio.repository import StudioRepository
-from rest_framework import status
+from rest_framework import serializers, status
 from rest_framework.views import APIView
 from rest_framework.response import Response
+from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
-from Core.Movies.service import ImportMovieCSVService, MovieService
+from Core.Movies.service import ImportMovieCSVService, MovieBulkService, MovieExportService, MovieService
 from Core.Movies.serializer import MovieSerializer
 import logging
 logger = logging.getLogger(__name__)
@@ -22,7 +30,15 @@ logger = logging.getLogger(__name__)
 
 class MoviesView(APIView):
     @swagger_auto_schema(
-        operation_description="Get all movies or a specific movie.",
+        operation_description="Get all movies or a specific movie. ids=1,2,3 fetches those movies in that "
+                              "order and lists the missing ids. fields=id,title,year returns only those fields; "
+                              "producers and studios are only loaded when producer_name or studio_name is asked for.",
+        manual_parameters=[
+            openapi.Parameter('ids', openapi.IN_QUERY, type=openapi.TYPE_STRING,
+                              description='Comma-separated ids to fetch in one request'),
+            openapi.Parameter('fields', openapi.IN_QUERY, type=openapi.TYPE_STRING,
+                              description='Comma-separated fields to return, e.g. id,title,year'),
+        ],
         responses={
             200: "List of movies or details of a specific movie.",
             404: "Movie not found."
@@ -31,17 +47,28 @@ class MoviesView(APIView):
     def get(self, request, movie_id=None):
         if movie_id:
             try:
-                movie = MovieService.get_movie_by_id(movie_id)
+                fields = MovieService.parse_fields(request.query_params.get("fields"))
+                movie = MovieService.get_movie_by_id(movie_id, fields)
                 if movie:
-                    serialized_movie = MovieSerializer(movie).data
+                    serialized_movie = MovieSerializer(movie, fields=fields).data
                     return Response({"movie": serialized_movie}, status=status.HTTP_200_OK)
                 return Response({"error": "Movie not found."}, status=status.HTTP_404_NOT_FOUND)
+            except ValueError as ve:
+                return Response({"error": str(ve)}, status=status.HTTP_400_BAD_REQUEST)
             except Exception as e:
                 logger.error(f"Error fetching movie with ID {movie_id}: {e}")
                 return Response({"error": "An unexpected error occurred."}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        if pagination.is_batch(request.query_params):
+            try:
+                return Response(MovieService.get_movies_by_ids(request.query_params["ids"], request.query_params.get("fields")), status=status.HTTP_200_OK)
+            except ValueError as ve:
+                logger.warning(f"Invalid ids value: {ve}")
+                return Response({"error": str(ve)}, status=status.HTTP_400_BAD_REQUEST)
+            except Exception as e:
+                logger.error(f"Error fetching movies by ids: {e}")
+                return Response({"error": "An unexpected error occurred."}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
         filters = {k: v for k, v in request.query_params.items()}
         try:
-            print("filters", filters)
             my_return = MovieService.get_all_movies(filters=filters)
             
             if my_return and my_return['content']:
@@ -166,25 +193,137 @@ class MoviesView(APIView):
                             status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+class MovieBulkView(APIView):
+    @swagger_auto_schema(
+        operation_description="Create, update and delete many movies in one transaction. Send a list of "
+                              "operations, or {\"operations\": [...], \"allOrNothing\": true} to write nothing "
+                              "when any operation fails. Each operation has an 'op' (create, update or delete); "
+                              "updates and deletes take the movie 'id', and updates only change the fields sent.",
+        request_body=openapi.Schema(
+            type=openapi.TYPE_OBJECT,
+            properties={
+                'operations': openapi.Schema(
+                    type=openapi.TYPE_ARRAY,
+                    items=openapi.Schema(
+                        type=openapi.TYPE_OBJECT,
+                        properties={
+                            'op': openapi.Schema(type=openapi.TYPE_STRING, enum=MovieBulkService.OPERATIONS),
+                            'id': openapi.Schema(type=openapi.TYPE_INTEGER),
+                            'title': openapi.Schema(type=openapi.TYPE_STRING),
+                            'year': openapi.Schema(type=openapi.TYPE_INTEGER),
+                            'winner': openapi.Schema(type=openapi.TYPE_BOOLEAN),
+                            'producer': openapi.Schema(type=openapi.TYPE_ARRAY, items=openapi.Schema(type=openapi.TYPE_STRING)),
+                            'studio': openapi.Schema(type=openapi.TYPE_ARRAY, items=openapi.Schema(type=openapi.TYPE_STRING)),
+                        }
+                    )
+                ),
+                'allOrNothing': openapi.Schema(type=openapi.TYPE_BOOLEAN, default=False),
+            }
+        ),
+        responses={
+            200: "Per-operation results; failed operations carry an error.",
+            400: "Malformed request, or an all-or-nothing request with a failed operation (nothing written).",
+            500: "Internal server error."
+        }
+    )
+    def post(self, request):
+        try:
+            result = MovieBulkService.apply(request.data)
+        except ValueError as ve:
+            return Response({"error": str(ve)}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            logger.error(f"Error applying bulk movie operations: {e}")
+            return Response({"error": "An unexpected error occurred."}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        if result["allOrNothing"] and result["failed"]:
+            return Response(result, status=status.HTTP_400_BAD_REQUEST)
+        return Response(result, status=status.HTTP_200_OK)
+
+
 class ImportMovieCSVView(APIView):
+    @swagger_auto_schema(
+        operation_description="Queue a movie CSV file for import.",
+        responses={
+            202: "Import job queued.",
+            400: "No file provided or unsupported file type."
+        }
+    )
     def post(self, request):
         file = request.FILES.get("file")
         if not file:
             return Response({"error": "No file provided."}, status=status.HTTP_400_BAD_REQUEST)
         try:
-            result = ImportMovieCSVService.process_file(file)
+            ImportMovieCSVService.validate_file_type(file)
+            job = ImportJobService.enqueue(ImportJob.KIND_MOVIES, file)
             return Response({
-                "message": "File processed successfully.",
-                "accepted": result["accepted"],
-                "errors": result["errors"]
-            }, status=status.HTTP_200_OK)
-        except ValidationErr as e:
+                "message": "File queued for import.",
+                "jobId": job.id,
+                "status": job.status,
+                "statusUrl": reverse("import-job-detail", kwargs={"job_id": job.id})
+            }, status=status.HTTP_202_ACCEPTED)
+        except (ValidationErr, serializers.ValidationError) as e:
             return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
         except Exception as e:
             return Response({"error": f"An unexpected error occurred: {str(e)}"},
                             status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+def ndjson_response(chunks):
+    response = StreamingHttpResponse(chunks, content_type="application/x-ndjson")
+    response["Content-Disposition"] = 'attachment; filename="movies.ndjson"'
+    return response
+
+
+class MovieExportView(APIView):
+    @swagger_auto_schema(
+        operation_description="Stream every movie with its producers and studios as NDJSON, "
+                              "one movie per line in id order. Accepts the winner and year filters.",
+        manual_parameters=[
+            openapi.Parameter('winner', openapi.IN_QUERY, type=openapi.TYPE_BOOLEAN),
+            openapi.Parameter('year', openapi.IN_QUERY, type=openapi.TYPE_INTEGER),
+        ],
+        responses={
+            200: "NDJSON stream of movies.",
+            400: "Invalid filter value."
+        }
+    )
+    def get(self, request):
+        filters = {k: v for k, v in request.query_params.items()}
+        try:
+            return ndjson_response(MovieService.export_movies_ndjson(filters))
+        except ValueError as ve:
+            logger.warning(f"Invalid filter value: {ve}")
+            return Response({"error": str(ve)}, status=status.HTTP_400_BAD_REQUEST)
+
+
+def export_response(writer, chunks):
+    response = StreamingHttpResponse(chunks, content_type=writer.content_type)
+    response["Content-Disposition"] = f'attachment; filename="movies.{writer.extension}"'
+    return response
+
+
+class MovieBulkExportView(APIView):
+    @swagger_auto_schema(
+        operation_description="Stream every movie as a file: 'csv' in the import format (year;title;studios;"
+                              "producers;winner), or 'parquet', 'feather' or 'npz' with the movie ids. "
+                              "'columnar' picks Parquet when pyarrow is installed and npz otherwise.",
+        manual_parameters=[
+            openapi.Parameter('winner', openapi.IN_QUERY, type=openapi.TYPE_BOOLEAN),
+            openapi.Parameter('year', openapi.IN_QUERY, type=openapi.TYPE_INTEGER),
+        ],
+        responses={
+            200: "The exported file.",
+            400: "Unknown or unavailable format, or invalid filter value."
+        }
+    )
+    def get(self, request, export_format):
+        filters = {k: v for k, v in request.query_params.items()}
+        try:
+            return export_response(*MovieExportService.export_movies(export_format, filters))
+        except ValueError as ve:
+            logger.warning(f"Invalid export request: {ve}")
+            return Response({"error": str(ve)}, status=status.HTTP_400_BAD_REQUEST)
+
+
 class YearsWithMultipleWinnersView(APIView):
     @swagger_auto_schema(
         operation_description="Get years with multiple winners and their counts.",
@@ -192,6 +331,7 @@ class YearsWithMultipleWinnersView(APIView):
             200: "List of years with the number of times winners appeared in each year."
         }
     )
+    @cache_by_data_version("years-multiple-winners")
     def get(self, request):
         try:
             years_with_multiple_winners = MovieService.get_years_with_multiple_winners()
@@ -207,6 +347,7 @@ class StudiosWithWinnersView(APIView):
             200: "List of studios with the number of wins they have."
         }
     )
+    @cache_by_data_version("studios-with-winners")
     def get(self, request):
         try:
             studios_with_most_wins = MovieService.get_studios_with_winners()
@@ -223,6 +364,7 @@ class ProducersWithWinnerView(APIView):
             500: "Internal Server Error when fetching data."
         }
     )
+    @cache_by_data_version("producers-with-winner")
     def get(self, request):
         try:
             producers_with_intervals = MovieService.get_producers_with_winner_intervals()
@@ -237,11 +379,16 @@ class ProducersWithWinnerView(APIView):
 class YearWithWinnerView(APIView):
     @swagger_auto_schema(
         operation_description="Get movies filtered by year and winner status.",
+        manual_parameters=[
+            openapi.Parameter('fields', openapi.IN_QUERY, type=openapi.TYPE_STRING,
+                              description='Comma-separated fields to return, e.g. id,title,year'),
+        ],
         responses={
             200: "List of movies matching the year and winner filters.",
             404: "No movies found matching the criteria."
         }
     )
+    @cache_by_data_version("year-with-winner")
     def get(self, request):
         filters = {k: v for k, v in request.query_params.items()}
         try:
@@ -254,3 +401,112 @@ class YearWithWinnerView(APIView):
         except Exception as e:
             logger.error(f"Unexpected error: {e}")
             return Response({"error": "An unexpected error occurred."}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+class AsyncMoviesView(AsyncAPIView):
+    async def get(self, request, movie_id=None):
+        if movie_id:
+            try:
+                fields = MovieService.parse_fields(request.GET.get("fields"))
+                movie = await MovieService.aget_movie_by_id(movie_id, fields)
+                if movie:
+                    serialized_movie = MovieSerializer(movie, fields=fields).data
+                    return AsyncJSONResponse({"movie": serialized_movie}, status=status.HTTP_200_OK)
+                return AsyncJSONResponse({"error": "Movie not found."}, status=status.HTTP_404_NOT_FOUND)
+            except ValueError as ve:
+                return AsyncJSONResponse({"error": str(ve)}, status=status.HTTP_400_BAD_REQUEST)
+            except Exception as e:
+                logger.error(f"Error fetching movie with ID {movie_id}: {e}")
+                return AsyncJSONResponse({"error": "An unexpected error occurred."}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        if pagination.is_batch(request.GET):
+            try:
+                return AsyncJSONResponse(await MovieService.aget_movies_by_ids(request.GET["ids"], request.GET.get("fields")), status=status.HTTP_200_OK)
+            except ValueError as ve:
+                logger.warning(f"Invalid ids value: {ve}")
+                return AsyncJSONResponse({"error": str(ve)}, status=status.HTTP_400_BAD_REQUEST)
+            except Exception as e:
+                logger.error(f"Error fetching movies by ids: {e}")
+                return AsyncJSONResponse({"error": "An unexpected error occurred."}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        filters = {k: v for k, v in request.GET.items()}
+        try:
+            my_return = await MovieService.aget_all_movies(filters=filters)
+            if my_return and my_return['content']:
+                return AsyncJSONResponse(my_return, status=status.HTTP_200_OK)
+            return AsyncJSONResponse({"message": "No movies found."}, status=status.HTTP_404_NOT_FOUND)
+        except ValueError as ve:
+            logger.warning(f"Invalid filter value: {ve}")
+            return AsyncJSONResponse({"error": str(ve)}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            logger.error(f"Unexpected error: {e}")
+            return AsyncJSONResponse({"error": "An unexpected error occurred."}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+class AsyncMovieExportView(AsyncAPIView):
+    async def get(self, request):
+        filters = {k: v for k, v in request.GET.items()}
+        try:
+            return ndjson_response(MovieService.aexport_movies_ndjson(filters))
+        except ValueError as ve:
+            logger.warning(f"Invalid filter value: {ve}")
+            return AsyncJSONResponse({"error": str(ve)}, status=status.HTTP_400_BAD_REQUEST)
+
+
+class AsyncMovieBulkExportView(AsyncAPIView):
+    async def get(self, request, export_format):
+        filters = {k: v for k, v in request.GET.items()}
+        try:
+            return export_response(*MovieExportService.aexport_movies(export_format, filters))
+        except ValueError as ve:
+            logger.warning(f"Invalid export request: {ve}")
+            return AsyncJSONResponse({"error": str(ve)}, status=status.HTTP_400_BAD_REQUEST)
+
+
+class AsyncYearsWithMultipleWinnersView(AsyncAPIView):
+    @cache_by_data_version("years-multiple-winners")
+    async def get(self, request):
+        try:
+            years_with_multiple_winners = await MovieService.aget_years_with_multiple_winners()
+            return AsyncJSONResponse({"years": years_with_multiple_winners}, status=status.HTTP_200_OK)
+        except Exception as e:
+            logger.error(f"Error in YearsWithMultipleWinnersView: {e}")
+            return AsyncJSONResponse({"error": "An error occurred while fetching the data."}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+class AsyncStudiosWithWinnersView(AsyncAPIView):
+    @cache_by_data_version("studios-with-winners")
+    async def get(self, request):
+        try:
+            studios_with_most_wins = await MovieService.aget_studios_with_winners()
+            return AsyncJSONResponse({"studios": studios_with_most_wins}, status=status.HTTP_200_OK)
+        except Exception as e:
+            logger.error(f"Error in StudiosWithWinnersView: {e}")
+            return AsyncJSONResponse({"error": "An error occurred while fetching the data."}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+class AsyncProducersWithWinnerView(AsyncAPIView):
+    @cache_by_data_version("producers-with-winner")
+    async def get(self, request):
+        try:
+            producers_with_intervals = await MovieService.aget_producers_with_winner_intervals()
+            if producers_with_intervals:
+                return AsyncJSONResponse(producers_with_intervals, status=status.HTTP_200_OK)
+            return AsyncJSONResponse({"message": "No data available."}, status=status.HTTP_404_NOT_FOUND)
+        except Exception as e:
+            logger.error(f"Error fetching producers with winner intervals: {e}")
+            return AsyncJSONResponse({"error": "An error occurred while fetching the data."}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+class AsyncYearWithWinnerView(AsyncAPIView):
+    @cache_by_data_version("year-with-winner")
+    async def get(self, request):
+        filters = {k: v for k, v in request.GET.items()}
+        try:
+            movies = await MovieService.aget_movies_with_winner(filters=filters)
+            if movies:
+                return AsyncJSONResponse({"movies": movies}, status=status.HTTP_200_OK)
+            return AsyncJSONResponse({"message": "No movies found matching the criteria."}, status=status.HTTP_404_NOT_FOUND)
+        except ValueError as ve:
+            return AsyncJSONResponse({"error": str(ve)}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            logger.error(f"Unexpected error: {e}")
+            return AsyncJSONResponse({"error": "An unexpected error occurred."}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -1,8 +1,32 @@
 from django.db import models
 
+from Core.normalization import normalize_name
+
 
 class Producer(models.Model):
     name = models.CharField(max_length=255, unique=True)
+    name_key = models.CharField(max_length=255, unique=True, editable=False)
+
+    def save(self, *args, **kwargs):
+        self.name_key = normalize_name(self.name)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'name' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'name_key'}
+        super().save(*args, **kwargs)
 
     def __str__(self):
         return self.name
+
+
+class ProducerWinInterval(models.Model):
+    producer = models.ForeignKey(
+        Producer,
+        on_delete=models.CASCADE,
+        related_name='win_intervals'
+    )
+    interval = models.PositiveIntegerField(db_index=True)
+    previous_win = models.PositiveIntegerField()
+    following_win = models.PositiveIntegerField()
+
+    def __str__(self):
+        return f"{self.producer.name}: {self.previous_win}-{self.following_win}"
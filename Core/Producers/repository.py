@@ -1,4 +1,20 @@
-from Core.Producers.models import Producer
+from itertools import groupby, islice
+
+from django.db import transaction
+from django.db.models import Max, Min
+
+from Core.DataVersion.repository import DataVersionRepository
+from Core.Movies.models import Movie
+from Core.normalization import normalize_name
+from Core.prefix_index import PrefixIndex
+from Core.Producers.models import Producer, ProducerWinInterval
+
+
+NAME_LOOKUP_CHUNK_SIZE = 500
+
+PRODUCER_NAMES = PrefixIndex(
+    lambda: Producer.objects.values_list('id', 'name').iterator(chunk_size=2000)
+)
 
 
 class ProducerRepository:
@@ -13,14 +29,110 @@ class ProducerRepository:
         except Producer.DoesNotExist:
             return None
 
+    @staticmethod
+    async def aget_all_producers():
+        return [producer async for producer in Producer.objects.all().aiterator()]
+
+    @staticmethod
+    async def aget_producer_by_id(producer_id):
+        try:
+            return await Producer.objects.aget(id=producer_id)
+        except Producer.DoesNotExist:
+            return None
+
+    @staticmethod
+    def get_producers_by_ids(ids):
+        return Producer.objects.in_bulk(ids)
+
+    @staticmethod
+    async def aget_producers_by_ids(ids):
+        return await Producer.objects.ain_bulk(ids)
+
+    @staticmethod
+    def get_ordered_producers():
+        return Producer.objects.order_by('id')
+
+    @staticmethod
+    def get_producers_after(after_id=None, limit=10):
+        producers = ProducerRepository.get_ordered_producers()
+        if after_id is not None:
+            producers = producers.filter(id__gt=after_id)
+        return list(producers[:limit])
+
+    @staticmethod
+    async def acount_producers():
+        return await Producer.objects.acount()
+
+    @staticmethod
+    async def aget_producers(offset, limit):
+        producers = ProducerRepository.get_ordered_producers()[offset:offset + limit]
+        return [producer async for producer in producers.aiterator()]
+
+    @staticmethod
+    async def aget_producers_after(after_id=None, limit=10):
+        producers = ProducerRepository.get_ordered_producers()
+        if after_id is not None:
+            producers = producers.filter(id__gt=after_id)
+        return [producer async for producer in producers[:limit].aiterator()]
+
+    @staticmethod
+    def iter_producer_rows(chunk_size):
+        """Yields {'id', 'name'} dicts in id order, fetching `chunk_size` rows at a time."""
+        return ProducerRepository.get_ordered_producers().values('id', 'name').iterator(chunk_size=chunk_size)
+
+    @staticmethod
+    def aiter_producer_rows(chunk_size):
+        # values() rather than values_list(): Django 4.2.0 evaluates
+        # values_list() eagerly under aiterator().
+        return ProducerRepository.get_ordered_producers().values('id', 'name').aiterator(chunk_size=chunk_size)
+
+    @staticmethod
+    def suggest_producers(prefix, limit):
+        """Returns up to `limit` (id, name) pairs whose name starts with `prefix`, from memory."""
+        return PRODUCER_NAMES.lookup(prefix, limit)
+
     @staticmethod
     def get_or_create_producer(producer_names):
         producers = []
         for name in producer_names:
-            producer, _ = Producer.objects.get_or_create(name=name.strip())
+            producer, created = Producer.objects.get_or_create(
+                name_key=normalize_name(name),
+                defaults={'name': name.strip()}
+            )
+            if created:
+                PRODUCER_NAMES.put_on_commit([producer])
             producers.append(producer)
         return producers
 
+    @staticmethod
+    def get_producers_by_key(name_keys):
+        name_keys = list(name_keys)
+        producers = {}
+        for start in range(0, len(name_keys), NAME_LOOKUP_CHUNK_SIZE):
+            chunk = name_keys[start:start + NAME_LOOKUP_CHUNK_SIZE]
+            producers.update(
+                (producer.name_key, producer)
+                for producer in Producer.objects.filter(name_key__in=chunk)
+            )
+        return producers
+
+    @staticmethod
+    def get_or_create_producers_by_name(producer_names):
+        """Resolves names in bulk through their normalized key; returns name -> Producer."""
+        keys = {name: normalize_name(name) for name in producer_names}
+        producers = ProducerRepository.get_producers_by_key(set(keys.values()))
+        missing = {}
+        for name, key in keys.items():
+            if key not in producers:
+                missing.setdefault(key, Producer(name=name.strip(), name_key=key))
+        if missing:
+            Producer.objects.bulk_create(missing.values(), ignore_conflicts=True)
+            DataVersionRepository.bump()
+            created = ProducerRepository.get_producers_by_key(missing)
+            producers.update(created)
+            PRODUCER_NAMES.put_on_commit(created.values())
+        return {name: producers[key] for name, key in keys.items()}
+
     @staticmethod
     def get_or_create_producer_by_id(producer_id):
         try:
@@ -30,11 +142,16 @@ class ProducerRepository:
 
     @staticmethod
     def create_producer(name):
-        return Producer.objects.create(name=name)
+        producer = Producer.objects.create(name=name)
+        PRODUCER_NAMES.put_on_commit([producer])
+        return producer
 
     @staticmethod
-    def exists_by_name(name):
-        return Producer.objects.filter(name=name).exists()
+    def exists_by_name(name, exclude_id=None):
+        producers = Producer.objects.filter(name_key=normalize_name(name))
+        if exclude_id is not None:
+            producers = producers.exclude(pk=exclude_id)
+        return producers.exists()
 
     @staticmethod
     def update_producer(producer_id, name):
@@ -42,6 +159,7 @@ class ProducerRepository:
         if producer:
             producer.name = name
             producer.save()
+            PRODUCER_NAMES.put_on_commit([producer])
             return producer
         return None
 
@@ -49,6 +167,114 @@ class ProducerRepository:
     def delete_producer(producer_id):
         producer = ProducerRepository.get_producer_by_id(producer_id)
         if producer:
+            PRODUCER_NAMES.remove_on_commit(producer.id)
             producer.delete()
             return True
         return False
+
+
+class ProducerWinIntervalRepository:
+    @staticmethod
+    def build_intervals(ordered_wins):
+        """
+        Turns (producer_id, year) pairs ordered by producer and year into
+        one ProducerWinInterval per pair of consecutive wins, in a single pass.
+        """
+        for producer_id, wins in groupby(ordered_wins, key=lambda win: win[0]):
+            previous_year = None
+            for _, year in wins:
+                if previous_year is not None:
+                    yield ProducerWinInterval(
+                        producer_id=producer_id,
+                        interval=year - previous_year,
+                        previous_win=previous_year,
+                        following_win=year
+                    )
+                previous_year = year
+
+    @staticmethod
+    def save_intervals(intervals, batch_size=1000):
+        saved = 0
+        while True:
+            batch = list(islice(intervals, batch_size))
+            if not batch:
+                return saved
+            ProducerWinInterval.objects.bulk_create(batch)
+            saved += len(batch)
+
+    @staticmethod
+    def get_ordered_wins(producer_ids=None):
+        wins = Movie.producer.through.objects.filter(movie__winner=True)
+        if producer_ids is not None:
+            wins = wins.filter(producer_id__in=producer_ids)
+        return (
+            wins.order_by('producer_id', 'movie__year')
+            .values_list('producer_id', 'movie__year')
+            .iterator(chunk_size=2000)
+        )
+
+    @staticmethod
+    def refresh_producers(producer_ids):
+        """Recomputes the stored intervals of the given producers only."""
+        producer_ids = sorted(set(producer_ids))
+        with transaction.atomic():
+            for start in range(0, len(producer_ids), NAME_LOOKUP_CHUNK_SIZE):
+                chunk = producer_ids[start:start + NAME_LOOKUP_CHUNK_SIZE]
+                ProducerWinInterval.objects.filter(producer_id__in=chunk).delete()
+                ProducerWinIntervalRepository.save_intervals(
+                    ProducerWinIntervalRepository.build_intervals(
+                        ProducerWinIntervalRepository.get_ordered_wins(chunk)
+                    )
+                )
+
+    @staticmethod
+    def rebuild_all():
+        with transaction.atomic():
+            ProducerWinInterval.objects.all().delete()
+            return ProducerWinIntervalRepository.save_intervals(
+                ProducerWinIntervalRepository.build_intervals(
+                    ProducerWinIntervalRepository.get_ordered_wins()
+                )
+            )
+
+    @staticmethod
+    def get_extreme_intervals():
+        """Returns every interval tied for the minimum and for the maximum."""
+        bounds = ProducerWinInterval.objects.aggregate(
+            min_interval=Min('interval'),
+            max_interval=Max('interval')
+        )
+        if bounds['min_interval'] is None:
+            return [], []
+        extremes = list(ProducerWinIntervalRepository.get_intervals_within(bounds))
+        return ProducerWinIntervalRepository.split_extremes(extremes, bounds)
+
+    @staticmethod
+    async def aget_extreme_intervals():
+        bounds = await ProducerWinInterval.objects.aaggregate(
+            min_interval=Min('interval'),
+            max_interval=Max('interval')
+        )
+        if bounds['min_interval'] is None:
+            return [], []
+        extremes = [
+            entry async for entry in ProducerWinIntervalRepository.get_intervals_within(bounds).aiterator()
+        ]
+        return ProducerWinIntervalRepository.split_extremes(extremes, bounds)
+
+    @staticmethod
+    def get_intervals_within(bounds):
+        return (
+            ProducerWinInterval.objects.filter(
+                interval__in=[bounds['min_interval'], bounds['max_interval']]
+            )
+            .select_related('producer')
+            .order_by('producer__name', 'previous_win')
+        )
+
+    @staticmethod
+    def split_extremes(extremes, bounds):
+        return (
+            [entry for entry in extremes if entry.interval == bounds['min_interval']],
+            [entry for entry in extremes if entry.interval == bounds['max_interval']]
+        )
@@ -1,10 +1,129 @@
 import logging
+
+from django.conf import settings
+from django.core.paginator import Paginator
+
+from Core import pagination
+from Core.prefix_index import PrefixIndex
 from Core.Producers.repository import ProducerRepository
 
 logger = logging.getLogger(__name__)
 
 
 class ProducerService:
+    DEFAULT_MAX_PAGE_SIZE = 100
+    DEFAULT_STREAM_CHUNK_SIZE = 2000
+
+    @staticmethod
+    def get_max_page_size():
+        return getattr(settings, "PRODUCERS_MAX_PAGE_SIZE", ProducerService.DEFAULT_MAX_PAGE_SIZE)
+
+    @staticmethod
+    def get_stream_chunk_size():
+        return getattr(settings, "LIST_STREAM_CHUNK_SIZE", ProducerService.DEFAULT_STREAM_CHUNK_SIZE)
+
+    @staticmethod
+    def serialize(producers):
+        return [{'id': producer.id, 'name': producer.name} for producer in producers]
+
+    @staticmethod
+    def parse_page_params(params):
+        page = pagination.parse_page(params.get("page", 1))
+        size = pagination.parse_page_size(params.get("size", 10), ProducerService.get_max_page_size())
+        return page, size
+
+    @staticmethod
+    def get_producers_page(params):
+        """
+        Pages through the producers in id order with the /core/movies/ contract:
+        page and size, or a cursor from the previous page's `next`.
+        """
+        try:
+            page, size = ProducerService.parse_page_params(params)
+            if "cursor" in params:
+                producers = ProducerRepository.get_producers_after(
+                    pagination.decode_cursor(params["cursor"]), size + 1
+                )
+                producers, next_cursor = pagination.split_cursor_page(producers, size)
+                return pagination.format_cursor_page(
+                    ProducerService.serialize(producers), params["cursor"], next_cursor, size
+                )
+            paginator = Paginator(ProducerRepository.get_ordered_producers(), size)
+            paginated = paginator.get_page(page)
+            return pagination.format_page(
+                ProducerService.serialize(paginated.object_list), paginator, paginated, page, size
+            )
+        except ValueError as ve:
+            logger.warning(f"Invalid paging value: {ve}")
+            raise
+        except Exception as e:
+            logger.error(f"Failed to fetch a page of producers: {str(e)}")
+            raise
+
+    @staticmethod
+    async def aget_producers_page(params):
+        try:
+            page, size = ProducerService.parse_page_params(params)
+            if "cursor" in params:
+                producers = await ProducerRepository.aget_producers_after(
+                    pagination.decode_cursor(params["cursor"]), size + 1
+                )
+                producers, next_cursor = pagination.split_cursor_page(producers, size)
+                return pagination.format_cursor_page(
+                    ProducerService.serialize(producers), params["cursor"], next_cursor, size
+                )
+            paginator = pagination.count_paginator(await ProducerRepository.acount_producers(), size)
+            paginated = paginator.get_page(page)
+            producers = await ProducerRepository.aget_producers((paginated.number - 1) * size, size)
+            return pagination.format_page(
+                ProducerService.serialize(producers), paginator, paginated, page, size
+            )
+        except ValueError as ve:
+            logger.warning(f"Invalid paging value: {ve}")
+            raise
+        except Exception as e:
+            logger.error(f"Failed to fetch a page of producers: {str(e)}")
+            raise
+
+    @staticmethod
+    def stream_producers():
+        """
+        The full producer list as JSON text chunks, read from the database
+        LIST_STREAM_CHUNK_SIZE rows at a time.
+        """
+        chunk_size = ProducerService.get_stream_chunk_size()
+        return pagination.stream_json_array(ProducerRepository.iter_producer_rows(chunk_size), chunk_size)
+
+    @staticmethod
+    def astream_producers():
+        chunk_size = ProducerService.get_stream_chunk_size()
+        return pagination.astream_json_array(ProducerRepository.aiter_producer_rows(chunk_size), chunk_size)
+
+    @staticmethod
+    def get_producers_by_ids(ids):
+        """The producers of an ?ids= lookup, in the caller's order, with the missing ids."""
+        try:
+            ids = pagination.parse_ids(ids)
+            return pagination.format_batch(ids, ProducerRepository.get_producers_by_ids(ids), ProducerService.serialize)
+        except ValueError as ve:
+            logger.warning(f"Invalid ids value: {ve}")
+            raise
+        except Exception as e:
+            logger.error(f"Failed to fetch producers by ids: {str(e)}")
+            raise
+
+    @staticmethod
+    async def aget_producers_by_ids(ids):
+        try:
+            ids = pagination.parse_ids(ids)
+            return pagination.format_batch(ids, await ProducerRepository.aget_producers_by_ids(ids), ProducerService.serialize)
+        except ValueError as ve:
+            logger.warning(f"Invalid ids value: {ve}")
+            raise
+        except Exception as e:
+            logger.error(f"Failed to fetch producers by ids: {str(e)}")
+            raise
+
     @staticmethod
     def get_all_producers():
         try:
@@ -30,6 +149,45 @@ class ProducerService:
             )
             raise
 
+    @staticmethod
+    async def aget_all_producers():
+        try:
+            return await ProducerRepository.aget_all_producers()
+        except Exception as e:
+            logger.error(
+                f"Failed to fetch all producers: {str(e)}"
+            )
+            raise
+
+    @staticmethod
+    async def aget_producer_by_id(producer_id):
+        try:
+            producer = await ProducerRepository.aget_producer_by_id(producer_id)
+            if not producer:
+                logger.warning(
+                    f"Producer with ID {producer_id} not found."
+                )
+            return producer
+        except Exception as e:
+            logger.error(
+                f"Error fetching producer by ID {producer_id}: {str(e)}"
+            )
+            raise
+
+    @staticmethod
+    def suggest_producers(prefix, limit=None):
+        try:
+            if not prefix or not prefix.strip():
+                message = "Prefix is required"
+                logger.warning(message)
+                raise ValueError(message)
+            return ProducerRepository.suggest_producers(prefix, PrefixIndex.parse_limit(limit))
+        except Exception as e:
+            logger.error(
+                f"Error suggesting producers for '{prefix}': {str(e)}"
+            )
+            raise
+
     @staticmethod
     def create_producer(name):
         try:
@@ -54,6 +212,12 @@ class ProducerService:
     @staticmethod
     def update_producer(producer_id, name):
         try:
+            if ProducerRepository.exists_by_name(name, exclude_id=producer_id):
+                message = (
+                    f"Producer with name '{name}' already exists."
+                )
+                logger.warning(message)
+                raise ValueError(message)
             producer = ProducerRepository.update_producer(producer_id, name)
             if producer:
                 logger.info(
@@ -0,0 +1,94 @@
+import json
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.contrib.auth.models import User
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from Core.Movies.tests.test_async_read_path import asgi_request, asgi_test_connections  # noqa: F401
+from Core.Producers.models import Producer
+from Core.Studio.models import Studio
+
+
+@pytest.fixture
+def api_client():
+    client = APIClient()
+    client.force_authenticate(user=User.objects.create(username="paging"))
+    return client
+
+
+@pytest.fixture
+def names():
+    Producer.objects.bulk_create(Producer(name=f"Producer {i}", name_key=f"producer {i}") for i in range(25))
+    Studio.objects.bulk_create(Studio(name=f"Studio {i}", name_key=f"studio {i}") for i in range(7))
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("url_name,model", [("producer-list", Producer), ("studio-list", Studio)])
+def test_list_pages_follow_the_movie_contract(api_client, names, url_name, model):
+    expected = [{"id": obj.id, "name": obj.name} for obj in model.objects.order_by("id")]
+
+    page = api_client.get(reverse(url_name), {"page": 2, "size": 5}).json()
+    assert page["content"] == expected[5:10]
+    assert page["totalElements"] == len(expected)
+    assert page["totalPages"] == -(-len(expected) // 5)
+    assert page["number"] == 2 and page["numberOfElements"] == len(expected[5:10])
+
+    collected, cursor = [], ""
+    while True:
+        page = api_client.get(reverse(url_name), {"size": 3, "cursor": cursor}).json()
+        collected += page["content"]
+        if page["last"]:
+            break
+        cursor = page["next"]
+    assert collected == expected
+
+    assert api_client.get(reverse(url_name)).json() == expected
+    assert api_client.get(reverse(url_name), {"size": "x"}).status_code == 400
+    assert api_client.get(reverse(url_name), {"cursor": "garbage"}).status_code == 400
+    assert api_client.get(reverse(url_name), {"stream": "maybe"}).status_code == 400
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("url_name", ["producer-list", "studio-list"])
+def test_streamed_lists_match_the_plain_list(api_client, names, settings, url_name):
+    settings.LIST_STREAM_CHUNK_SIZE = 4
+    response = api_client.get(reverse(url_name), {"stream": "true"})
+    assert response.streaming
+    assert response["Content-Type"] == "application/json"
+    parts = list(response.streaming_content)
+    assert len(parts) > 3
+    assert json.loads(b"".join(parts)) == api_client.get(reverse(url_name)).json()
+
+
+@pytest.mark.django_db
+def test_streamed_list_of_an_empty_table(api_client):
+    response = api_client.get(reverse("studio-list"), {"stream": "1"})
+    assert b"".join(response.streaming_content) == b"[]"
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("url_name", ["producer-list", "studio-list"])
+def test_async_lists_match_the_sync_views(asgi_test_connections, names, settings, url_name):  # noqa: F811
+    settings.LIST_STREAM_CHUNK_SIZE = 4
+    user = User.objects.create(username="async-paging")
+    token = str(RefreshToken.for_user(user).access_token)
+    client = APIClient()
+    client.force_authenticate(user=user)
+    headers = [(b"authorization", f"Bearer {token}".encode())]
+    path = reverse(url_name)
+
+    for query, params in [("page=2&size=5", {"page": 2, "size": 5}), ("size=3&cursor=", {"size": 3, "cursor": ""})]:
+        status, _, body = async_to_sync(asgi_request)(path, query, headers=headers)
+        assert status == 200
+        assert json.loads(body) == client.get(path, params).json()
+
+    status, response_headers, body = async_to_sync(asgi_request)(path, "stream=true", headers=headers)
+    assert status == 200
+    assert response_headers[b"content-type"] == b"application/json"
+    assert json.loads(body) == client.get(path).json()
+
+    status, _, _ = async_to_sync(asgi_request)(path, "size=0", headers=headers)
+    assert status == 400
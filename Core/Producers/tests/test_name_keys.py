@@ -0,0 +1,99 @@
+import pytest
+from django.contrib.auth.models import User
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from Core.Movies.service import MovieService
+from Core.Producers.models import Producer
+from Core.Producers.repository import ProducerRepository
+from Core.Producers.service import ProducerService
+from Core.Studio.models import Studio
+from Core.Studio.repository import StudioRepository
+from Core.Studio.service import StudioService
+
+
+@pytest.mark.django_db
+def test_name_lookups_ignore_case_and_spacing():
+    first = ProducerRepository.get_or_create_producer(["Joel  Silver "])[0]
+    again = ProducerRepository.get_or_create_producer(["joel silver"])[0]
+    assert first.pk == again.pk
+    assert first.name == "Joel  Silver"
+    assert first.name_key == "joel silver"
+
+    studio = StudioRepository.get_or_create_studio({"name": "Warner Bros."})
+    assert StudioRepository.get_or_create_studio({"name": " WARNER   bros."}).pk == studio.pk
+
+    resolved = StudioRepository.get_or_create_studios_by_name(["warner bros.", "MGM", "mgm"])
+    assert resolved["warner bros."].pk == studio.pk
+    assert resolved["MGM"].pk == resolved["mgm"].pk
+    assert Studio.objects.count() == 2
+
+    with pytest.raises(ValueError):
+        ProducerService.create_producer("JOEL SILVER")
+
+
+@pytest.mark.django_db
+def test_movies_share_normalized_studios():
+    MovieService.create_movie("A", 1990, ["Alice"], ["Paramount Pictures"], True)
+    MovieService.create_movie("B", 1991, ["alice"], ["paramount  pictures"], True)
+    assert Producer.objects.count() == 1
+    assert MovieService.get_studios_with_winners() == {
+        "studios": [{"name": "Paramount Pictures", "winCount": 2}]
+    }
+
+
+@pytest.mark.django_db(transaction=True)
+def test_name_key_migration_merges_duplicates():
+    executor = MigrationExecutor(connection)
+    executor.migrate([("Core", "0012_movie_indexes")])
+    apps = executor.loader.project_state([("Core", "0012_movie_indexes")]).apps
+    OldMovie = apps.get_model("Core", "Movie")
+    OldProducer = apps.get_model("Core", "Producer")
+    OldStudio = apps.get_model("Core", "Studio")
+
+    first = OldMovie.objects.create(title="A", year=1990, winner=True)
+    second = OldMovie.objects.create(title="B", year=1995, winner=True)
+    studio = OldStudio.objects.create(name="MGM")
+    studio_copy = OldStudio.objects.create(name="mgm ")
+    producer = OldProducer.objects.create(name="Alice Smith")
+    producer_copy = OldProducer.objects.create(name="alice  smith")
+    first.studio.add(studio, studio_copy)
+    second.studio.add(studio_copy)
+    first.producer.add(producer)
+    second.producer.add(producer_copy)
+
+    executor = MigrationExecutor(connection)
+    executor.loader.build_graph()
+    executor.migrate(executor.loader.graph.leaf_nodes())
+
+    assert list(Studio.objects.values_list("id", "name_key")) == [(studio.id, "mgm")]
+    assert list(Producer.objects.values_list("id", "name_key")) == [(producer.id, "alice smith")]
+    assert sorted(Studio.objects.get().movies.values_list("title", flat=True)) == ["A", "B"]
+    assert MovieService.get_producers_with_winner_intervals()["min"] == [
+        {"producer": "Alice Smith", "interval": 5, "previousWin": 1990, "followingWin": 1995}
+    ]
+    assert MovieService.get_studios_with_winners() == {"studios": [{"name": "MGM", "winCount": 2}]}
+
+
+@pytest.mark.django_db
+def test_renaming_to_an_existing_name_key_is_rejected():
+    client = APIClient()
+    client.force_authenticate(user=User.objects.create(username="renames"))
+    StudioService.create_studio("MGM")
+    fox = StudioService.create_studio("Fox")
+    ProducerService.create_producer("Joel Silver")
+    producer = ProducerService.create_producer("Joel")
+
+    response = client.put(reverse("studio-detail", args=[fox.id]), {"name": " mgm "}, format="json")
+    assert response.status_code == 400
+    assert Studio.objects.get(pk=fox.id).name == "Fox"
+
+    response = client.put(reverse("producer-detail", args=[producer.id]), {"name": "JOEL SILVER"}, format="json")
+    assert response.status_code == 400
+    assert Producer.objects.get(pk=producer.id).name == "Joel"
+
+    response = client.put(reverse("studio-detail", args=[fox.id]), {"name": "FOX"}, format="json")
+    assert response.status_code == 200
+    assert Studio.objects.get(pk=fox.id).name == "FOX"
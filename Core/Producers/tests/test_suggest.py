@@ -0,0 +1,78 @@
+import pytest
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from Core.Producers.models import Producer
+from Core.Producers.repository import PRODUCER_NAMES, ProducerRepository
+from Core.Producers.service import ProducerService
+
+
+@pytest.fixture(autouse=True)
+def empty_indexes():
+    PRODUCER_NAMES.invalidate()
+    yield
+    PRODUCER_NAMES.invalidate()
+
+
+@pytest.fixture
+def api_client():
+    client = APIClient()
+    client.force_authenticate(user=User.objects.create(username="suggest"))
+    return client
+
+
+@pytest.mark.django_db
+def test_suggestions_are_normalized_ordered_and_served_from_memory(django_assert_num_queries):
+    for name in ["Joel Silver", "joan  Rivers", "Jerry Weintraub", "Allan Carr"]:
+        Producer.objects.create(name=name)
+
+    assert ProducerService.suggest_producers("JO") == [
+        (Producer.objects.get(name="joan  Rivers").id, "joan  Rivers"),
+        (Producer.objects.get(name="Joel Silver").id, "Joel Silver"),
+    ]
+    with django_assert_num_queries(0):
+        assert [name for _, name in ProducerService.suggest_producers("joan rivers")] == ["joan  Rivers"]
+        assert [name for _, name in ProducerService.suggest_producers("j", limit="2")] == ["Jerry Weintraub", "joan  Rivers"]
+        assert ProducerService.suggest_producers("zz") == []
+
+    with pytest.raises(ValueError):
+        ProducerService.suggest_producers(" ")
+    with pytest.raises(ValueError):
+        ProducerService.suggest_producers("j", limit="0")
+
+
+@pytest.mark.django_db
+def test_repository_writes_refresh_the_index(django_capture_on_commit_callbacks, django_assert_num_queries):
+    producer = ProducerRepository.create_producer("Joel Silver")
+    assert ProducerService.suggest_producers("joel") == [(producer.id, "Joel Silver")]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        ProducerRepository.update_producer(producer.id, "Joe Roth")
+        created = ProducerRepository.get_or_create_producers_by_name(["Joel Schumacher"])["Joel Schumacher"]
+    with django_assert_num_queries(0):
+        assert ProducerService.suggest_producers("joe") == [(producer.id, "Joe Roth"), (created.id, "Joel Schumacher")]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        ProducerRepository.delete_producer(created.id)
+    assert ProducerService.suggest_producers("joe") == [(producer.id, "Joe Roth")]
+
+    with pytest.raises(RuntimeError):
+        with transaction.atomic():
+            ProducerRepository.create_producer("Joel Rolled Back")
+            raise RuntimeError()
+    assert ProducerService.suggest_producers("joel") == []
+
+
+@pytest.mark.django_db
+def test_suggest_view(api_client):
+    Producer.objects.create(name="Joel Silver")
+
+    response = api_client.get(reverse("producer-suggest"), {"prefix": "joel s"})
+    assert response.status_code == 200
+    assert response.json() == [{"id": Producer.objects.get().id, "name": "Joel Silver"}]
+
+    assert api_client.get(reverse("producer-suggest")).status_code == 400
+    assert api_client.get(reverse("producer-suggest"), {"prefix": "j", "limit": "x"}).status_code == 400
+    assert APIClient().get(reverse("producer-suggest"), {"prefix": "j"}).status_code == 401
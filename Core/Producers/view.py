@@ -1,3 +1,4 @@
+from django.http import StreamingHttpResponse
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
@@ -5,20 +6,36 @@ from rest_framework.permissions import IsAuthenticated
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 
+from Core import pagination
+from Core.async_api import AsyncAPIView, AsyncJSONResponse
 from Core.Producers.service import ProducerService
 from logging import getLogger
 
 logger = getLogger(__name__)
 
 
+LIST_PARAMETERS = [
+    openapi.Parameter('page', openapi.IN_QUERY, type=openapi.TYPE_INTEGER),
+    openapi.Parameter('size', openapi.IN_QUERY, type=openapi.TYPE_INTEGER),
+    openapi.Parameter('cursor', openapi.IN_QUERY, type=openapi.TYPE_STRING),
+    openapi.Parameter('stream', openapi.IN_QUERY, type=openapi.TYPE_BOOLEAN),
+    openapi.Parameter('ids', openapi.IN_QUERY, type=openapi.TYPE_STRING,
+                      description='Comma-separated ids to fetch in one request'),
+]
+
+
 class ProducerView(APIView):
     permission_classes = [IsAuthenticated]
 
     @swagger_auto_schema(
-        operation_description="Get a list of producer by ID",
+        operation_description="Get a list of producer by ID. The list is paged like /core/movies/ "
+                              "when page, size or cursor is given, and streamed with stream=true. "
+                              "ids=1,2,3 fetches those producers in that order and lists the missing ids.",
         security=[{'BearerAuth': []}],
+        manual_parameters=LIST_PARAMETERS,
         responses={
             200: 'Producer list or single producer details',
+            400: 'Invalid paging value',
             404: 'Producer not found'
         }
     )
@@ -35,12 +52,32 @@ class ProducerView(APIView):
                     {'errors': ['Producer not found']},
                     status=status.HTTP_404_NOT_FOUND
                 )
+            elif pagination.is_batch(request.query_params):
+                return Response(
+                    ProducerService.get_producers_by_ids(request.query_params['ids']),
+                    status=status.HTTP_200_OK
+                )
+            elif pagination.is_streamed(request.query_params):
+                return StreamingHttpResponse(
+                    ProducerService.stream_producers(),
+                    content_type='application/json'
+                )
+            elif pagination.is_paged(request.query_params):
+                return Response(
+                    ProducerService.get_producers_page(request.query_params),
+                    status=status.HTTP_200_OK
+                )
             else:
                 producers = ProducerService.get_all_producers()
                 return Response(
                     [{'id': p.id, 'name': p.name} for p in producers],
                     status=status.HTTP_200_OK
                 )
+        except ValueError as ve:
+            return Response(
+                {'errors': [str(ve)]},
+                status=status.HTTP_400_BAD_REQUEST
+            )
         except Exception as e:
             logger.error(f"Error retrieving producers: {str(e)}")
             return Response(
@@ -109,7 +146,7 @@ class ProducerView(APIView):
         responses={
             200: 'Producer updated',
             404: 'Producer not found',
-            400: 'Name is required'
+            400: 'Name is required or already exists'
         }
     )
     def put(self, request, producer_id):
@@ -131,6 +168,12 @@ class ProducerView(APIView):
                 {'errors': ['Producer not found']},
                 status=status.HTTP_404_NOT_FOUND
             )
+        except ValueError as ve:
+            logger.warning(f"Validation error: {str(ve)}")
+            return Response(
+                {'errors': [str(ve)]},
+                status=status.HTTP_400_BAD_REQUEST
+            )
         except Exception as e:
             logger.error(f"Error updating producer: {str(e)}")
             return Response(
@@ -164,3 +207,90 @@ class ProducerView(APIView):
                 {'errors': ['An error occurred while processing the request']},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
+
+
+class ProducerSuggestView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    @swagger_auto_schema(
+        operation_description="Suggest producers whose name starts with the given prefix, "
+                              "ignoring case and repeated spaces. Served from memory.",
+        security=[{'BearerAuth': []}],
+        manual_parameters=[
+            openapi.Parameter('prefix', openapi.IN_QUERY, type=openapi.TYPE_STRING, required=True),
+            openapi.Parameter('limit', openapi.IN_QUERY, type=openapi.TYPE_INTEGER),
+        ],
+        responses={
+            200: 'Producers in name order',
+            400: 'Missing prefix or invalid limit'
+        }
+    )
+    def get(self, request):
+        try:
+            producers = ProducerService.suggest_producers(
+                request.query_params.get('prefix'),
+                request.query_params.get('limit')
+            )
+            return Response(
+                [{'id': producer_id, 'name': name} for producer_id, name in producers],
+                status=status.HTTP_200_OK
+            )
+        except ValueError as ve:
+            return Response(
+                {'errors': [str(ve)]},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        except Exception as e:
+            logger.error(f"Error suggesting producers: {str(e)}")
+            return Response(
+                {'errors': ['An error occurred while processing the request']},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
+class AsyncProducerView(AsyncAPIView):
+    async def get(self, request, producer_id=None):
+        try:
+            if producer_id:
+                producer = await ProducerService.aget_producer_by_id(producer_id)
+                if producer:
+                    return AsyncJSONResponse(
+                        {'id': producer.id, 'name': producer.name},
+                        status=status.HTTP_200_OK
+                    )
+                return AsyncJSONResponse(
+                    {'errors': ['Producer not found']},
+                    status=status.HTTP_404_NOT_FOUND
+                )
+            elif pagination.is_batch(request.GET):
+                return AsyncJSONResponse(
+                    await ProducerService.aget_producers_by_ids(request.GET['ids']),
+                    status=status.HTTP_200_OK
+                )
+            elif pagination.is_streamed(request.GET):
+                return StreamingHttpResponse(
+                    ProducerService.astream_producers(),
+                    content_type='application/json'
+                )
+            elif pagination.is_paged(request.GET):
+                return AsyncJSONResponse(
+                    await ProducerService.aget_producers_page(request.GET),
+                    status=status.HTTP_200_OK
+                )
+            else:
+                producers = await ProducerService.aget_all_producers()
+                return AsyncJSONResponse(
+                    [{'id': p.id, 'name': p.name} for p in producers],
+                    status=status.HTTP_200_OK
+                )
+        except ValueError as ve:
+            return AsyncJSONResponse(
+                {'errors': [str(ve)]},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        except Exception as e:
+            logger.error(f"Error retrieving producers: {str(e)}")
+            return AsyncJSONResponse(
+                {'errors': ['An error occurred while processing the request']},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
@@ -0,0 +1,121 @@
+from django.db import connection
+
+from Core.Movies.models import Movie
+from Core.Producers.models import Producer
+from Core.Studio.models import Studio
+
+
+SEARCH_TABLE = 'core_search_index'
+ID_CHUNK_SIZE = 500
+
+# Documents share one FTS5 table; the rowid encodes the kind so a
+# document can be replaced or removed through the rowid index.
+KIND_SLOTS = 4
+MOVIE = 0
+PRODUCER = 1
+STUDIO = 2
+KIND_NAMES = {MOVIE: 'movie', PRODUCER: 'producer', STUDIO: 'studio'}
+
+# bm25 weights of the title, producers and studios columns.
+COLUMN_WEIGHTS = (10.0, 5.0, 5.0)
+
+
+def names_subquery(through, related_field, owner_column):
+    related = through._meta.get_field(related_field)
+    return (
+        f'COALESCE((SELECT group_concat(r.name, \', \') FROM "{through._meta.db_table}" t '
+        f'JOIN "{related.related_model._meta.db_table}" r ON r.id = t."{related.column}" '
+        f'WHERE t."{through._meta.get_field("movie").column}" = {owner_column}), \'\')'
+    )
+
+
+def movie_documents_sql():
+    return (
+        f'SELECT m.id * {KIND_SLOTS} + {MOVIE}, m.title, '
+        f'{names_subquery(Movie.producer.through, "producer", "m.id")}, '
+        f'{names_subquery(Movie.studio.through, "studio", "m.id")} '
+        f'FROM "{Movie._meta.db_table}" m'
+    )
+
+
+def name_documents_sql(model, kind):
+    columns = {PRODUCER: "'', name, ''", STUDIO: "'', '', name"}[kind]
+    return f'SELECT id * {KIND_SLOTS} + {kind}, {columns} FROM "{model._meta.db_table}"'
+
+
+class SearchRepository:
+    @staticmethod
+    def is_available():
+        return connection.vendor == 'sqlite'
+
+    @staticmethod
+    def rebuild_all():
+        """Repopulates the whole index from the catalog tables."""
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {SEARCH_TABLE}')
+            for select in (
+                movie_documents_sql(),
+                name_documents_sql(Producer, PRODUCER),
+                name_documents_sql(Studio, STUDIO),
+            ):
+                cursor.execute(f'INSERT INTO {SEARCH_TABLE} (rowid, title, producers, studios) {select}')
+            cursor.execute(f"INSERT INTO {SEARCH_TABLE} ({SEARCH_TABLE}) VALUES ('optimize')")
+            cursor.execute(f'SELECT count(*) FROM {SEARCH_TABLE}')
+            return cursor.fetchone()[0]
+
+    @staticmethod
+    def refresh(kind, ids, select):
+        """Replaces the documents of the given ids; ids that no longer exist are removed."""
+        ids = sorted({object_id for object_id in ids if object_id is not None})
+        if not ids or not SearchRepository.is_available():
+            return
+        with connection.cursor() as cursor:
+            for start in range(0, len(ids), ID_CHUNK_SIZE):
+                chunk = ids[start:start + ID_CHUNK_SIZE]
+                placeholders = ', '.join(['%s'] * len(chunk))
+                cursor.execute(
+                    f'DELETE FROM {SEARCH_TABLE} WHERE rowid IN ({placeholders})',
+                    [object_id * KIND_SLOTS + kind for object_id in chunk]
+                )
+                cursor.execute(
+                    f'INSERT INTO {SEARCH_TABLE} (rowid, title, producers, studios) '
+                    f'{select} WHERE {"m.id" if kind == MOVIE else "id"} IN ({placeholders})',
+                    chunk
+                )
+
+    @staticmethod
+    def refresh_movies(movie_ids):
+        SearchRepository.refresh(MOVIE, movie_ids, movie_documents_sql())
+
+    @staticmethod
+    def refresh_producers(producer_ids):
+        SearchRepository.refresh(PRODUCER, producer_ids, name_documents_sql(Producer, PRODUCER))
+
+    @staticmethod
+    def refresh_studios(studio_ids):
+        SearchRepository.refresh(STUDIO, studio_ids, name_documents_sql(Studio, STUDIO))
+
+    @staticmethod
+    def search(match_query, limit, kind=None, candidate_limit=None):
+        """
+        Returns (kind name, object id) pairs, best match first.
+
+        Only the first `candidate_limit` matches are ranked, so very broad
+        prefixes cost a bounded amount of bm25 work instead of scoring
+        every document of the catalog.
+        """
+        kind_filter = f'AND rowid %% {KIND_SLOTS} = %s' if kind is not None else ''
+        params = [match_query] + ([kind] if kind is not None else []) + [candidate_limit or -1, limit]
+        weights = ', '.join(str(weight) for weight in COLUMN_WEIGHTS)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'SELECT rowid FROM ('
+                f'SELECT rowid, bm25({SEARCH_TABLE}, {weights}) AS score FROM {SEARCH_TABLE} '
+                f'WHERE {SEARCH_TABLE} MATCH %s {kind_filter} LIMIT %s'
+                f') ORDER BY score LIMIT %s',
+                params
+            )
+            return [
+                (KIND_NAMES[rowid % KIND_SLOTS], rowid // KIND_SLOTS)
+                for (rowid,) in cursor.fetchall()
+            ]
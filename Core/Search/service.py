@@ -0,0 +1,109 @@
+import logging
+import re
+
+from django.conf import settings
+from django.db.models import Q
+
+from Core.Movies.models import Movie
+from Core.Movies.serializer import MovieSerializer
+from Core.Producers.models import Producer
+from Core.Search.repository import KIND_NAMES, SearchRepository
+from Core.Studio.models import Studio
+
+logger = logging.getLogger(__name__)
+
+
+class SearchService:
+    DEFAULT_LIMIT = 20
+    DEFAULT_MAX_LIMIT = 100
+    DEFAULT_CANDIDATE_LIMIT = 5000
+    KINDS = {name: kind for kind, name in KIND_NAMES.items()}
+
+    @staticmethod
+    def get_max_limit():
+        return getattr(settings, "SEARCH_MAX_LIMIT", SearchService.DEFAULT_MAX_LIMIT)
+
+    @staticmethod
+    def get_candidate_limit():
+        return getattr(settings, "SEARCH_CANDIDATE_LIMIT", SearchService.DEFAULT_CANDIDATE_LIMIT)
+
+    @staticmethod
+    def parse_limit(limit):
+        try:
+            limit = int(limit)
+        except (TypeError, ValueError):
+            raise ValueError("Invalid value for 'limit'. Expected an integer.")
+        if limit < 1:
+            raise ValueError("Invalid value for 'limit'. Expected a positive integer.")
+        return min(limit, SearchService.get_max_limit())
+
+    @staticmethod
+    def tokenize(query):
+        return re.findall(r"\w+", query or "")
+
+    @staticmethod
+    def build_match_query(query):
+        """
+        Turns free text into an FTS5 query: every word must match, as a
+        prefix. Words are quoted so user input can never be parsed as
+        FTS5 syntax.
+        """
+        return " ".join(f'"{token}"*' for token in SearchService.tokenize(query))
+
+    @staticmethod
+    def search(query, limit=None, kind=None):
+        try:
+            if not SearchService.tokenize(query):
+                raise ValueError("Invalid value for 'q'. Expected at least one word.")
+            limit = SearchService.parse_limit(limit or SearchService.DEFAULT_LIMIT)
+            if kind is not None and kind not in SearchService.KINDS:
+                raise ValueError(f"Invalid value for 'type'. Expected one of: {', '.join(SearchService.KINDS)}.")
+
+            if SearchRepository.is_available():
+                hits = SearchRepository.search(
+                    SearchService.build_match_query(query),
+                    limit,
+                    SearchService.KINDS.get(kind),
+                    SearchService.get_candidate_limit()
+                )
+            else:
+                hits = SearchService.search_without_index(query, limit, kind)
+            return {"query": query, "results": SearchService.load_results(hits)}
+        except ValueError as ve:
+            logger.warning(f"Invalid search: {ve}")
+            raise
+        except Exception as e:
+            logger.error(f"Error searching for '{query}': {e}")
+            raise
+
+    @staticmethod
+    def search_without_index(query, limit, kind=None):
+        """Unranked fallback for databases without FTS5."""
+        tokens = SearchService.tokenize(query)
+        hits = []
+        for name, model, field in (("movie", Movie, "title"), ("producer", Producer, "name"), ("studio", Studio, "name")):
+            if kind not in (None, name):
+                continue
+            condition = Q()
+            for token in tokens:
+                condition &= Q(**{f"{field}__icontains": token})
+            ids = model.objects.filter(condition).order_by(field).values_list("id", flat=True)[:limit - len(hits)]
+            hits.extend((name, object_id) for object_id in ids)
+        return hits
+
+    @staticmethod
+    def load_results(hits):
+        ids = {name: [object_id for kind, object_id in hits if kind == name] for name in SearchService.KINDS}
+        movies = Movie.objects.prefetch_related('producer', 'studio').in_bulk(ids["movie"])
+        producers = Producer.objects.in_bulk(ids["producer"])
+        studios = Studio.objects.in_bulk(ids["studio"])
+
+        results = []
+        for kind, object_id in hits:
+            if kind == "movie" and object_id in movies:
+                results.append({"type": kind, **MovieSerializer(movies[object_id]).data})
+            elif kind == "producer" and object_id in producers:
+                results.append({"type": kind, "id": object_id, "name": producers[object_id].name})
+            elif kind == "studio" and object_id in studios:
+                results.append({"type": kind, "id": object_id, "name": studios[object_id].name})
+        return results
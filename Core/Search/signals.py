@@ -0,0 +1,65 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from Core.Movies.models import Movie
+from Core.Producers.models import Producer
+from Core.Search.repository import SearchRepository
+from Core.Studio.models import Studio
+
+
+def get_movie_ids(instance):
+    return list(instance.movies.values_list('id', flat=True))
+
+
+@receiver(post_save, sender=Movie)
+@receiver(post_delete, sender=Movie)
+def refresh_search_on_movie_change(sender, instance, **kwargs):
+    SearchRepository.refresh_movies([instance.pk])
+
+
+@receiver(m2m_changed, sender=Movie.producer.through)
+@receiver(m2m_changed, sender=Movie.studio.through)
+def refresh_search_on_movie_relations_change(sender, instance, action, reverse, pk_set, **kwargs):
+    if not reverse:
+        if action in ('post_add', 'post_remove', 'post_clear'):
+            SearchRepository.refresh_movies([instance.pk])
+        return
+    if action == 'pre_clear':
+        instance._search_movie_ids = get_movie_ids(instance)
+    elif action == 'post_clear':
+        SearchRepository.refresh_movies(instance._search_movie_ids)
+    elif action in ('post_add', 'post_remove'):
+        SearchRepository.refresh_movies(pk_set)
+
+
+@receiver(post_save, sender=Producer)
+def refresh_search_on_producer_save(sender, instance, created, **kwargs):
+    SearchRepository.refresh_producers([instance.pk])
+    if not created:
+        SearchRepository.refresh_movies(get_movie_ids(instance))
+
+
+@receiver(post_save, sender=Studio)
+def refresh_search_on_studio_save(sender, instance, created, **kwargs):
+    SearchRepository.refresh_studios([instance.pk])
+    if not created:
+        SearchRepository.refresh_movies(get_movie_ids(instance))
+
+
+@receiver(pre_delete, sender=Producer)
+@receiver(pre_delete, sender=Studio)
+def remember_movies_on_name_delete(sender, instance, **kwargs):
+    # The movie links are removed by cascade, without m2m_changed.
+    instance._search_movie_ids = get_movie_ids(instance)
+
+
+@receiver(post_delete, sender=Producer)
+def refresh_search_on_producer_delete(sender, instance, **kwargs):
+    SearchRepository.refresh_producers([instance.pk])
+    SearchRepository.refresh_movies(getattr(instance, '_search_movie_ids', []))
+
+
+@receiver(post_delete, sender=Studio)
+def refresh_search_on_studio_delete(sender, instance, **kwargs):
+    SearchRepository.refresh_studios([instance.pk])
+    SearchRepository.refresh_movies(getattr(instance, '_search_movie_ids', []))
@@ -0,0 +1,111 @@
+import io
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import connection
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from Core.Movies.models import Movie
+from Core.Movies.service import ImportMovieCSVService, MovieService
+from Core.Producers.models import Producer
+from Core.Search.repository import SEARCH_TABLE
+from Core.Search.service import SearchService
+from Core.Studio.models import Studio
+
+
+def search(query, **kwargs):
+    return [
+        (result["type"], result.get("title") or result["name"])
+        for result in SearchService.search(query, **kwargs)["results"]
+    ]
+
+
+@pytest.fixture
+def catalog():
+    MovieService.create_movie("Star Wars", 1980, ["George Lucas"], ["Twentieth Century Fox"], True)
+    MovieService.create_movie("Stardust", 1990, ["Matthew Vaughn"], ["Paramount Pictures"], False)
+    MovieService.create_movie("Howard the Duck", 1986, ["Gloria Katz", "George Lucas"], ["Universal Studios"], True)
+
+
+@pytest.mark.django_db
+def test_search_matches_prefixes_and_ranks_titles_first(catalog):
+    assert sorted(search("sta")) == [("movie", "Star Wars"), ("movie", "Stardust")]
+    assert search("george luc") == [
+        ("producer", "George Lucas"), ("movie", "Star Wars"), ("movie", "Howard the Duck")
+    ]
+    assert search("PARAMÔUNT") == [("studio", "Paramount Pictures"), ("movie", "Stardust")]
+    assert search("lucas", kind="movie", limit=1) == [("movie", "Star Wars")]
+    assert search("wars universal") == []
+
+
+@pytest.mark.django_db
+def test_search_input_is_never_parsed_as_fts_syntax(catalog):
+    assert search('"star" wa*') == [("movie", "Star Wars")]
+    assert search("star OR duck") == []
+    with pytest.raises(ValueError):
+        SearchService.search(' *"() ')
+
+
+@pytest.mark.django_db
+def test_index_follows_catalog_writes(catalog):
+    lucas = Producer.objects.get(name="George Lucas")
+    lucas.name = "Georgina Lucas"
+    lucas.save()
+    assert search("georgina") == [
+        ("producer", "Georgina Lucas"), ("movie", "Star Wars"), ("movie", "Howard the Duck")
+    ]
+    assert search("george") == []
+
+    howard = Movie.objects.get(title="Howard the Duck")
+    howard.producer.remove(lucas)
+    howard.title = "Howard"
+    howard.save()
+    assert search("georgina", kind="movie") == [("movie", "Star Wars")]
+    assert search("duck") == []
+
+    Studio.objects.get(name="Twentieth Century Fox").delete()
+    assert search("fox") == []
+    Movie.objects.get(title="Stardust").delete()
+    assert search("stardust") == []
+
+    lucas.movies.clear()
+    assert search("georgina") == [("producer", "Georgina Lucas")]
+
+
+@pytest.mark.django_db
+def test_imports_are_indexed_and_index_can_be_rebuilt(catalog):
+    file = io.BytesIO(b"year;title;studios;producers;winner\n2001;Spacecamp;Orion;Walter Coblenz;yes\n")
+    file.name = "movies.csv"
+    ImportMovieCSVService.process_file(file)
+    assert search("coblenz") == [("producer", "Walter Coblenz"), ("movie", "Spacecamp")]
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {SEARCH_TABLE}")
+    assert search("orion") == []
+    call_command("rebuild_search_index", stdout=io.StringIO())
+    assert search("orion") == [("studio", "Orion"), ("movie", "Spacecamp")]
+
+
+@pytest.mark.django_db
+def test_search_view(catalog):
+    client = APIClient()
+    client.force_authenticate(user=User.objects.create(username="search"))
+
+    response = client.get(reverse("search"), {"q": "star wa"})
+    assert response.status_code == 200
+    assert response.data["query"] == "star wa"
+    assert response.data["results"] == [{
+        "type": "movie",
+        "id": Movie.objects.get(title="Star Wars").id,
+        "title": "Star Wars",
+        "year": 1980,
+        "winner": True,
+        "producer_name": ["George Lucas"],
+        "studio_name": ["Twentieth Century Fox"],
+    }]
+
+    assert client.get(reverse("search")).status_code == 400
+    assert client.get(reverse("search"), {"q": "star", "type": "actor"}).status_code == 400
+    assert client.get(reverse("search"), {"q": "star", "limit": "0"}).status_code == 400
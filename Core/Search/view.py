@@ -0,0 +1,39 @@
+from drf_yasg import openapi
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from Core.Search.service import SearchService
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class SearchView(APIView):
+    @swagger_auto_schema(
+        operation_description="Full-text search over movie titles, producers and studios, best match first. "
+                              "Every word must match, as a prefix.",
+        manual_parameters=[
+            openapi.Parameter('q', openapi.IN_QUERY, type=openapi.TYPE_STRING, required=True),
+            openapi.Parameter('type', openapi.IN_QUERY, type=openapi.TYPE_STRING, enum=['movie', 'producer', 'studio']),
+            openapi.Parameter('limit', openapi.IN_QUERY, type=openapi.TYPE_INTEGER),
+        ],
+        responses={
+            200: "Ranked movies, producers and studios.",
+            400: "Missing or invalid query."
+        }
+    )
+    def get(self, request):
+        try:
+            results = SearchService.search(
+                request.query_params.get("q", ""),
+                request.query_params.get("limit"),
+                request.query_params.get("type")
+            )
+            return Response(results, status=status.HTTP_200_OK)
+        except ValueError as ve:
+            return Response({"error": str(ve)}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            logger.error(f"Unexpected error: {e}")
+            return Response({"error": "An unexpected error occurred."}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -1,8 +1,30 @@
 from django.db import models
 
+from Core.normalization import normalize_name
+
 
 class Studio(models.Model):
     name = models.CharField(max_length=255)
+    name_key = models.CharField(max_length=255, unique=True, editable=False)
+
+    def save(self, *args, **kwargs):
+        self.name_key = normalize_name(self.name)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'name' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'name_key'}
+        super().save(*args, **kwargs)
 
     def __str__(self):
         return self.name
+
+
+class StudioWinCount(models.Model):
+    studio = models.OneToOneField(
+        Studio,
+        on_delete=models.CASCADE,
+        related_name='win_count'
+    )
+    win_count = models.PositiveIntegerField(default=0, db_index=True)
+
+    def __str__(self):
+        return f"{self.studio.name}: {self.win_count}"
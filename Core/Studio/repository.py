@@ -1,4 +1,18 @@
-from Core.Studio.models import Studio
+from django.db import transaction
+from django.db.models import Count, Sum
+
+from Core.DataVersion.repository import DataVersionRepository
+from Core.Movies.models import Movie
+from Core.normalization import normalize_name
+from Core.prefix_index import PrefixIndex
+from Core.Studio.models import Studio, StudioWinCount
+
+
+NAME_LOOKUP_CHUNK_SIZE = 500
+
+STUDIO_NAMES = PrefixIndex(
+    lambda: Studio.objects.values_list('id', 'name').iterator(chunk_size=2000)
+)
 
 
 class StudioRepository:
@@ -13,20 +27,119 @@ class StudioRepository:
         except Studio.DoesNotExist:
             return None
 
+    @staticmethod
+    async def aget_all_studios():
+        return [studio async for studio in Studio.objects.all().aiterator()]
+
+    @staticmethod
+    async def aget_studio_by_id(studio_id):
+        try:
+            return await Studio.objects.aget(id=studio_id)
+        except Studio.DoesNotExist:
+            return None
+
+    @staticmethod
+    def get_studios_by_ids(ids):
+        return Studio.objects.in_bulk(ids)
+
+    @staticmethod
+    async def aget_studios_by_ids(ids):
+        return await Studio.objects.ain_bulk(ids)
+
+    @staticmethod
+    def get_ordered_studios():
+        return Studio.objects.order_by('id')
+
+    @staticmethod
+    def get_studios_after(after_id=None, limit=10):
+        studios = StudioRepository.get_ordered_studios()
+        if after_id is not None:
+            studios = studios.filter(id__gt=after_id)
+        return list(studios[:limit])
+
+    @staticmethod
+    async def acount_studios():
+        return await Studio.objects.acount()
+
+    @staticmethod
+    async def aget_studios(offset, limit):
+        studios = StudioRepository.get_ordered_studios()[offset:offset + limit]
+        return [studio async for studio in studios.aiterator()]
+
+    @staticmethod
+    async def aget_studios_after(after_id=None, limit=10):
+        studios = StudioRepository.get_ordered_studios()
+        if after_id is not None:
+            studios = studios.filter(id__gt=after_id)
+        return [studio async for studio in studios[:limit].aiterator()]
+
+    @staticmethod
+    def iter_studio_rows(chunk_size):
+        """Yields {'id', 'name'} dicts in id order, fetching `chunk_size` rows at a time."""
+        return StudioRepository.get_ordered_studios().values('id', 'name').iterator(chunk_size=chunk_size)
+
+    @staticmethod
+    def aiter_studio_rows(chunk_size):
+        # values() rather than values_list(): Django 4.2.0 evaluates
+        # values_list() eagerly under aiterator().
+        return StudioRepository.get_ordered_studios().values('id', 'name').aiterator(chunk_size=chunk_size)
+
+    @staticmethod
+    def suggest_studios(prefix, limit):
+        """Returns up to `limit` (id, name) pairs whose name starts with `prefix`, from memory."""
+        return STUDIO_NAMES.lookup(prefix, limit)
+
     @staticmethod
     def get_or_create_studio(studio_data):
-        studio, _ = Studio.objects.get_or_create(
-            name=studio_data['name'].strip()
+        studio, created = Studio.objects.get_or_create(
+            name_key=normalize_name(studio_data['name']),
+            defaults={'name': studio_data['name'].strip()}
         )
+        if created:
+            STUDIO_NAMES.put_on_commit([studio])
         return studio
 
+    @staticmethod
+    def get_studios_by_key(name_keys):
+        name_keys = list(name_keys)
+        studios = {}
+        for start in range(0, len(name_keys), NAME_LOOKUP_CHUNK_SIZE):
+            chunk = name_keys[start:start + NAME_LOOKUP_CHUNK_SIZE]
+            studios.update(
+                (studio.name_key, studio)
+                for studio in Studio.objects.filter(name_key__in=chunk)
+            )
+        return studios
+
+    @staticmethod
+    def get_or_create_studios_by_name(studio_names):
+        """Resolves names in bulk through their normalized key; returns name -> Studio."""
+        keys = {name: normalize_name(name) for name in studio_names}
+        studios = StudioRepository.get_studios_by_key(set(keys.values()))
+        missing = {}
+        for name, key in keys.items():
+            if key not in studios:
+                missing.setdefault(key, Studio(name=name.strip(), name_key=key))
+        if missing:
+            Studio.objects.bulk_create(missing.values(), ignore_conflicts=True)
+            DataVersionRepository.bump()
+            created = StudioRepository.get_studios_by_key(missing)
+            studios.update(created)
+            STUDIO_NAMES.put_on_commit(created.values())
+        return {name: studios[key] for name, key in keys.items()}
+
     @staticmethod
     def create_studio(name):
-        return Studio.objects.create(name=name)
+        studio = Studio.objects.create(name=name)
+        STUDIO_NAMES.put_on_commit([studio])
+        return studio
 
     @staticmethod
-    def exists_by_name(name):
-        return Studio.objects.filter(name=name).exists()
+    def exists_by_name(name, exclude_id=None):
+        studios = Studio.objects.filter(name_key=normalize_name(name))
+        if exclude_id is not None:
+            studios = studios.exclude(pk=exclude_id)
+        return studios.exists()
 
     @staticmethod
     def update_studio(studio_id, name):
@@ -34,6 +147,7 @@ class StudioRepository:
         if studio:
             studio.name = name
             studio.save()
+            STUDIO_NAMES.put_on_commit([studio])
             return studio
         return None
 
@@ -41,6 +155,52 @@ class StudioRepository:
     def delete_studio(studio_id):
         studio = StudioRepository.get_studio_by_id(studio_id)
         if studio:
+            STUDIO_NAMES.remove_on_commit(studio.id)
             studio.delete()
             return True
         return False
+
+
+class StudioWinCountRepository:
+    @staticmethod
+    def count_wins(studio_ids=None):
+        wins = Movie.studio.through.objects.filter(movie__winner=True)
+        if studio_ids is not None:
+            wins = wins.filter(studio_id__in=studio_ids)
+        return (
+            wins.values('studio_id')
+            .annotate(wins=Count('id'))
+            .values_list('studio_id', 'wins')
+        )
+
+    @staticmethod
+    def refresh_studios(studio_ids):
+        """Recounts the stored wins of the given studios only."""
+        studio_ids = sorted(set(studio_ids))
+        with transaction.atomic():
+            for start in range(0, len(studio_ids), NAME_LOOKUP_CHUNK_SIZE):
+                chunk = studio_ids[start:start + NAME_LOOKUP_CHUNK_SIZE]
+                StudioWinCount.objects.filter(studio_id__in=chunk).delete()
+                StudioWinCount.objects.bulk_create([
+                    StudioWinCount(studio_id=studio_id, win_count=wins)
+                    for studio_id, wins in StudioWinCountRepository.count_wins(chunk)
+                ])
+
+    @staticmethod
+    def rebuild_all():
+        with transaction.atomic():
+            StudioWinCount.objects.all().delete()
+            counts = [
+                StudioWinCount(studio_id=studio_id, win_count=wins)
+                for studio_id, wins in StudioWinCountRepository.count_wins()
+            ]
+            StudioWinCount.objects.bulk_create(counts, batch_size=1000)
+        return len(counts)
+
+    @staticmethod
+    def get_studios_with_wins():
+        return (
+            StudioWinCount.objects.values('studio__name')
+            .annotate(wins=Sum('win_count'))
+            .order_by('-wins', 'studio__name')
+        )
@@ -1,11 +1,129 @@
 import logging
 
+from django.conf import settings
+from django.core.paginator import Paginator
+
+from Core import pagination
+from Core.prefix_index import PrefixIndex
 from Core.Studio.repository import StudioRepository
 
 logger = logging.getLogger(__name__)
 
 
 class StudioService:
+    DEFAULT_MAX_PAGE_SIZE = 100
+    DEFAULT_STREAM_CHUNK_SIZE = 2000
+
+    @staticmethod
+    def get_max_page_size():
+        return getattr(settings, "STUDIOS_MAX_PAGE_SIZE", StudioService.DEFAULT_MAX_PAGE_SIZE)
+
+    @staticmethod
+    def get_stream_chunk_size():
+        return getattr(settings, "LIST_STREAM_CHUNK_SIZE", StudioService.DEFAULT_STREAM_CHUNK_SIZE)
+
+    @staticmethod
+    def serialize(studios):
+        return [{'id': studio.id, 'name': studio.name} for studio in studios]
+
+    @staticmethod
+    def parse_page_params(params):
+        page = pagination.parse_page(params.get("page", 1))
+        size = pagination.parse_page_size(params.get("size", 10), StudioService.get_max_page_size())
+        return page, size
+
+    @staticmethod
+    def get_studios_page(params):
+        """
+        Pages through the studios in id order with the /core/movies/ contract:
+        page and size, or a cursor from the previous page's `next`.
+        """
+        try:
+            page, size = StudioService.parse_page_params(params)
+            if "cursor" in params:
+                studios = StudioRepository.get_studios_after(
+                    pagination.decode_cursor(params["cursor"]), size + 1
+                )
+                studios, next_cursor = pagination.split_cursor_page(studios, size)
+                return pagination.format_cursor_page(
+                    StudioService.serialize(studios), params["cursor"], next_cursor, size
+                )
+            paginator = Paginator(StudioRepository.get_ordered_studios(), size)
+            paginated = paginator.get_page(page)
+            return pagination.format_page(
+                StudioService.serialize(paginated.object_list), paginator, paginated, page, size
+            )
+        except ValueError as ve:
+            logger.warning(f"Invalid paging value: {ve}")
+            raise
+        except Exception as e:
+            logger.error(f"Failed to fetch a page of studios: {str(e)}")
+            raise
+
+    @staticmethod
+    async def aget_studios_page(params):
+        try:
+            page, size = StudioService.parse_page_params(params)
+            if "cursor" in params:
+                studios = await StudioRepository.aget_studios_after(
+                    pagination.decode_cursor(params["cursor"]), size + 1
+                )
+                studios, next_cursor = pagination.split_cursor_page(studios, size)
+                return pagination.format_cursor_page(
+                    StudioService.serialize(studios), params["cursor"], next_cursor, size
+                )
+            paginator = pagination.count_paginator(await StudioRepository.acount_studios(), size)
+            paginated = paginator.get_page(page)
+            studios = await StudioRepository.aget_studios((paginated.number - 1) * size, size)
+            return pagination.format_page(
+                StudioService.serialize(studios), paginator, paginated, page, size
+            )
+        except ValueError as ve:
+            logger.warning(f"Invalid paging value: {ve}")
+            raise
+        except Exception as e:
+            logger.error(f"Failed to fetch a page of studios: {str(e)}")
+            raise
+
+    @staticmethod
+    def stream_studios():
+        """
+        The full studio list as JSON text chunks, read from the database
+        LIST_STREAM_CHUNK_SIZE rows at a time.
+        """
+        chunk_size = StudioService.get_stream_chunk_size()
+        return pagination.stream_json_array(StudioRepository.iter_studio_rows(chunk_size), chunk_size)
+
+    @staticmethod
+    def astream_studios():
+        chunk_size = StudioService.get_stream_chunk_size()
+        return pagination.astream_json_array(StudioRepository.aiter_studio_rows(chunk_size), chunk_size)
+
+    @staticmethod
+    def get_studios_by_ids(ids):
+        """The studios of an ?ids= lookup, in the caller's order, with the missing ids."""
+        try:
+            ids = pagination.parse_ids(ids)
+            return pagination.format_batch(ids, StudioRepository.get_studios_by_ids(ids), StudioService.serialize)
+        except ValueError as ve:
+            logger.warning(f"Invalid ids value: {ve}")
+            raise
+        except Exception as e:
+            logger.error(f"Failed to fetch studios by ids: {str(e)}")
+            raise
+
+    @staticmethod
+    async def aget_studios_by_ids(ids):
+        try:
+            ids = pagination.parse_ids(ids)
+            return pagination.format_batch(ids, await StudioRepository.aget_studios_by_ids(ids), StudioService.serialize)
+        except ValueError as ve:
+            logger.warning(f"Invalid ids value: {ve}")
+            raise
+        except Exception as e:
+            logger.error(f"Failed to fetch studios by ids: {str(e)}")
+            raise
+
     @staticmethod
     def get_all_studios():
         try:
@@ -25,6 +143,37 @@ class StudioService:
             logger.error(f"Error fetching studio by ID {studio_id}: {str(e)}")
             raise
 
+    @staticmethod
+    async def aget_all_studios():
+        try:
+            return await StudioRepository.aget_all_studios()
+        except Exception as e:
+            logger.error(f"Failed to fetch all studios: {str(e)}")
+            raise
+
+    @staticmethod
+    async def aget_studio_by_id(studio_id):
+        try:
+            studio = await StudioRepository.aget_studio_by_id(studio_id)
+            if not studio:
+                logger.warning(f"Studio with ID {studio_id} not found.")
+            return studio
+        except Exception as e:
+            logger.error(f"Error fetching studio by ID {studio_id}: {str(e)}")
+            raise
+
+    @staticmethod
+    def suggest_studios(prefix, limit=None):
+        try:
+            if not prefix or not prefix.strip():
+                message = "Prefix is required"
+                logger.warning(message)
+                raise ValueError(message)
+            return StudioRepository.suggest_studios(prefix, PrefixIndex.parse_limit(limit))
+        except Exception as e:
+            logger.error(f"Error suggesting studios for '{prefix}': {str(e)}")
+            raise
+
     @staticmethod
     def create_studio(name):
         try:
@@ -42,6 +191,10 @@ class StudioService:
     @staticmethod
     def update_studio(studio_id, name):
         try:
+            if StudioRepository.exists_by_name(name, exclude_id=studio_id):
+                message = f"Studio with name '{name}' already exists."
+                logger.warning(message)
+                raise ValueError(message)
             studio = StudioRepository.update_studio(studio_id, name)
             if studio:
                 logger.info(f"Studio ID {studio_id} updated successfully.")
@@ -0,0 +1,48 @@
+import pytest
+from django.contrib.auth.models import User
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from Core.Studio.models import Studio
+from Core.Studio.repository import STUDIO_NAMES, StudioRepository
+from Core.Studio.service import StudioService
+
+
+@pytest.fixture(autouse=True)
+def empty_index():
+    STUDIO_NAMES.invalidate()
+    yield
+    STUDIO_NAMES.invalidate()
+
+
+@pytest.fixture
+def api_client():
+    client = APIClient()
+    client.force_authenticate(user=User.objects.create(username="suggest"))
+    return client
+
+
+@pytest.mark.django_db
+def test_index_is_reloaded_after_its_ttl(settings):
+    StudioRepository.get_or_create_studio({"name": "Paramount Pictures"})
+    assert [name for _, name in StudioService.suggest_studios("par")] == ["Paramount Pictures"]
+
+    # Written by another process: this process never sees the commit.
+    Studio.objects.create(name="Pariah")
+    assert [name for _, name in StudioService.suggest_studios("par")] == ["Paramount Pictures"]
+
+    settings.SUGGEST_INDEX_TTL = 0
+    assert [name for _, name in StudioService.suggest_studios("par")] == ["Paramount Pictures", "Pariah"]
+
+
+@pytest.mark.django_db
+def test_suggest_view(api_client):
+    StudioRepository.create_studio("Warner Bros.")
+
+    response = api_client.get(reverse("studio-suggest"), {"prefix": "warner", "limit": 5})
+    assert response.status_code == 200
+    assert [studio["name"] for studio in response.json()] == ["Warner Bros."]
+
+    assert api_client.get(reverse("studio-suggest")).status_code == 400
+    assert api_client.get(reverse("studio-suggest"), {"prefix": "w", "limit": "x"}).status_code == 400
+    assert APIClient().get(reverse("studio-suggest"), {"prefix": "w"}).status_code == 401
@@ -1,4 +1,7 @@
+from Core import pagination
+from Core.async_api import AsyncAPIView, AsyncJSONResponse
 from Core.Studio.service import StudioService
+from django.http import StreamingHttpResponse
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
@@ -7,14 +10,28 @@ from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 
 
+LIST_PARAMETERS = [
+    openapi.Parameter('page', openapi.IN_QUERY, type=openapi.TYPE_INTEGER),
+    openapi.Parameter('size', openapi.IN_QUERY, type=openapi.TYPE_INTEGER),
+    openapi.Parameter('cursor', openapi.IN_QUERY, type=openapi.TYPE_STRING),
+    openapi.Parameter('stream', openapi.IN_QUERY, type=openapi.TYPE_BOOLEAN),
+    openapi.Parameter('ids', openapi.IN_QUERY, type=openapi.TYPE_STRING,
+                      description='Comma-separated ids to fetch in one request'),
+]
+
+
 class StudioView(APIView):
     permission_classes = [IsAuthenticated]
 
     @swagger_auto_schema(
-        operation_description="Get a list of studios or a studio by ID",
+        operation_description="Get a list of studios or a studio by ID. The list is paged like /core/movies/ "
+                              "when page, size or cursor is given, and streamed with stream=true. "
+                              "ids=1,2,3 fetches those studios in that order and lists the missing ids.",
         security=[{'BearerAuth': []}],
+        manual_parameters=LIST_PARAMETERS,
         responses={
             200: 'Studio list or single studio details',
+            400: 'Invalid paging value',
             404: 'Studio not found'
         }
     )
@@ -30,12 +47,32 @@ class StudioView(APIView):
                 {'errors': ['Studio not found']},
                 status=status.HTTP_404_NOT_FOUND
             )
-        else:
-            studios = StudioService.get_all_studios()
+        try:
+            if pagination.is_batch(request.query_params):
+                return Response(
+                    StudioService.get_studios_by_ids(request.query_params['ids']),
+                    status=status.HTTP_200_OK
+                )
+            if pagination.is_streamed(request.query_params):
+                return StreamingHttpResponse(
+                    StudioService.stream_studios(),
+                    content_type='application/json'
+                )
+            if pagination.is_paged(request.query_params):
+                return Response(
+                    StudioService.get_studios_page(request.query_params),
+                    status=status.HTTP_200_OK
+                )
+        except ValueError as ve:
             return Response(
-                [{'id': s.id, 'name': s.name} for s in studios],
-                status=status.HTTP_200_OK
+                {'errors': [str(ve)]},
+                status=status.HTTP_400_BAD_REQUEST
             )
+        studios = StudioService.get_all_studios()
+        return Response(
+            [{'id': s.id, 'name': s.name} for s in studios],
+            status=status.HTTP_200_OK
+        )
 
     @swagger_auto_schema(
         operation_description="Create a new studio",
@@ -84,7 +121,7 @@ class StudioView(APIView):
         responses={
             200: 'Studio updated',
             404: 'Studio not found',
-            400: 'Name is required'
+            400: 'Name is required or already exists'
         }
     )
     def put(self, request, studio_id):
@@ -94,7 +131,13 @@ class StudioView(APIView):
                 {'errors': ['Name is required']},
                 status=status.HTTP_400_BAD_REQUEST
             )
-        studio = StudioService.update_studio(studio_id, name)
+        try:
+            studio = StudioService.update_studio(studio_id, name)
+        except ValueError as ve:
+            return Response(
+                {'errors': [str(ve)]},
+                status=status.HTTP_400_BAD_REQUEST
+            )
         if studio:
             return Response(
                 {'id': studio.id, 'name': studio.name},
@@ -124,3 +167,77 @@ class StudioView(APIView):
             {'errors': ['Studio not found']},
             status=status.HTTP_404_NOT_FOUND
         )
+
+
+class StudioSuggestView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    @swagger_auto_schema(
+        operation_description="Suggest studios whose name starts with the given prefix, "
+                              "ignoring case and repeated spaces. Served from memory.",
+        security=[{'BearerAuth': []}],
+        manual_parameters=[
+            openapi.Parameter('prefix', openapi.IN_QUERY, type=openapi.TYPE_STRING, required=True),
+            openapi.Parameter('limit', openapi.IN_QUERY, type=openapi.TYPE_INTEGER),
+        ],
+        responses={
+            200: 'Studios in name order',
+            400: 'Missing prefix or invalid limit'
+        }
+    )
+    def get(self, request):
+        try:
+            studios = StudioService.suggest_studios(
+                request.query_params.get('prefix'),
+                request.query_params.get('limit')
+            )
+        except ValueError as ve:
+            return Response(
+                {'errors': [str(ve)]},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        return Response(
+            [{'id': studio_id, 'name': name} for studio_id, name in studios],
+            status=status.HTTP_200_OK
+        )
+
+
+class AsyncStudioView(AsyncAPIView):
+    async def get(self, request, studio_id=None):
+        if studio_id:
+            studio = await StudioService.aget_studio_by_id(studio_id)
+            if studio:
+                return AsyncJSONResponse(
+                    {'id': studio.id, 'name': studio.name},
+                    status=status.HTTP_200_OK
+                )
+            return AsyncJSONResponse(
+                {'errors': ['Studio not found']},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        try:
+            if pagination.is_batch(request.GET):
+                return AsyncJSONResponse(
+                    await StudioService.aget_studios_by_ids(request.GET['ids']),
+                    status=status.HTTP_200_OK
+                )
+            if pagination.is_streamed(request.GET):
+                return StreamingHttpResponse(
+                    StudioService.astream_studios(),
+                    content_type='application/json'
+                )
+            if pagination.is_paged(request.GET):
+                return AsyncJSONResponse(
+                    await StudioService.aget_studios_page(request.GET),
+                    status=status.HTTP_200_OK
+                )
+        except ValueError as ve:
+            return AsyncJSONResponse(
+                {'errors': [str(ve)]},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        studios = await StudioService.aget_all_studios()
+        return AsyncJSONResponse(
+            [{'id': s.id, 'name': s.name} for s in studios],
+            status=status.HTTP_200_OK
+        )
@@ -1,6 +1,11 @@
+import logging
+
+from Core.Instrumentation import metrics
 from Core.Movies.service import MovieService
 from Core.Winners.repository import WinnerRepository
 
+logger = logging.getLogger(__name__)
+
 
 class WinnerService:
     @staticmethod
@@ -46,10 +51,16 @@ class WinnerCSVService:
             raise ValueError("The file must be an InMemoryUploadedFile")
         self.file = file
 
-    def process_and_prepare_data(self, content, old_delim=', ', new_delim=';'):
+    @staticmethod
+    def parse_rows(content, old_delim=', ', new_delim=';'):
+        """
+        Splits the file into (values, award) pairs, one per line that names
+        an award, skipping the header. Returns them with the number of
+        lines too short to hold one.
+        """
         modified_content = content.replace(old_delim, new_delim)
-        data_list = []
-        data_list_error = []
+        rows = []
+        skipped = 0
 
         for idx, line in enumerate(modified_content.splitlines()):
             if idx == 0:
@@ -58,19 +69,42 @@ class WinnerCSVService:
             if len(values) > 3:
                 for i in range(4, len(values)):
                     if values[i]:
-                        winner = WinnerService.create_winner(
-                            title=values[i],
-                            year=int(values[0]),
-                            producer_data=values[3],
-                            studio_data=values[2],
-                            movie_title=values[1]
-                        )
-                        if winner:
-                            data_list.append(winner)
-                        else:
-                            data_list_error.append(values)
+                        rows.append((values, values[i]))
                         break
             else:
-                print(f"Line length is not greater than 3: {values}")
+                logger.warning(f"Skipping winner line with fewer than 4 columns: {values}")
+                skipped += 1
+        return rows, skipped
+
+    @staticmethod
+    def validate_file(file, old_delim=', ', new_delim=';'):
+        """
+        Rejects, before any job is queued, a file without a single line
+        that names an award.
+        """
+        rows, _ = WinnerCSVService.parse_rows(file.read().decode('utf-8'), old_delim, new_delim)
+        file.seek(0)
+        if not rows:
+            raise ValueError("Error processing CSV data.")
+
+    def process_and_prepare_data(self, content, old_delim=', ', new_delim=';'):
+        data_list = []
+        data_list_error = []
+        rows, skipped = WinnerCSVService.parse_rows(content, old_delim, new_delim)
+
+        for values, award in rows:
+            winner = WinnerService.create_winner(
+                title=award,
+                year=int(values[0]),
+                producer_data=values[3],
+                studio_data=values[2],
+                movie_title=values[1]
+            )
+            if winner:
+                data_list.append(winner)
+            else:
+                data_list_error.append(values)
 
+        metrics.IMPORT_ROWS.inc(len(data_list), importer="winners")
+        metrics.IMPORT_ERRORS.inc(len(data_list_error) + skipped, importer="winners")
         return data_list, data_list_error
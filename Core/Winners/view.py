@@ -1,4 +1,6 @@
 import logging
+from Core.Jobs.models import ImportJob
+from Core.Jobs.service import ImportJobService
 from Core.Movies.service import MovieService
 from Core.Winners.serlializer import WinnerSerializer
 from Core.Winners.service import WinnerCSVService, WinnerService
@@ -6,6 +8,7 @@ from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from django.http import JsonResponse
+from django.urls import reverse
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework.permissions import IsAuthenticated
 
@@ -212,23 +215,16 @@ class WinnerImportCSVView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        service = WinnerCSVService(csv_file)
-        processed_data, data_list_errors = service.process_and_prepare_data(
-            csv_file.read().decode('utf-8'), old_delim=', ', new_delim=';'
-        )
-
-        if not processed_data:
-            return JsonResponse(
-                {"error": "Error processing CSV data."},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-
-        success_count = len(processed_data)
+        try:
+            WinnerCSVService.validate_file(csv_file)
+        except ValueError as e:
+            return JsonResponse({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
-        status_code = status.HTTP_200_OK
+        job = ImportJobService.enqueue(ImportJob.KIND_WINNERS, csv_file)
         return JsonResponse(
             {
-                "success_count": success_count,
-                "data_list": str(processed_data),
-                "errors": str(data_list_errors)
-            }, safe=False, status=status_code)
+                "message": "File queued for import.",
+                "jobId": job.id,
+                "status": job.status,
+                "statusUrl": reverse("import-job-detail", kwargs={"job_id": job.id})
+            }, status=status.HTTP_202_ACCEPTED)
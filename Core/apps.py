@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'Core'
+
+    def ready(self):
+        import Core.authentication  # noqa: F401
+        import Core.DataVersion.signals  # noqa: F401
+        import Core.Movies.signals  # noqa: F401
+        import Core.Search.signals  # noqa: F401
@@ -0,0 +1,94 @@
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.asgi import ASGIHandler
+from django.http import HttpResponse
+from django.views import View
+from rest_framework import exceptions
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+from rest_framework.views import exception_handler
+
+
+class AsyncJSONResponse(HttpResponse):
+    """JSON response rendered with the first DEFAULT_RENDERER_CLASSES renderer, like the DRF views."""
+
+    def __init__(self, data, status=200):
+        self.data = data
+        renderer = api_settings.DEFAULT_RENDERER_CLASSES[0]()
+        super().__init__(renderer.render(data), status=status, content_type="application/json")
+
+
+def authenticate(request):
+    """
+    Runs the configured DRF authentication and permission classes
+    against a plain Django request. Returns the DRF request and the
+    exception an APIView would have raised, if any.
+    """
+    drf_request = Request(
+        request,
+        authenticators=[authentication() for authentication in api_settings.DEFAULT_AUTHENTICATION_CLASSES]
+    )
+    try:
+        for permission in api_settings.DEFAULT_PERMISSION_CLASSES:
+            if not permission().has_permission(drf_request, None):
+                if drf_request.authenticators and not drf_request.successful_authenticator:
+                    raise exceptions.NotAuthenticated()
+                raise exceptions.PermissionDenied()
+    except exceptions.APIException as exc:
+        return drf_request, exc
+    return drf_request, None
+
+
+def error_response(drf_request, exc):
+    if isinstance(exc, (exceptions.NotAuthenticated, exceptions.AuthenticationFailed)):
+        authenticators = drf_request.authenticators
+        auth_header = authenticators[0].authenticate_header(drf_request) if authenticators else None
+        if auth_header:
+            exc.auth_header = auth_header
+        else:
+            exc.status_code = 403
+    response = exception_handler(exc, {})
+    if response is None:
+        raise exc
+    error = AsyncJSONResponse(response.data, status=response.status_code)
+    for header, value in response.items():
+        if header != "Content-Type":
+            error[header] = value
+    return error
+
+
+class AsyncAPIView(View):
+    """
+    Base class for async read views: authenticates like the DRF views
+    (the user lookup runs in a worker thread), then awaits the handler.
+    Handlers receive the Django request and return AsyncJSONResponse.
+    """
+
+    async def dispatch(self, request, *args, **kwargs):
+        drf_request, exc = await sync_to_async(authenticate)(request)
+        if exc is not None:
+            return error_response(drf_request, exc)
+        request.user = drf_request.user
+        return await super().dispatch(request, *args, **kwargs)
+
+
+def read_async(async_view, sync_view):
+    """
+    Serves GET and HEAD with the async view and every other method with
+    the synchronous DRF view, run in a worker thread.
+    """
+    async def view(request, *args, **kwargs):
+        if request.method in ("GET", "HEAD"):
+            return await async_view(request, *args, **kwargs)
+        return await sync_to_async(sync_view)(request, *args, **kwargs)
+
+    view.csrf_exempt = True
+    return view
+
+
+class AsyncReadASGIHandler(ASGIHandler):
+    """ASGI handler that resolves requests through ASGI_URLCONF."""
+
+    async def get_response_async(self, request):
+        request.urlconf = settings.ASGI_URLCONF
+        return await super().get_response_async(request)
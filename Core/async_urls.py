@@ -0,0 +1,43 @@
+from django.urls import path
+
+from Core.async_api import read_async
+from Core.Movies.view import (
+    AsyncMovieBulkExportView,
+    AsyncMovieExportView,
+    AsyncMoviesView,
+    AsyncProducersWithWinnerView,
+    AsyncStudiosWithWinnersView,
+    AsyncYearWithWinnerView,
+    AsyncYearsWithMultipleWinnersView,
+)
+from Core.Producers.view import AsyncProducerView
+from Core.Studio.view import AsyncStudioView
+from Core.urls import urlpatterns as sync_urlpatterns
+
+
+ASYNC_READ_VIEWS = {
+    'producer-list': AsyncProducerView,
+    'producer-detail': AsyncProducerView,
+    'studio-list': AsyncStudioView,
+    'studio-detail': AsyncStudioView,
+    'movie-list': AsyncMoviesView,
+    'movie-detail': AsyncMoviesView,
+    'movie-export': AsyncMovieExportView,
+    'movie-bulk-export': AsyncMovieBulkExportView,
+    'years-multiple-winners': AsyncYearsWithMultipleWinnersView,
+    'studios-with-winners': AsyncStudiosWithWinnersView,
+    'producers-with-winner': AsyncProducersWithWinnerView,
+    'year-with-winner': AsyncYearWithWinnerView,
+}
+
+# Same routes and names as Core.urls; GET requests on the read endpoints
+# go to the async views, everything else to the DRF views.
+urlpatterns = [
+    path(
+        str(pattern.pattern),
+        read_async(ASYNC_READ_VIEWS[pattern.name].as_view(), pattern.callback),
+        name=pattern.name
+    )
+    if pattern.name in ASYNC_READ_VIEWS else pattern
+    for pattern in sync_urlpatterns
+]
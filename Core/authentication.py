@@ -0,0 +1,130 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import aware_utcnow, get_md5_hash_password
+
+from Core.Instrumentation import metrics
+
+DEFAULT_CACHE_SIZE = 10000
+DEFAULT_CACHE_TTL = 60
+
+
+def get_cache_size():
+    return getattr(settings, "JWT_AUTH_CACHE_SIZE", DEFAULT_CACHE_SIZE)
+
+
+def get_cache_ttl():
+    return getattr(settings, "JWT_AUTH_CACHE_TTL", DEFAULT_CACHE_TTL)
+
+
+class ExpiringLRUCache:
+    """
+    Thread-safe per-process mapping that keeps the most recently used
+    entries, at most JWT_AUTH_CACHE_SIZE of them, each for at most
+    JWT_AUTH_CACHE_TTL seconds after it was stored.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and time.monotonic() >= entry[1]:
+                del self.entries[key]
+                entry = None
+            if entry is None:
+                metrics.CACHE_REQUESTS.inc(cache=self.name, result="miss")
+                return None
+            self.entries.move_to_end(key)
+        metrics.CACHE_REQUESTS.inc(cache=self.name, result="hit")
+        return entry[0]
+
+    def set(self, key, value):
+        with self.lock:
+            self.entries[key] = (value, time.monotonic() + get_cache_ttl())
+            self.entries.move_to_end(key)
+            while len(self.entries) > get_cache_size():
+                self.entries.popitem(last=False)
+
+    def discard(self, key):
+        with self.lock:
+            self.entries.pop(key, None)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+# Validated access tokens by SHA-256 digest of the raw token, and the
+# users they resolved to by user id claim.
+VALIDATED_TOKENS = ExpiringLRUCache("jwt_token")
+AUTHENTICATED_USERS = ExpiringLRUCache("jwt_user")
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication that remembers validated tokens and the users they
+    resolved to, so a repeated token costs neither a signature check nor
+    a query. Expired tokens are still rejected. Saving or deleting a user
+    (deactivation, password change) drops the cached user in this
+    process; other processes pick the change up within
+    JWT_AUTH_CACHE_TTL seconds. A TTL of 0 disables the cache.
+    """
+
+    def get_validated_token(self, raw_token):
+        if get_cache_ttl() <= 0:
+            return super().get_validated_token(raw_token)
+        key = hashlib.sha256(raw_token).digest()
+        validated_token = VALIDATED_TOKENS.get(key)
+        if validated_token is not None:
+            try:
+                validated_token.check_exp(current_time=aware_utcnow())
+                return validated_token
+            except TokenError:
+                VALIDATED_TOKENS.discard(key)
+        validated_token = super().get_validated_token(raw_token)
+        VALIDATED_TOKENS.set(key, validated_token)
+        return validated_token
+
+    def get_user(self, validated_token):
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        if get_cache_ttl() <= 0 or user_id is None:
+            return super().get_user(validated_token)
+        user = AUTHENTICATED_USERS.get(str(user_id))
+        if user is not None and (
+            not api_settings.CHECK_REVOKE_TOKEN
+            or validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) == get_md5_hash_password(user.password)
+        ):
+            return user
+        # Only users that passed the active and password checks are cached.
+        user = super().get_user(validated_token)
+        AUTHENTICATED_USERS.set(str(user_id), user)
+        return user
+
+
+def invalidate_user(user_id):
+    AUTHENTICATED_USERS.discard(str(user_id))
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def invalidate_user_on_write(sender, instance, update_fields=None, **kwargs):
+    # Logging in only stamps last_login, which changes nothing the checks read.
+    if update_fields is not None and set(update_fields) == {"last_login"}:
+        return
+    user_id = getattr(instance, api_settings.USER_ID_FIELD)
+    invalidate_user(user_id)
+    # Again after commit, in case a request cached the old row meanwhile.
+    transaction.on_commit(lambda: invalidate_user(user_id))
@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from Core.Movies.service import MovieExportService
+
+
+class Command(BaseCommand):
+    help = (
+        "Exports every movie to a file: 'csv' in the import format, or 'parquet', 'feather' or 'npz' "
+        "for analytics ('columnar' picks the best one installed)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("output", help="Path of the file to write.")
+        parser.add_argument(
+            "--format",
+            default="csv",
+            choices=MovieExportService.FORMATS,
+            help="Output format (default: csv)."
+        )
+
+    def handle(self, *args, **options):
+        try:
+            writer, chunks = MovieExportService.export_movies(options["format"])
+        except ValueError as e:
+            raise CommandError(str(e))
+        written = 0
+        with open(options["output"], "wb") as output:
+            for chunk in chunks:
+                output.write(chunk)
+                written += len(chunk)
+        self.stdout.write(self.style.SUCCESS(
+            f"Wrote {written} bytes of {writer.extension} to {options['output']}."
+        ))
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from Core.Producers.repository import ProducerWinIntervalRepository
+
+
+class Command(BaseCommand):
+    help = "Rebuilds the materialized producer win-interval table from scratch."
+
+    def handle(self, *args, **options):
+        saved = ProducerWinIntervalRepository.rebuild_all()
+        self.stdout.write(self.style.SUCCESS(f"Stored {saved} producer win interval(s)."))
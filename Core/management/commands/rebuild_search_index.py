@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from Core.Search.repository import SearchRepository
+
+
+class Command(BaseCommand):
+    help = "Rebuilds the full-text search index of movie titles, producers and studios."
+
+    def handle(self, *args, **options):
+        if not SearchRepository.is_available():
+            raise CommandError("The full-text search index requires SQLite with FTS5.")
+        documents = SearchRepository.rebuild_all()
+        self.stdout.write(self.style.SUCCESS(f"Indexed {documents} search document(s)."))
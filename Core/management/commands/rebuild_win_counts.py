@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from Core.Movies.repository import YearWinnerCountRepository
+from Core.Studio.repository import StudioWinCountRepository
+
+
+class Command(BaseCommand):
+    help = "Rebuilds the materialized per-year winner and per-studio win count tables."
+
+    def handle(self, *args, **options):
+        years = YearWinnerCountRepository.rebuild_all()
+        studios = StudioWinCountRepository.rebuild_all()
+        self.stdout.write(self.style.SUCCESS(
+            f"Stored winner counts for {years} year(s) and win counts for {studios} studio(s)."
+        ))
@@ -0,0 +1,45 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+
+from Core.Jobs.service import ImportJobService
+
+
+class Command(BaseCommand):
+    help = "Runs queued CSV import jobs with a pool of worker threads."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, default=1, help="Number of worker threads.")
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=1.0,
+            help="Seconds to wait before polling an empty queue again."
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Exit once the queue is empty instead of polling forever."
+        )
+
+    def handle(self, *args, **options):
+        workers = max(1, options["workers"])
+        if options["once"]:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                processed = sum(executor.map(
+                    lambda _: ImportJobService.run_pending_jobs(), range(workers)
+                ))
+            self.stdout.write(self.style.SUCCESS(f"Processed {processed} import job(s)."))
+            return
+
+        stop_event = threading.Event()
+        self.stdout.write(f"Running import jobs with {workers} worker(s). Press CTRL+C to stop.")
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for _ in range(workers):
+                executor.submit(ImportJobService.work, options["poll_interval"], stop_event)
+            try:
+                stop_event.wait()
+            except KeyboardInterrupt:
+                stop_event.set()
+                self.stdout.write("Stopping after the current jobs finish.")
@@ -0,0 +1,47 @@
+# Generated by Django 4.2 on 2026-10-18 10:08
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def build_producer_win_intervals(apps, schema_editor):
+    Movie = apps.get_model('Core', 'Movie')
+    ProducerWinInterval = apps.get_model('Core', 'ProducerWinInterval')
+    wins = (
+        Movie.producer.through.objects.filter(movie__winner=True)
+        .order_by('producer_id', 'movie__year')
+        .values_list('producer_id', 'movie__year')
+    )
+    intervals = []
+    previous = None
+    for producer_id, year in wins:
+        if previous is not None and previous[0] == producer_id:
+            intervals.append(ProducerWinInterval(
+                producer_id=producer_id,
+                interval=year - previous[1],
+                previous_win=previous[1],
+                following_win=year
+            ))
+        previous = (producer_id, year)
+    ProducerWinInterval.objects.bulk_create(intervals, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Core', '0008_importjob'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProducerWinInterval',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('interval', models.PositiveIntegerField(db_index=True)),
+                ('previous_win', models.PositiveIntegerField()),
+                ('following_win', models.PositiveIntegerField()),
+                ('producer', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='win_intervals', to='Core.producer')),
+            ],
+        ),
+        migrations.RunPython(build_producer_win_intervals, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 4.2 on 2026-10-18 10:09
+
+from django.db import migrations, models
+from django.db.models import Count
+import django.db.models.deletion
+
+
+def build_win_counts(apps, schema_editor):
+    Movie = apps.get_model('Core', 'Movie')
+    YearWinnerCount = apps.get_model('Core', 'YearWinnerCount')
+    StudioWinCount = apps.get_model('Core', 'StudioWinCount')
+    YearWinnerCount.objects.bulk_create([
+        YearWinnerCount(year=year, winner_count=count)
+        for year, count in Movie.objects.filter(winner=True)
+        .values('year').annotate(count=Count('id')).values_list('year', 'count')
+    ])
+    StudioWinCount.objects.bulk_create([
+        StudioWinCount(studio_id=studio_id, win_count=wins)
+        for studio_id, wins in Movie.studio.through.objects.filter(movie__winner=True)
+        .values('studio_id').annotate(wins=Count('id')).values_list('studio_id', 'wins')
+    ], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Core', '0009_producerwininterval'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='YearWinnerCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('year', models.PositiveIntegerField(unique=True)),
+                ('winner_count', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='StudioWinCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('win_count', models.PositiveIntegerField(db_index=True, default=0)),
+                ('studio', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='win_count', to='Core.studio')),
+            ],
+        ),
+        migrations.RunPython(build_win_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 4.2 on 2026-10-18 10:10
+
+from django.db import migrations, models
+import uuid
+
+
+def create_catalog_version(apps, schema_editor):
+    DataVersion = apps.get_model('Core', 'DataVersion')
+    DataVersion.objects.get_or_create(key='catalog', defaults={'token': uuid.uuid4().hex})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Core', '0010_yearwinnercount_studiowincount'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DataVersion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=50, unique=True)),
+                ('version', models.PositiveBigIntegerField(default=0)),
+                ('token', models.CharField(max_length=32)),
+            ],
+        ),
+        migrations.RunPython(create_catalog_version, migrations.RunPython.noop),
+    ]
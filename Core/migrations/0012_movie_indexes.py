@@ -0,0 +1,36 @@
+# Generated by Django 4.2 on 2026-10-18 10:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Core', '0011_dataversion'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='studio',
+            name='name',
+            field=models.CharField(db_index=True, max_length=255),
+        ),
+        migrations.AddIndex(
+            model_name='movie',
+            index=models.Index(fields=['winner', 'year'], name='core_movie_winner_year_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='movie',
+            index=models.Index(fields=['year', 'winner'], name='core_movie_year_winner_idx'),
+        ),
+        migrations.RunSQL(
+            'CREATE INDEX "core_movie_producer_producer_movie_idx" '
+            'ON "Core_movie_producer" ("producer_id", "movie_id");',
+            'DROP INDEX "core_movie_producer_producer_movie_idx";',
+        ),
+        migrations.RunSQL(
+            'CREATE INDEX "core_movie_studio_studio_movie_idx" '
+            'ON "Core_movie_studio" ("studio_id", "movie_id");',
+            'DROP INDEX "core_movie_studio_studio_movie_idx";',
+        ),
+    ]
@@ -0,0 +1,125 @@
+# Generated by Django 4.2 on 2026-10-18 10:20
+
+from django.db import migrations, models
+from django.db.models import Count
+import uuid
+
+
+def normalize_name(name):
+    return " ".join(name.split()).casefold()
+
+
+def merge_duplicates(model, through, column):
+    """
+    Fills name_key and merges rows whose keys collide into the oldest one,
+    moving their movie links over without creating duplicate links.
+    """
+    canonical_ids = {}
+    duplicates = {}
+    keyed = []
+    for obj in model.objects.order_by('id').only('id', 'name'):
+        key = normalize_name(obj.name)
+        if key in canonical_ids:
+            duplicates[obj.id] = canonical_ids[key]
+            continue
+        canonical_ids[key] = obj.id
+        obj.name_key = key
+        keyed.append(obj)
+    model.objects.bulk_update(keyed, ['name_key'], batch_size=1000)
+
+    for duplicate_id, canonical_id in duplicates.items():
+        linked_movies = set(
+            through.objects.filter(**{column: canonical_id}).values_list('movie_id', flat=True)
+        )
+        for link in through.objects.filter(**{column: duplicate_id}):
+            if link.movie_id in linked_movies:
+                link.delete()
+            else:
+                setattr(link, column, canonical_id)
+                link.save(update_fields=[column])
+                linked_movies.add(link.movie_id)
+    model.objects.filter(id__in=duplicates).delete()
+    return bool(duplicates)
+
+
+def rebuild_derived_tables(apps):
+    Movie = apps.get_model('Core', 'Movie')
+    ProducerWinInterval = apps.get_model('Core', 'ProducerWinInterval')
+    StudioWinCount = apps.get_model('Core', 'StudioWinCount')
+    DataVersion = apps.get_model('Core', 'DataVersion')
+
+    ProducerWinInterval.objects.all().delete()
+    intervals = []
+    previous = None
+    for producer_id, year in (
+        Movie.producer.through.objects.filter(movie__winner=True)
+        .order_by('producer_id', 'movie__year')
+        .values_list('producer_id', 'movie__year')
+    ):
+        if previous is not None and previous[0] == producer_id:
+            intervals.append(ProducerWinInterval(
+                producer_id=producer_id,
+                interval=year - previous[1],
+                previous_win=previous[1],
+                following_win=year
+            ))
+        previous = (producer_id, year)
+    ProducerWinInterval.objects.bulk_create(intervals, batch_size=1000)
+
+    StudioWinCount.objects.all().delete()
+    StudioWinCount.objects.bulk_create([
+        StudioWinCount(studio_id=studio_id, win_count=wins)
+        for studio_id, wins in Movie.studio.through.objects.filter(movie__winner=True)
+        .values('studio_id').annotate(wins=Count('id')).values_list('studio_id', 'wins')
+    ], batch_size=1000)
+
+    DataVersion.objects.filter(key='catalog').update(
+        version=models.F('version') + 1,
+        token=uuid.uuid4().hex
+    )
+
+
+def fill_name_keys(apps, schema_editor):
+    Movie = apps.get_model('Core', 'Movie')
+    Producer = apps.get_model('Core', 'Producer')
+    Studio = apps.get_model('Core', 'Studio')
+    merged_producers = merge_duplicates(Producer, Movie.producer.through, 'producer_id')
+    merged_studios = merge_duplicates(Studio, Movie.studio.through, 'studio_id')
+    if merged_producers or merged_studios:
+        rebuild_derived_tables(apps)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Core', '0012_movie_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='producer',
+            name='name_key',
+            field=models.CharField(editable=False, max_length=255, null=True),
+        ),
+        migrations.AddField(
+            model_name='studio',
+            name='name_key',
+            field=models.CharField(editable=False, max_length=255, null=True),
+        ),
+        migrations.RunPython(fill_name_keys, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='producer',
+            name='name_key',
+            field=models.CharField(editable=False, max_length=255, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='studio',
+            name='name_key',
+            field=models.CharField(editable=False, max_length=255, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='studio',
+            name='name',
+            field=models.CharField(max_length=255),
+        ),
+    ]
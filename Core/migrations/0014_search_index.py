@@ -0,0 +1,53 @@
+# Generated by Django 4.2 on 2026-10-18 11:02
+
+from django.db import migrations
+
+
+SEARCH_TABLE = 'core_search_index'
+
+
+def create_search_index(apps, schema_editor):
+    """
+    FTS5 index of movie titles, producer names and studio names. The
+    rowid is id * 4 + kind (0 movie, 1 producer, 2 studio).
+    """
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    schema_editor.execute(
+        f"CREATE VIRTUAL TABLE {SEARCH_TABLE} USING fts5("
+        "title, producers, studios, "
+        "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')"
+    )
+    names = (
+        "COALESCE((SELECT group_concat(r.name, ', ') FROM \"Core_movie_{relation}\" t "
+        "JOIN \"Core_{relation}\" r ON r.id = t.{relation}_id WHERE t.movie_id = m.id), '')"
+    )
+    schema_editor.execute(
+        f"INSERT INTO {SEARCH_TABLE} (rowid, title, producers, studios) "
+        f"SELECT m.id * 4, m.title, {names.format(relation='producer')}, {names.format(relation='studio')} "
+        "FROM \"Core_movie\" m"
+    )
+    schema_editor.execute(
+        f"INSERT INTO {SEARCH_TABLE} (rowid, title, producers, studios) "
+        "SELECT id * 4 + 1, '', name, '' FROM \"Core_producer\""
+    )
+    schema_editor.execute(
+        f"INSERT INTO {SEARCH_TABLE} (rowid, title, producers, studios) "
+        "SELECT id * 4 + 2, '', '', name FROM \"Core_studio\""
+    )
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'sqlite':
+        schema_editor.execute(f"DROP TABLE IF EXISTS {SEARCH_TABLE}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Core', '0013_name_keys'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -1,4 +1,6 @@
 from Core.Producers.models import *
 from Core.Movies.models import *
 from Core.Studio.models import *
-from Core.Winners.models import *
\ No newline at end of file
+from Core.Winners.models import *
+from Core.Jobs.models import *
+from Core.DataVersion.models import *
\ No newline at end of file
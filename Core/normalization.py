@@ -0,0 +1,3 @@
+def normalize_name(name):
+    """Lookup key for producer and studio names: casefolded, whitespace collapsed."""
+    return " ".join(name.split()).casefold()
@@ -0,0 +1,223 @@
+"""Paging contract and streamed JSON bodies shared by the list endpoints."""
+import base64
+import json
+
+from django.conf import settings
+from django.core.paginator import Paginator
+
+from Core import renderers
+
+PAGING_PARAMS = ("page", "size", "cursor")
+DEFAULT_MAX_BATCH_IDS = 200
+
+
+def is_paged(params):
+    return any(param in params for param in PAGING_PARAMS)
+
+
+def is_streamed(params):
+    stream = params.get("stream", "").lower()
+    if stream in ("", "false", "0"):
+        return False
+    if stream in ("true", "1"):
+        return True
+    raise ValueError("Invalid value for 'stream'. Expected 'true', 'false'")
+
+
+def is_batch(params):
+    return "ids" in params
+
+
+def get_max_batch_ids():
+    return getattr(settings, "BATCH_MAX_IDS", DEFAULT_MAX_BATCH_IDS)
+
+
+def parse_ids(ids):
+    """Parses "3,1,2" into a list of unique ids, in the caller's order."""
+    try:
+        ids = list(dict.fromkeys(int(object_id) for object_id in ids.split(",")))
+    except (AttributeError, ValueError):
+        raise ValueError("Invalid value for 'ids'. Expected comma-separated integers.")
+    max_ids = get_max_batch_ids()
+    if len(ids) > max_ids:
+        raise ValueError(f"Invalid value for 'ids'. Expected at most {max_ids} ids.")
+    return ids
+
+
+def format_batch(ids, found, content):
+    """
+    The body of an ?ids= lookup: `content` holds the `found` objects
+    (an {id: object} map) in the order of `ids`, and "missing" the ids
+    that were not found.
+    """
+    return {
+        "content": content([found[object_id] for object_id in ids if object_id in found]),
+        "missing": [object_id for object_id in ids if object_id not in found]
+    }
+
+
+def parse_page(page):
+    try:
+        return int(page)
+    except (TypeError, ValueError):
+        raise ValueError("Invalid value for 'page'. Expected an integer.")
+
+
+def parse_page_size(size, max_size):
+    try:
+        size = int(size)
+    except (TypeError, ValueError):
+        raise ValueError("Invalid value for 'size'. Expected an integer.")
+    if size < 1:
+        raise ValueError("Invalid value for 'size'. Expected a positive integer.")
+    return min(size, max_size)
+
+
+def encode_cursor(object_id):
+    payload = json.dumps({"id": object_id}).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor):
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        object_id = json.loads(base64.urlsafe_b64decode(padded))["id"]
+        if not isinstance(object_id, int):
+            raise TypeError(object_id)
+        return object_id
+    except Exception:
+        raise ValueError("Invalid value for 'cursor'.")
+
+
+def split_cursor_page(objects, size):
+    """
+    Takes the `size + 1` objects fetched after a cursor and returns the
+    page and the cursor of the next one (None on the last page).
+    """
+    if len(objects) > size:
+        return objects[:size], encode_cursor(objects[size - 1].id)
+    return objects, None
+
+
+def count_paginator(count, size):
+    """Applies Paginator's page number rules to `count` rows without a queryset."""
+    return Paginator(range(count), size)
+
+
+def format_page(content, paginator, paginated, page, size):
+    return {
+        "content": content,
+        "pageable": {
+            "sort": {
+                "sorted": False,
+                "unsorted": True
+            },
+            "pageSize": size,
+            "pageNumber": page - 1,
+            "offset": (page - 1) * size,
+            "paged": True,
+            "unpaged": False
+        },
+        "totalElements": paginator.count,
+        "last": not paginated.has_next(),
+        "totalPages": paginator.num_pages,
+        "first": paginated.number == 0,
+        "sort": {
+            "sorted": False,
+            "unsorted": True
+        },
+        "number": paginated.number,
+        "numberOfElements": len(content),
+        "size": size
+    }
+
+
+def format_cursor_page(content, cursor, next_cursor, size):
+    return {
+        "content": content,
+        "pageable": {
+            "sort": {
+                "sorted": True,
+                "unsorted": False
+            },
+            "pageSize": size,
+            "cursor": cursor or None,
+            "paged": True,
+            "unpaged": False
+        },
+        "next": next_cursor,
+        "last": next_cursor is None,
+        "first": not cursor,
+        "sort": {
+            "sorted": True,
+            "unsorted": False
+        },
+        "numberOfElements": len(content),
+        "size": size
+    }
+
+
+def json_dumps(item):
+    """Encodes one item the way DRF's JSONRenderer does with the current settings."""
+    return renderers.dumps(item).decode()
+
+
+def stream_json_array(items, chunk_size):
+    """
+    Yields a JSON array of `items` in pieces of up to `chunk_size`
+    elements, so the response never holds more than one chunk in memory.
+    """
+    yield "["
+    separator = ""
+    chunk = []
+    for item in items:
+        chunk.append(json_dumps(item))
+        if len(chunk) == chunk_size:
+            yield separator + ",".join(chunk)
+            separator = ","
+            chunk = []
+    if chunk:
+        yield separator + ",".join(chunk)
+    yield "]"
+
+
+async def astream_json_array(items, chunk_size):
+    """Async counterpart of stream_json_array for async iterables."""
+    yield "["
+    separator = ""
+    chunk = []
+    async for item in items:
+        chunk.append(json_dumps(item))
+        if len(chunk) == chunk_size:
+            yield separator + ",".join(chunk)
+            separator = ","
+            chunk = []
+    if chunk:
+        yield separator + ",".join(chunk)
+    yield "]"
+
+
+def stream_ndjson(items, chunk_size):
+    """Yields one JSON document per line, `chunk_size` lines per piece."""
+    chunk = []
+    for item in items:
+        chunk.append(json_dumps(item))
+        if len(chunk) == chunk_size:
+            yield "\n".join(chunk) + "\n"
+            chunk = []
+    if chunk:
+        yield "\n".join(chunk) + "\n"
+
+
+async def astream_ndjson(items, chunk_size):
+    """Async counterpart of stream_ndjson for async iterables."""
+    chunk = []
+    async for item in items:
+        chunk.append(json_dumps(item))
+        if len(chunk) == chunk_size:
+            yield "\n".join(chunk) + "\n"
+            chunk = []
+    if chunk:
+        yield "\n".join(chunk) + "\n"
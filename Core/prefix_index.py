@@ -0,0 +1,111 @@
+import threading
+import time
+from bisect import bisect_left, insort
+
+from django.conf import settings
+from django.db import transaction
+
+from Core.normalization import normalize_name
+
+
+class PrefixIndex:
+    """
+    Per-process sorted array of normalized names for typeahead lookups.
+
+    The array is loaded lazily from `loader`, an iterable of (id, name)
+    pairs, and kept current by the repository writes of this process,
+    applied once their transaction commits. Writes made by other
+    processes (import workers, other web workers) show up when the index
+    is reloaded, at most SUGGEST_INDEX_TTL seconds after it was built.
+    """
+    DEFAULT_TTL = 300
+    DEFAULT_LIMIT = 10
+    MAX_LIMIT = 50
+
+    def __init__(self, loader):
+        self.loader = loader
+        self.lock = threading.Lock()
+        self.keys = []
+        self.names = {}
+        self.built_at = None
+
+    @staticmethod
+    def get_ttl():
+        return getattr(settings, "SUGGEST_INDEX_TTL", PrefixIndex.DEFAULT_TTL)
+
+    @staticmethod
+    def parse_limit(limit):
+        if limit in (None, ""):
+            return PrefixIndex.DEFAULT_LIMIT
+        try:
+            limit = int(limit)
+        except (TypeError, ValueError):
+            raise ValueError("Invalid value for 'limit'. Expected an integer.")
+        if limit < 1:
+            raise ValueError("Invalid value for 'limit'. Expected a positive integer.")
+        return min(limit, PrefixIndex.MAX_LIMIT)
+
+    def is_stale(self):
+        return self.built_at is None or time.monotonic() - self.built_at >= self.get_ttl()
+
+    def build(self):
+        names = {object_id: (normalize_name(name), name) for object_id, name in self.loader()}
+        self.keys = sorted((key, object_id) for object_id, (key, _) in names.items())
+        self.names = names
+        self.built_at = time.monotonic()
+
+    def invalidate(self):
+        with self.lock:
+            self.keys = []
+            self.names = {}
+            self.built_at = None
+
+    def lookup(self, prefix, limit):
+        """Returns up to `limit` (id, name) pairs whose normalized name starts with `prefix`."""
+        prefix = normalize_name(prefix)
+        with self.lock:
+            if self.is_stale():
+                self.build()
+            matches = []
+            position = bisect_left(self.keys, (prefix,))
+            while len(matches) < limit and position < len(self.keys):
+                key, object_id = self.keys[position]
+                if not key.startswith(prefix):
+                    break
+                matches.append((object_id, self.names[object_id][1]))
+                position += 1
+            return matches
+
+    def put(self, object_id, name):
+        with self.lock:
+            if self.built_at is None:
+                return
+            self.discard_entry(object_id)
+            key = normalize_name(name)
+            insort(self.keys, (key, object_id))
+            self.names[object_id] = (key, name)
+
+    def remove(self, object_id):
+        with self.lock:
+            if self.built_at is not None:
+                self.discard_entry(object_id)
+
+    def discard_entry(self, object_id):
+        previous = self.names.pop(object_id, None)
+        if previous is None:
+            return
+        position = bisect_left(self.keys, (previous[0], object_id))
+        if position < len(self.keys) and self.keys[position] == (previous[0], object_id):
+            del self.keys[position]
+
+    def put_on_commit(self, objects):
+        """Indexes the objects' current names once the running transaction commits."""
+        pairs = [(obj.id, obj.name) for obj in objects]
+        transaction.on_commit(lambda: self.put_all(pairs))
+
+    def put_all(self, pairs):
+        for object_id, name in pairs:
+            self.put(object_id, name)
+
+    def remove_on_commit(self, object_id):
+        transaction.on_commit(lambda: self.remove(object_id))
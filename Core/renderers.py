@@ -0,0 +1,98 @@
+"""JSON rendering for the DRF views, the async views and the streamed bodies."""
+import json
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.settings import api_settings
+from rest_framework.utils import encoders
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# A digit followed by "." or "e" is how every float is written. orjson
+# formats some floats differently from the stdlib (1e16 for 1e+16,
+# 0.00002 for 2e-05), so output that may hold one is encoded again with
+# the stdlib; text that merely looks like a number takes the same path.
+# Mapping digits to "0" and "e"/"E" to "." turns the check into a single
+# substring search, several times faster than a regex over the body.
+FLOAT_MARKS = bytes.maketrans(b"123456789eE", b"000000000..")
+LINE_SEPARATOR = "\u2028".encode()
+PARAGRAPH_SEPARATOR = "\u2029".encode()
+ENCODER = encoders.JSONEncoder()
+
+
+def is_default_format():
+    """True when DRF's JSON settings are the defaults orjson can reproduce."""
+    return api_settings.UNICODE_JSON and api_settings.COMPACT_JSON and api_settings.STRICT_JSON
+
+
+def stdlib_dumps(data):
+    """Encodes `data` the way DRF's JSONRenderer does with the current settings."""
+    encoded = json.dumps(
+        data,
+        cls=encoders.JSONEncoder,
+        ensure_ascii=not api_settings.UNICODE_JSON,
+        allow_nan=not api_settings.STRICT_JSON,
+        separators=(",", ":") if api_settings.COMPACT_JSON else (", ", ": ")
+    )
+    return encoded.replace("\u2028", "\\u2028").replace("\u2029", "\\u2029").encode()
+
+
+def orjson_dumps(data):
+    """
+    Encodes `data` with orjson into the bytes stdlib_dumps would produce,
+    or returns None when orjson cannot guarantee that: non-string keys,
+    integers beyond 64 bits, types it does not know and floats. Dates,
+    times and everything else DRF's encoder handles go through the same
+    JSONEncoder.default. Non-finite floats are the one difference: DRF
+    refuses to encode them, orjson writes null.
+    """
+    try:
+        encoded = orjson.dumps(
+            data,
+            default=ENCODER.default,
+            option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+        )
+    except orjson.JSONEncodeError:
+        return None
+    if b"0." in encoded.translate(FLOAT_MARKS):
+        return None
+    # DRF escapes these two so the output is also valid JavaScript; both
+    # start with the byte 0xE2, which most bodies never contain.
+    if b"\xe2" in encoded:
+        encoded = encoded.replace(LINE_SEPARATOR, b"\\u2028").replace(PARAGRAPH_SEPARATOR, b"\\u2029")
+    return encoded
+
+
+def dumps(data):
+    """DRF-compatible JSON bytes, through orjson when it is installed and can match them."""
+    if orjson is not None and is_default_format():
+        encoded = orjson_dumps(data)
+        if encoded is not None:
+            return encoded
+    return stdlib_dumps(data)
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    Drop-in JSONRenderer that encodes with orjson when it is installed,
+    with byte-for-byte the same output. Indented output (?indent= in the
+    Accept header, the browsable API) and non-default JSON settings use
+    the stdlib encoder, as does any body orjson cannot reproduce exactly.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if (
+            orjson is None
+            or self.ensure_ascii or not self.compact or not self.strict
+            or self.encoder_class is not encoders.JSONEncoder
+            or self.get_indent(accepted_media_type, renderer_context or {}) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+        encoded = orjson_dumps(data)
+        if encoded is None:
+            return super().render(data, accepted_media_type, renderer_context)
+        return encoded
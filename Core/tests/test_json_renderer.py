@@ -0,0 +1,84 @@
+import datetime
+import decimal
+import uuid
+
+import pytest
+from django.contrib.auth.models import User
+from django.urls import reverse
+from django.utils.translation import gettext_lazy
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from Core import renderers
+from Core.Movies.service import MovieService
+from Core.renderers import FastJSONRenderer
+
+PAYLOADS = [
+    {"title": "Ação, été     \U0001F3AC \x00\x1f\x7f \"quoted\" \\ </script>", "year": 1980},
+    [{"id": 2 ** 63 - 1, "negative": -(2 ** 63), "winner": True, "studio": None}, [], {}],
+    {"huge": 2 ** 70},
+    {"floats": [0.1, 1e16, 2.2634418691931e-05, 1.0, -0.0, 123456789.123]},
+    {"title": "Rocky 2.0", "year": 1e3},
+    {1: "int key", "nested": {2: [3]}},
+    {"decimal": decimal.Decimal("12.50"), "uuid": uuid.UUID("12345678-1234-5678-1234-567812345678")},
+    {
+        "utc": datetime.datetime(2024, 1, 2, 3, 4, 5, 123456, tzinfo=datetime.timezone.utc),
+        "naive": datetime.datetime(2024, 1, 2, 3, 4, 5),
+        "date": datetime.date(2024, 1, 2),
+        "time": datetime.time(3, 4, 5, 6),
+        "delta": datetime.timedelta(minutes=90),
+    },
+    {"lazy": gettext_lazy("Movie"), "tuple": (1, "a"), "set": {"a"}},
+    "plain string",
+    7,
+]
+
+
+@pytest.mark.parametrize("payload", PAYLOADS)
+def test_fast_renderer_matches_drf_byte_for_byte(payload):
+    assert FastJSONRenderer().render(payload) == JSONRenderer().render(payload)
+    assert FastJSONRenderer().render(None) == JSONRenderer().render(None) == b""
+
+
+def test_fast_renderer_keeps_indentation_and_errors():
+    payload = {"a": [1, {"b": "c"}]}
+    assert (
+        FastJSONRenderer().render(payload, "application/json; indent=4")
+        == JSONRenderer().render(payload, "application/json; indent=4")
+    )
+    with pytest.raises(TypeError):
+        FastJSONRenderer().render({"object": object()})
+
+
+def test_fast_renderer_without_orjson(monkeypatch):
+    monkeypatch.setattr(renderers, "orjson", None)
+    for payload in PAYLOADS[:4]:
+        assert FastJSONRenderer().render(payload) == JSONRenderer().render(payload)
+        assert renderers.dumps(payload) == JSONRenderer().render(payload)
+
+
+def test_orjson_encodes_plain_movie_payloads():
+    pytest.importorskip("orjson")
+    payload = [{"id": 1, "title": "Ação  ", "year": 1980, "winner": True, "producer_name": ["Alice"]}]
+    assert renderers.orjson_dumps(payload) == JSONRenderer().render(payload)
+    assert renderers.orjson_dumps({"score": 0.5}) is None
+
+
+@pytest.mark.django_db
+def test_views_render_like_the_default_renderer(settings):
+    MovieService.create_movie("Ação   1.5", 1980, ["Zoë"], ["Estúdio"], True)
+    MovieService.create_movie("B", 1981, ["Bob"], ["S"], False)
+    client = APIClient()
+    client.force_authenticate(user=User.objects.create(username="renderer"))
+    urls = [
+        (reverse("movie-list"), {"size": 10}),
+        (reverse("year-with-winner"), {"winner": "true"}),
+        (reverse("producer-list"), {}),
+    ]
+    fast = [client.get(url, params).content for url, params in urls]
+
+    settings.REST_FRAMEWORK = {
+        **settings.REST_FRAMEWORK,
+        "DEFAULT_RENDERER_CLASSES": ["rest_framework.renderers.JSONRenderer"],
+    }
+    assert [client.get(url, params).content for url, params in urls] == fast
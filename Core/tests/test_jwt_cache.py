@@ -0,0 +1,121 @@
+import hashlib
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth.models import User
+from django.urls import reverse
+from rest_framework.test import APIClient, APIRequestFactory
+from rest_framework_simplejwt import tokens
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.utils import aware_utcnow
+
+from Core import authentication
+from Core.authentication import CachedJWTAuthentication
+
+
+@pytest.fixture(autouse=True)
+def empty_caches():
+    authentication.VALIDATED_TOKENS.clear()
+    authentication.AUTHENTICATED_USERS.clear()
+
+
+@pytest.fixture
+def user():
+    return User.objects.create_user(username="dashboard", password="first-password")
+
+
+def token_for(user):
+    return str(RefreshToken.for_user(user).access_token)
+
+
+def authenticate(token):
+    request = APIRequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {token}")
+    return CachedJWTAuthentication().authenticate(request)
+
+
+@pytest.mark.django_db
+def test_repeated_token_costs_no_query(user, django_assert_num_queries):
+    token = token_for(user)
+    with django_assert_num_queries(1):
+        first_user, first_token = authenticate(token)
+    with django_assert_num_queries(0):
+        cached_user, cached_token = authenticate(token)
+    assert cached_user is first_user and cached_user.pk == user.pk
+    assert cached_token is first_token
+
+    # A new token for the same user still reuses the cached user.
+    with django_assert_num_queries(0):
+        assert authenticate(token_for(user))[0] is first_user
+
+    # Logging in only updates last_login and keeps the cache.
+    user.last_login = user.date_joined
+    user.save(update_fields=["last_login"])
+    with django_assert_num_queries(0):
+        authenticate(token)
+
+
+@pytest.mark.django_db
+def test_deactivation_and_password_change_invalidate(user, monkeypatch, django_assert_num_queries):
+    token = token_for(user)
+    authenticate(token)
+    user.set_password("second-password")
+    user.save()
+    with django_assert_num_queries(1):
+        authenticate(token)
+
+    user.is_active = False
+    user.save()
+    with pytest.raises(AuthenticationFailed):
+        authenticate(token)
+
+    # SIMPLE_JWT overrides replace api_settings, which the imported modules would not see.
+    monkeypatch.setattr(api_settings, "CHECK_REVOKE_TOKEN", True)
+    user.is_active = True
+    user.save()
+    token = token_for(user)
+    authenticate(token)
+    user.set_password("third-password")
+    user.save()
+    with pytest.raises(AuthenticationFailed):
+        authenticate(token)
+
+
+@pytest.mark.django_db
+def test_cached_tokens_still_expire(user, monkeypatch):
+    token = token_for(user)
+    authenticate(token)
+    later = aware_utcnow() + api_settings.ACCESS_TOKEN_LIFETIME + timedelta(minutes=1)
+    monkeypatch.setattr(authentication, "aware_utcnow", lambda: later)
+    monkeypatch.setattr(tokens, "aware_utcnow", lambda: later)
+    with pytest.raises(InvalidToken):
+        authenticate(token)
+    with pytest.raises(InvalidToken):
+        authenticate(token[:-2] + "xx")
+
+
+@pytest.mark.django_db
+def test_cache_is_bounded_and_can_be_disabled(user, settings, django_assert_num_queries):
+    settings.JWT_AUTH_CACHE_SIZE = 2
+    tokens = [token_for(user) for _ in range(3)]
+    for token in tokens:
+        authenticate(token)
+    assert len(authentication.VALIDATED_TOKENS.entries) == 2
+    assert authentication.VALIDATED_TOKENS.get(hashlib.sha256(tokens[0].encode()).digest()) is None
+
+    settings.JWT_AUTH_CACHE_TTL = 0
+    for _ in range(2):
+        with django_assert_num_queries(1):
+            authenticate(tokens[0])
+
+
+@pytest.mark.django_db
+def test_views_use_the_cached_authentication(user):
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {token_for(user)}")
+    assert client.get(reverse("producer-list")).status_code == 200
+    assert client.get(reverse("producer-list")).status_code == 200
+    user.is_active = False
+    user.save()
+    assert client.get(reverse("producer-list")).status_code == 401
@@ -1,20 +1,29 @@
 from django.urls import path
 
-from Core.Movies.view import ImportMovieCSVView, MoviesView, ProducersWithWinnerView, StudiosWithWinnersView, YearWithWinnerView, YearsWithMultipleWinnersView
-from Core.Producers.view import ProducerView
-from Core.Studio.view import StudioView
+from Core.Jobs.view import ImportJobView
+from Core.Movies.view import ImportMovieCSVView, MovieBulkExportView, MovieBulkView, MovieExportView, MoviesView, ProducersWithWinnerView, StudiosWithWinnersView, YearWithWinnerView, YearsWithMultipleWinnersView
+from Core.Producers.view import ProducerSuggestView, ProducerView
+from Core.Search.view import SearchView
+from Core.Studio.view import StudioSuggestView, StudioView
 
 
 urlpatterns = [
     path('producers/', ProducerView.as_view(), name='producer-list'),
     path('producers/<int:producer_id>/', ProducerView.as_view(), name='producer-detail'),
+    path('producers/suggest/', ProducerSuggestView.as_view(), name='producer-suggest'),
     path('studios/', StudioView.as_view(), name='studio-list'),
     path('studios/<int:studio_id>/', StudioView.as_view(), name='studio-detail'),
+    path('studios/suggest/', StudioSuggestView.as_view(), name='studio-suggest'),
     path('movies/', MoviesView.as_view(), name='movie-list'),
     path('movies/<int:movie_id>/', MoviesView.as_view(), name='movie-detail'),
+    path('movies/bulk/', MovieBulkView.as_view(), name='movie-bulk'),
+    path('movies/export/', MovieExportView.as_view(), name='movie-export'),
+    path('movies/export/<str:export_format>/', MovieBulkExportView.as_view(), name='movie-bulk-export'),
     path('movies/import/csv/', ImportMovieCSVView.as_view(), name='winner-import-csv'),
     path('movies/years/multiple-winners/', YearsWithMultipleWinnersView.as_view(), name='years-multiple-winners'),
     path('movies/studios-winners/', StudiosWithWinnersView.as_view(), name='studios-with-winners'),
     path('movies/producers-winners/', ProducersWithWinnerView.as_view(), name='producers-with-winner'),
     path('movies/year-with-winners/', YearWithWinnerView.as_view(), name='year-with-winner'),
+    path('jobs/<int:job_id>/', ImportJobView.as_view(), name='import-job-detail'),
+    path('search/', SearchView.as_view(), name='search'),
 ]
@@ -0,0 +1,99 @@
+import random
+
+from Core.DataVersion.repository import DataVersionRepository
+from Core.Movies.models import Movie
+from Core.Movies.repository import YearWinnerCountRepository
+from Core.normalization import normalize_name
+from Core.Producers.models import Producer
+from Core.Producers.repository import ProducerWinIntervalRepository
+from Core.Search.repository import SearchRepository
+from Core.Studio.models import Studio
+from Core.Studio.repository import StudioWinCountRepository
+
+CHUNK_SIZE = 10000
+FIRST_YEAR = 1980
+YEAR_SPAN = 45
+WINNER_RATIO = 0.2
+
+
+def skewed_index(rng, count, skew=2.5):
+    """Picks an index in [0, count) where low indices are far more popular."""
+    return min(count - 1, int(count * (rng.random() ** skew)))
+
+
+def build_catalog(size, seed=2024):
+    """
+    Fills the database with `size` movies with a realistic fan-out.
+
+    Roughly one producer per four movies and one studio per two hundred,
+    picked with a skewed distribution so a few producers and studios
+    appear on many movies. Movies get one to three producers and one or
+    two studios, and about a fifth of them are winners. The derived
+    tables are rebuilt at the end, as after a real import.
+    """
+    rng = random.Random(seed)
+    Movie.objects.all().delete()
+    Producer.objects.all().delete()
+    Studio.objects.all().delete()
+
+    producer_count = max(10, size // 4)
+    studio_count = max(10, min(2000, size // 200))
+    for start in range(0, producer_count, CHUNK_SIZE):
+        Producer.objects.bulk_create([
+            Producer(name=f"Producer {i:07d}", name_key=normalize_name(f"Producer {i:07d}"))
+            for i in range(start, min(start + CHUNK_SIZE, producer_count))
+        ])
+    Studio.objects.bulk_create([
+        Studio(name=f"Studio {i:05d}", name_key=normalize_name(f"Studio {i:05d}"))
+        for i in range(studio_count)
+    ])
+    producer_ids = list(Producer.objects.order_by('id').values_list('id', flat=True))
+    studio_ids = list(Studio.objects.order_by('id').values_list('id', flat=True))
+
+    MovieProducer = Movie.producer.through
+    MovieStudio = Movie.studio.through
+    for start in range(0, size, CHUNK_SIZE):
+        movies = Movie.objects.bulk_create([
+            Movie(
+                title=f"Movie {i:07d}",
+                year=FIRST_YEAR + rng.randrange(YEAR_SPAN),
+                winner=rng.random() < WINNER_RATIO
+            )
+            for i in range(start, min(start + CHUNK_SIZE, size))
+        ])
+        producer_links = []
+        studio_links = []
+        for movie in movies:
+            picked = {
+                producer_ids[skewed_index(rng, len(producer_ids))]
+                for _ in range(rng.choices((1, 2, 3), weights=(60, 30, 10))[0])
+            }
+            producer_links.extend(MovieProducer(movie_id=movie.pk, producer_id=pk) for pk in picked)
+            picked = {
+                studio_ids[skewed_index(rng, len(studio_ids))]
+                for _ in range(rng.choices((1, 2), weights=(80, 20))[0])
+            }
+            studio_links.extend(MovieStudio(movie_id=movie.pk, studio_id=pk) for pk in picked)
+        MovieProducer.objects.bulk_create(producer_links)
+        MovieStudio.objects.bulk_create(studio_links)
+
+    ProducerWinIntervalRepository.rebuild_all()
+    YearWinnerCountRepository.rebuild_all()
+    StudioWinCountRepository.rebuild_all()
+    if SearchRepository.is_available():
+        SearchRepository.rebuild_all()
+    DataVersionRepository.bump()
+
+
+def build_import_csv(rows, offset, seed=2024):
+    """Returns CSV bytes in the importer's format with `rows` new titles."""
+    rng = random.Random(seed + offset)
+    lines = ["year;title;studios;producers;winner"]
+    for i in range(offset, offset + rows):
+        lines.append(
+            f"{FIRST_YEAR + rng.randrange(YEAR_SPAN)};Imported {i:07d};"
+            f"Studio {rng.randrange(50):05d};"
+            f"Producer {rng.randrange(5000):07d}, Producer {rng.randrange(5000):07d};"
+            f"{'yes' if rng.random() < WINNER_RATIO else ''}"
+        )
+    return ("\n".join(lines) + "\n").encode("utf-8")
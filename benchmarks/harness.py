@@ -0,0 +1,106 @@
+import json
+import os
+import statistics
+import time
+import tracemalloc
+
+from django.db import connection
+
+
+def env_int(name, default):
+    return int(os.environ.get(name, default))
+
+
+def env_float(name, default):
+    return float(os.environ.get(name, default))
+
+
+class QueryCounter:
+    """
+    Counts executed queries through an execute wrapper; unlike
+    CaptureQueriesContext it survives the query log reset done by the
+    test client on every request.
+    """
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+def measure(action, setup=None, repeat=5):
+    """
+    Runs `action` once to warm up, `repeat` times for latency, and once
+    more under tracemalloc for peak memory. `setup` runs untimed before
+    every call. Returns the median/p95 latency in milliseconds, the
+    query count of the last timed call and the peak memory in KiB.
+    """
+    if setup:
+        setup()
+    action()
+
+    timings = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        queries = QueryCounter()
+        with connection.execute_wrapper(queries):
+            started = time.perf_counter()
+            action()
+            timings.append((time.perf_counter() - started) * 1000)
+
+    if setup:
+        setup()
+    tracemalloc.start()
+    try:
+        action()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    timings.sort()
+    return {
+        "latency_ms": round(statistics.median(timings), 3),
+        "p95_ms": round(timings[min(len(timings) - 1, int(len(timings) * 0.95))], 3),
+        "queries": queries.count,
+        "peak_kib": round(peak / 1024, 1),
+    }
+
+
+def load_json(path):
+    if not os.path.exists(path):
+        return {}
+    with open(path) as file:
+        return json.load(file)
+
+
+def write_json(path, data):
+    with open(path, "w") as file:
+        json.dump(data, file, indent=2, sort_keys=True)
+        file.write("\n")
+
+
+def find_regressions(results, baseline, margin):
+    """
+    Compares results with the baseline. Latency and memory may grow by
+    `margin` (a fraction); the query count may not grow at all. A result
+    without a baseline entry is reported too, so a missing or stale
+    baseline fails instead of passing unchecked.
+    """
+    regressions = []
+    for key, result in sorted(results.items()):
+        expected = baseline.get(key)
+        if not expected:
+            regressions.append(f"{key}: no baseline entry; run with BENCHMARK_UPDATE_BASELINE=1 to record one")
+            continue
+        if result["queries"] > expected["queries"]:
+            regressions.append(f"{key}: {result['queries']} queries, baseline {expected['queries']}")
+        for metric in ("latency_ms", "peak_kib"):
+            limit = expected[metric] * (1 + margin)
+            if result[metric] > limit:
+                regressions.append(
+                    f"{key}: {metric} {result[metric]} exceeds baseline {expected[metric]} by more than {margin:.0%}"
+                )
+    return regressions
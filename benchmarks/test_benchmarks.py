@@ -0,0 +1,180 @@
+"""
+Scale benchmarks for the Core endpoints.
+
+Skipped unless RUN_BENCHMARKS=1. Configuration through the environment:
+
+- BENCHMARK_SIZES: comma-separated catalog sizes (default "1000,100000,1000000")
+- BENCHMARK_REPEAT: timed runs per scenario (default 5)
+- BENCHMARK_IMPORT_ROWS: rows per CSV import run (default 1000)
+- BENCHMARK_OUTPUT: results file (default benchmark_results.json)
+- BENCHMARK_BASELINE: baseline file (default benchmarks/baseline.json)
+- BENCHMARK_MARGIN: allowed latency/memory growth over the baseline (default 0.25)
+- BENCHMARK_UPDATE_BASELINE=1: store this run as the new baseline
+
+Without a baseline entry for every scenario and size the run fails;
+record one first with BENCHMARK_UPDATE_BASELINE=1 on the machine that
+runs the comparison.
+"""
+import io
+import itertools
+import os
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from benchmarks.dataset import build_catalog, build_import_csv
+from benchmarks.harness import env_float, env_int, find_regressions, load_json, measure, write_json
+from Core.Movies.models import Movie
+from Core.Movies.service import ImportMovieCSVService, MovieService
+from Core.Producers.models import Producer
+from Core.renderers import FastJSONRenderer
+from Core.Studio.models import Studio
+
+pytestmark = pytest.mark.skipif(
+    os.environ.get("RUN_BENCHMARKS") != "1", reason="set RUN_BENCHMARKS=1 to run the benchmarks"
+)
+
+SIZES = [int(size) for size in os.environ.get("BENCHMARK_SIZES", "1000,100000,1000000").split(",")]
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+OUTPUT_PATH = os.environ.get("BENCHMARK_OUTPUT", "benchmark_results.json")
+BASELINE_PATH = os.environ.get("BENCHMARK_BASELINE", os.path.join(BASE_DIR, "baseline.json"))
+
+
+def get_ok(client, url, params=None):
+    response = client.get(url, params or {})
+    assert response.status_code == 200, (url, response.status_code)
+    return response
+
+
+def get_streamed(client, url, params=None):
+    response = get_ok(client, url, params)
+    return sum(len(part) for part in response.streaming_content)
+
+
+def crud_scenario(client, list_name, detail_name, id_kwarg):
+    counter = itertools.count()
+
+    def run():
+        name = f"Benchmark {list_name} {next(counter)}"
+        created = client.post(reverse(list_name), {"name": name}, format="json")
+        assert created.status_code == 201
+        url = reverse(detail_name, kwargs={id_kwarg: created.data["id"]})
+        get_ok(client, url)
+        assert client.put(url, {"name": f"{name} updated"}, format="json").status_code == 200
+        assert client.delete(url).status_code == 204
+    return run
+
+
+def import_scenario(rows):
+    counter = itertools.count()
+
+    def run():
+        file = io.BytesIO(build_import_csv(rows, next(counter) * rows))
+        file.name = "benchmark.csv"
+        result = ImportMovieCSVService.process_file(file, stream=True)
+        assert not result["errors"]
+    return run
+
+
+def build_scenarios(client):
+    middle_page = max(1, Movie.objects.count() // 20)
+    detail_id = Movie.objects.order_by("id").values_list("id", flat=True)[Movie.objects.count() // 2]
+    detail_title = Movie.objects.get(id=detail_id).title
+    winner_year = Movie.objects.filter(winner=True).values_list("year", flat=True).first()
+    analytics = {
+        "years-multiple-winners": MovieService.get_years_with_multiple_winners,
+        "studios-with-winners": MovieService.get_studios_with_winners,
+        "producers-with-winner": MovieService.get_producers_with_winner_intervals,
+    }
+    scenarios = {
+        "service.get_all_movies.first_page": (
+            lambda: MovieService.get_all_movies({"page": "1", "size": "10"}), None),
+        "service.get_all_movies.deep_page": (
+            lambda: MovieService.get_all_movies({"page": str(middle_page), "size": "10"}), None),
+        "service.get_movies_with_winner": (
+            lambda: MovieService.get_movies_with_winner({"winner": "true", "year": str(winner_year)}), None),
+        "view.movie-list.first_page": (
+            lambda: get_ok(client, reverse("movie-list"), {"size": 10}), None),
+        "view.movie-list.deep_page": (
+            lambda: get_ok(client, reverse("movie-list"), {"size": 10, "page": middle_page}), None),
+        "view.movie-list.cursor": (
+            lambda: get_ok(client, reverse("movie-list"), {"size": 10, "cursor": ""}), None),
+        "view.movie-export": (
+            lambda: get_streamed(client, reverse("movie-export")), None),
+        "view.search.exact": (
+            lambda: get_ok(client, reverse("search"), {"q": detail_title}), None),
+        "view.search.prefix": (
+            lambda: get_ok(client, reverse("search"), {"q": "produc"}), None),
+        "view.movie-detail": (
+            lambda: get_ok(client, reverse("movie-detail", kwargs={"movie_id": detail_id})), None),
+        "view.year-with-winner": (
+            lambda: get_ok(client, reverse("year-with-winner"), {"winner": "true", "year": winner_year}),
+            cache.clear),
+        "service.import_csv": (import_scenario(env_int("BENCHMARK_IMPORT_ROWS", 1000)), None),
+        "view.producer-list.all": (
+            lambda: get_ok(client, reverse("producer-list")), None),
+        "view.producer-list.page": (
+            lambda: get_ok(client, reverse("producer-list"), {"size": 100, "page": 2}), None),
+        "view.producer-list.stream": (
+            lambda: get_streamed(client, reverse("producer-list"), {"stream": "true"}), None),
+        "view.producer.crud": (crud_scenario(client, "producer-list", "producer-detail", "producer_id"), None),
+        "view.studio.crud": (crud_scenario(client, "studio-list", "studio-detail", "studio_id"), None),
+    }
+    # Encoding cost alone, on the largest page and on an unpaged winners list.
+    render_payloads = {
+        "movie-page": MovieService.get_all_movies({"size": str(MovieService.get_max_page_size())}),
+        "winners": {"movies": MovieService.serialize(Movie.objects.filter(winner=True).order_by("id")[:5000])},
+    }
+    for payload_name, payload in render_payloads.items():
+        for renderer_name, renderer in (("drf", JSONRenderer()), ("fast", FastJSONRenderer())):
+            scenarios[f"render.{payload_name}.{renderer_name}"] = (
+                lambda renderer=renderer, payload=payload: renderer.render(payload), None)
+    for url_name, service_method in analytics.items():
+        scenarios[f"service.{url_name}"] = (service_method, None)
+        scenarios[f"view.{url_name}.uncached"] = (
+            lambda url_name=url_name: get_ok(client, reverse(url_name)), cache.clear)
+        scenarios[f"view.{url_name}.cached"] = (
+            lambda url_name=url_name: get_ok(client, reverse(url_name)), None)
+    return scenarios
+
+
+@pytest.fixture(scope="module")
+def results():
+    collected = {}
+    yield collected
+    existing = load_json(OUTPUT_PATH)
+    existing.update(collected)
+    write_json(OUTPUT_PATH, existing)
+    if os.environ.get("BENCHMARK_UPDATE_BASELINE") == "1":
+        baseline = load_json(BASELINE_PATH)
+        baseline.update(collected)
+        write_json(BASELINE_PATH, baseline)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("size", SIZES)
+def test_benchmark_catalog(size, results):
+    build_catalog(size)
+    client = APIClient()
+    client.force_authenticate(user=User.objects.create(username="benchmark"))
+
+    run_results = {}
+    for name, (action, setup) in build_scenarios(client).items():
+        run_results[f"{size}/{name}"] = measure(action, setup, repeat=env_int("BENCHMARK_REPEAT", 5))
+    results.update(run_results)
+
+    assert Producer.objects.exists() and Studio.objects.exists()
+    if os.environ.get("BENCHMARK_UPDATE_BASELINE") == "1":
+        return
+    baseline = load_json(BASELINE_PATH)
+    if not baseline:
+        pytest.fail(
+            f"No benchmark baseline at {BASELINE_PATH}; "
+            "run once with BENCHMARK_UPDATE_BASELINE=1 to record one"
+        )
+    regressions = find_regressions(run_results, baseline, env_float("BENCHMARK_MARGIN", 0.25))
+    assert not regressions, "Benchmark regressions:\n" + "\n".join(regressions)
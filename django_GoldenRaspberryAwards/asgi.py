@@ -2,6 +2,8 @@
 ASGI config for django_GoldenRaspberryAwards project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+Requests are resolved through ``ASGI_URLCONF``, whose Core read endpoints
+are async views, so slow queries do not hold a thread per request.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/4.2/howto/deployment/asgi/
@@ -9,8 +11,11 @@ https://docs.djangoproject.com/en/4.2/howto/deployment/asgi/
 
 import os
 
-from django.core.asgi import get_asgi_application
+import django
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'django_GoldenRaspberryAwards.settings')
+django.setup(set_prefix=False)
 
-application = get_asgi_application()
+from Core.async_api import AsyncReadASGIHandler  # noqa: E402
+
+application = AsyncReadASGIHandler()
@@ -0,0 +1,14 @@
+"""
+URL configuration used by the ASGI entry point.
+
+Identical to ROOT_URLCONF except that the Core read endpoints are served
+by async views.
+"""
+from django.urls import include, path
+
+from django_GoldenRaspberryAwards.urls import urlpatterns as wsgi_urlpatterns
+
+
+urlpatterns = [
+    path('core/', include('Core.async_urls')),
+] + wsgi_urlpatterns
@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/4.2/ref/settings/
 """
 
+import os
 from datetime import timedelta
 from pathlib import Path
 
@@ -48,6 +49,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'Core.Instrumentation.middleware.MetricsMiddleware',
+    'Core.Instrumentation.middleware.RequestTimingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -77,16 +80,56 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = 'django_GoldenRaspberryAwards.wsgi.application'
+ASGI_APPLICATION = 'django_GoldenRaspberryAwards.asgi.application'
+ASGI_URLCONF = 'django_GoldenRaspberryAwards.asgi_urls'
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'Core.authentication.CachedJWTAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
+    'DEFAULT_RENDERER_CLASSES': [
+        'Core.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
 }
 
+MOVIES_MAX_PAGE_SIZE = 100
+PRODUCERS_MAX_PAGE_SIZE = 100
+STUDIOS_MAX_PAGE_SIZE = 100
+LIST_STREAM_CHUNK_SIZE = 2000
+BATCH_MAX_IDS = 200
+MOVIES_EXPORT_CHUNK_SIZE = 2000
+MOVIES_IMPORT_BATCH_SIZE = 1000
+MOVIES_BULK_MAX_OPERATIONS = 1000
+
+ANALYTICS_CACHE_TIMEOUT = 600
+
+SEARCH_MAX_LIMIT = 100
+SEARCH_CANDIDATE_LIMIT = 5000
+
+SUGGEST_INDEX_TTL = 300
+
+JWT_AUTH_CACHE_SIZE = 10000
+JWT_AUTH_CACHE_TTL = 60
+
+REQUEST_TIMING_ENABLED = DEBUG
+REQUEST_TIMING_QUERY_COUNT_HEADER = True
+
+METRICS_ENABLED = True
+# Processes that serve requests or run import jobs set METRICS_DIR to a
+# directory they share; tests and one-off commands keep metrics in memory.
+METRICS_DIR = os.environ.get('METRICS_DIR') or None
+METRICS_FLUSH_INTERVAL = 1.0
+
+IMPORT_JOBS_DIR = BASE_DIR / 'import_jobs'
+IMPORT_JOBS_RUN_IN_PROCESS = False
+IMPORT_JOBS_WORKERS = 1
+IMPORT_JOB_MAX_STORED_ERRORS = 1000
+IMPORT_JOB_TIMEOUT = 3600
+
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(minutes=500),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=1),
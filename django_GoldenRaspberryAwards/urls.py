@@ -20,6 +20,8 @@ from rest_framework import permissions
 from drf_yasg.views import get_schema_view
 from drf_yasg import openapi
 
+from Core.Instrumentation.view import MetricsView
+
 
 schema_view = get_schema_view(
    openapi.Info(
@@ -44,5 +46,6 @@ urlpatterns = [
     path('admin/', admin.site.urls),
     path('auth/', include('Auth.urls')),
     path('core/', include('Core.urls')),
+    path('metrics', MetricsView.as_view(), name='metrics'),
     
 ]